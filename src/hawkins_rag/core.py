@@ -80,12 +80,6 @@ class HawkinsRAG:
                 logger.error(f"Invalid loader type: {str(e)}")
                 return False
 
-            try:
-                content = loader.load(source)
-            except Exception as e:
-                logger.error(f"Loader failed: {str(e)}")
-                return False
-
             # Create document metadata
             doc_name = Path(source).name if Path(source).exists() else source
             doc_metadata = {
@@ -97,13 +91,33 @@ class HawkinsRAG:
                 }
             }
 
-            # Store document and chunks with error handling
+            # Store chunks unit by unit so streaming loaders never
+            # materialize the whole source
+            try:
+                units = loader.lazy_load(source)
+                first_unit = next(units, None)
+            except Exception as e:
+                logger.error(f"Loader failed: {str(e)}")
+                return False
+
             try:
                 self.db.add_entity(doc_metadata)
-                chunks = chunk_text(content, doc_name, self.chunk_size)
-                for chunk in chunks:
-                    self.db.add_entity(chunk)
-                logger.info(f"Successfully stored document and {len(chunks)} chunks")
+                chunk_count = 0
+                unit_count = 0
+                unit = first_unit
+                while unit is not None:
+                    # Units with a stable name (e.g. a table row) keep it across syncs
+                    if isinstance(unit, dict) and unit.get("name"):
+                        unit_name = unit["name"]
+                    else:
+                        unit_name = doc_name if unit_count == 0 else f"{doc_name}_{unit_count}"
+                    chunks = chunk_text(unit, unit_name, self.chunk_size)
+                    for chunk in chunks:
+                        self.db.add_entity(chunk)
+                    chunk_count += len(chunks)
+                    unit_count += 1
+                    unit = next(units, None)
+                logger.info(f"Successfully stored document and {chunk_count} chunks from {unit_count} units")
                 return True
             except Exception as e:
                 logger.error(f"Failed to store document or chunks: {str(e)}")
@@ -147,7 +161,10 @@ class HawkinsRAG:
         """Detect the type of source based on file extension or URL."""
         try:
             # Check for YouTube URLs first
-            if any(x in source.lower() for x in ['youtube.com/watch', 'youtu.be/']):
+            if any(x in source.lower() for x in [
+                'youtube.com/watch', 'youtu.be/', 'youtube.com/playlist',
+                'youtube.com/@', 'youtube.com/channel/', 'youtube.com/c/', 'youtube.com/user/'
+            ]):
                 return 'youtube'
 
             # Then check for general web URLs
@@ -162,6 +179,8 @@ class HawkinsRAG:
                 'txt': 'text',
                 'md': 'text',
                 'json': 'json',
+                'jsonl': 'json',
+                'ndjson': 'json',
                 'csv': 'csv',
                 'xlsx': 'excel',
                 'yaml': 'openapi',
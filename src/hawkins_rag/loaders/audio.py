@@ -1,26 +1,61 @@
 import os
+import json
+import shutil
 import hashlib
-from typing import Any, Dict, Optional
+import tempfile
+import subprocess
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 from ..utils.base import BaseLoader
 import logging
 
 logger = logging.getLogger(__name__)
 
-class AudioLoader(BaseLoader):
-    """Loader for audio files using Deepgram."""
+AUDIO_EXTENSIONS = ('.mp3', '.wav', '.m4a', '.flac', '.ogg', '.opus', '.aac', '.webm', '.mp4')
+# Bytes read per step while hashing audio files
+HASH_BLOCK_SIZE = 1024 * 1024
+SEGMENT_KINDS = ("utterances", "paragraphs")
 
-    def __init__(self, config: Optional[Dict[str, Any]] = None):
-        """Initialize the audio loader with Deepgram credentials."""
-        super().__init__(config)
-        self.config = config or {}
+class TranscriptionBackend(ABC):
+    """Speech-to-text service used by AudioLoader.
+
+    Backends return a dict with ``transcript``, ``language``, ``duration``
+    and ``confidence`` keys, plus ``utterances`` and ``paragraphs`` lists of
+    ``{"start", "end", "text", "speaker"}`` segments when they are available.
+    """
+
+    name = "base"
+
+    def cache_key(self) -> str:
+        """Identify the backend and options that produced a cached transcript."""
+        return self.name
 
+    @abstractmethod
+    def transcribe_url(self, url: str) -> Dict[str, Any]:
+        """Transcribe audio hosted at a URL."""
+        pass
+
+    @abstractmethod
+    def transcribe_file(self, path: str) -> Dict[str, Any]:
+        """Transcribe a local audio file."""
+        pass
+
+class DeepgramBackend(TranscriptionBackend):
+    """Transcription through the Deepgram prerecorded API."""
+
+    name = "deepgram"
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        """Initialize the Deepgram client from DEEPGRAM_API_KEY."""
+        config = config or {}
         if not os.environ.get("DEEPGRAM_API_KEY"):
             raise ValueError("DEEPGRAM_API_KEY environment variable required")
 
         try:
             from deepgram import DeepgramClient, PrerecordedOptions
             self.client = DeepgramClient(os.environ.get("DEEPGRAM_API_KEY"))
-            self.PrerecordedOptions = PrerecordedOptions
             logger.info("Deepgram client initialized successfully")
         except ImportError:
             logger.error("Deepgram SDK not installed")
@@ -28,6 +63,445 @@ class AudioLoader(BaseLoader):
                 "Deepgram SDK required. Install with: pip install deepgram-sdk"
             )
 
+        self.model = config.get("model", "nova-2")  # Using Nova 2 model for better accuracy
+        self.language = config.get("language", "en")
+        # Configure transcription options
+        self.options = PrerecordedOptions(
+            model=self.model,
+            smart_format=True,
+            language=self.language,
+            detect_language=True,
+            utterances=True,
+            paragraphs=True
+        )
+
+    def cache_key(self) -> str:
+        """Identify the backend and options that produced a cached transcript."""
+        return f"{self.name}:{self.model}:{self.language}"
+
+    def _parse_response(self, response: Any) -> Dict[str, Any]:
+        """Extract transcription and metadata from a Deepgram response."""
+        channel = response.results.channels[0]
+        alternative = channel.alternatives[0]
+
+        utterances = [
+            {
+                "start": utterance.start,
+                "end": utterance.end,
+                "text": utterance.transcript,
+                "speaker": getattr(utterance, "speaker", None)
+            }
+            for utterance in (getattr(response.results, "utterances", None) or [])
+        ]
+
+        paragraphs_result = getattr(alternative, "paragraphs", None)
+        paragraphs = [
+            {
+                "start": paragraph.start,
+                "end": paragraph.end,
+                "text": " ".join(sentence.text for sentence in paragraph.sentences),
+                "speaker": getattr(paragraph, "speaker", None)
+            }
+            for paragraph in (getattr(paragraphs_result, "paragraphs", None) or [])
+        ]
+
+        return {
+            "transcript": alternative.transcript,
+            "language": channel.detected_language,
+            "duration": getattr(response.metadata, "duration", None),
+            "confidence": alternative.confidence,
+            "utterances": utterances,
+            "paragraphs": paragraphs
+        }
+
+    def transcribe_url(self, url: str) -> Dict[str, Any]:
+        """Transcribe audio hosted at a URL."""
+        response = self.client.listen.prerecorded.v("1").transcribe_url(
+            {"url": url}, self.options
+        )
+        return self._parse_response(response)
+
+    def transcribe_file(self, path: str) -> Dict[str, Any]:
+        """Transcribe a local audio file, streaming it rather than reading it into memory."""
+        with open(path, "rb") as audio:
+            response = self.client.listen.prerecorded.v("1").transcribe_file(
+                {"buffer": audio}, self.options
+            )
+        return self._parse_response(response)
+
+class StubBackend(TranscriptionBackend):
+    """Offline backend for tests and dry runs.
+
+    Returns the text of a sidecar ``<audio file>.txt`` when one exists and
+    a fixed placeholder otherwise; no network access or API key is needed.
+    Lines become utterances and blank-line separated blocks paragraphs,
+    without timestamps.
+    """
+
+    name = "stub"
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        """Initialize the stub backend."""
+        self.config = config or {}
+
+    @staticmethod
+    def _result(transcript: str) -> Dict[str, Any]:
+        """Build a backend result with untimed segments."""
+        def segments(parts: List[str]) -> List[Dict[str, Any]]:
+            return [
+                {"start": None, "end": None, "text": part.strip(), "speaker": None}
+                for part in parts if part.strip()
+            ]
+
+        return {
+            "transcript": transcript,
+            "language": "en",
+            "duration": None,
+            "confidence": 1.0,
+            "utterances": segments(transcript.splitlines()),
+            "paragraphs": segments(transcript.split("\n\n"))
+        }
+
+    def transcribe_url(self, url: str) -> Dict[str, Any]:
+        """Return a placeholder transcript for a URL."""
+        return self._result(f"[stub transcript: {url}]")
+
+    def transcribe_file(self, path: str) -> Dict[str, Any]:
+        """Return the sidecar transcript or a placeholder for a local file."""
+        sidecar = Path(f"{path}.txt")
+        if sidecar.exists():
+            transcript = sidecar.read_text(encoding="utf-8")
+        else:
+            transcript = f"[stub transcript: {Path(path).name}]"
+        return self._result(transcript)
+
+TRANSCRIPTION_BACKENDS = {
+    "deepgram": DeepgramBackend,
+    "stub": StubBackend,
+}
+
+class AudioLoader(BaseLoader):
+    """Loader for audio files using a pluggable transcription backend (Deepgram by default)."""
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        """Initialize the audio loader and its transcription backend.
+
+        Optional config:
+        - backend: "deepgram" (default), "stub", or a TranscriptionBackend instance
+        - cache_dir: Directory of cached transcripts keyed by audio content hash
+        - max_workers: Files transcribed concurrently in batch mode (default 4)
+        - model / language: Deepgram options (default "nova-2" / "en")
+        - segment_by: "utterances" or "paragraphs" to emit one document per
+          timestamped segment instead of one per file
+        - split_seconds: Split local files longer than this into segments that
+          are transcribed in parallel (requires ffmpeg)
+        - split_overlap: Seconds shared by neighbouring split segments (default 5)
+        """
+        super().__init__(config)
+        self.config = config or {}
+        self.max_workers = self.config.get("max_workers", 4)
+        self.segment_by = self.config.get("segment_by")
+        if self.segment_by and self.segment_by not in SEGMENT_KINDS:
+            raise ValueError(f"segment_by must be one of: {', '.join(SEGMENT_KINDS)}")
+        self.split_seconds = self.config.get("split_seconds")
+        self.split_overlap = self.config.get("split_overlap", 5)
+        if self.split_seconds and self.split_overlap >= self.split_seconds:
+            raise ValueError("split_overlap must be shorter than split_seconds")
+
+        backend = self.config.get("backend", "deepgram")
+        if isinstance(backend, TranscriptionBackend):
+            self.backend = backend
+        elif backend in TRANSCRIPTION_BACKENDS:
+            self.backend = TRANSCRIPTION_BACKENDS[backend](self.config)
+        else:
+            raise ValueError(
+                f"Unknown transcription backend: {backend}. "
+                f"Choose from: {', '.join(TRANSCRIPTION_BACKENDS)}"
+            )
+
+        self.cache_dir = self.config.get("cache_dir")
+        if self.cache_dir:
+            os.makedirs(self.cache_dir, exist_ok=True)
+
+    @staticmethod
+    def _is_url(source: str) -> bool:
+        """Check if source is an HTTP(S) URL."""
+        return source.startswith(('http://', 'https://'))
+
+    def _content_hash(self, source: str) -> str:
+        """Hash the audio bytes of a file, or the URL itself for remote audio."""
+        digest = hashlib.sha256()
+        if self._is_url(source):
+            digest.update(source.encode())
+        else:
+            with open(source, "rb") as audio:
+                for block in iter(lambda: audio.read(HASH_BLOCK_SIZE), b""):
+                    digest.update(block)
+        return digest.hexdigest()
+
+    def _cache_path(self, content_hash: str) -> str:
+        """Path of the cached transcript for this audio and backend."""
+        key = f"{self.backend.cache_key()}:{content_hash}"
+        if self.split_seconds:
+            key += f":split={self.split_seconds}/{self.split_overlap}"
+        key = hashlib.sha256(key.encode()).hexdigest()
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    @staticmethod
+    def _probe_duration(path: str) -> float:
+        """Return the duration of an audio file in seconds using ffprobe."""
+        output = subprocess.run(
+            [
+                "ffprobe", "-v", "error",
+                "-show_entries", "format=duration",
+                "-of", "default=noprint_wrappers=1:nokey=1",
+                path
+            ],
+            check=True, capture_output=True, text=True
+        ).stdout
+        return float(output.strip())
+
+    @staticmethod
+    def _cut_segment(path: str, start: float, length: float, output: str) -> None:
+        """Cut ``length`` seconds from ``start`` into a 16 kHz mono FLAC file."""
+        subprocess.run(
+            [
+                "ffmpeg", "-v", "error", "-y",
+                "-ss", f"{start:.3f}", "-t", f"{length:.3f}",
+                "-i", path,
+                "-vn", "-ac", "1", "-ar", "16000",
+                output
+            ],
+            check=True, capture_output=True
+        )
+
+    def _transcribe_file(self, path: str) -> Dict[str, Any]:
+        """Transcribe a local file, splitting it into overlapping segments if long.
+
+        Segments are transcribed in parallel. Their timestamps are shifted by
+        the segment offset, and each overlap is cut at its midpoint so no
+        utterance or paragraph is emitted twice. Speaker labels are assigned
+        per piece by the backend, so each segment keeps its ``split_index``.
+        """
+        if not self.split_seconds:
+            return self.backend.transcribe_file(path)
+
+        if not (shutil.which("ffmpeg") and shutil.which("ffprobe")):
+            raise ValueError("Splitting long audio requires ffmpeg and ffprobe on PATH")
+
+        duration = self._probe_duration(path)
+        if duration <= self.split_seconds:
+            return self.backend.transcribe_file(path)
+
+        step = self.split_seconds - self.split_overlap
+        offsets = []
+        offset = 0.0
+        while offset < duration:
+            offsets.append(offset)
+            if offset + self.split_seconds >= duration:
+                break
+            offset += step
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            def transcribe_segment(index: int) -> Dict[str, Any]:
+                segment_path = os.path.join(tmp_dir, f"segment_{index}.flac")
+                self._cut_segment(path, offsets[index], self.split_seconds, segment_path)
+                return self.backend.transcribe_file(segment_path)
+
+            logger.info(f"Transcribing {path} as {len(offsets)} segments")
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                results = list(executor.map(transcribe_segment, range(len(offsets))))
+
+        merged = {kind: [] for kind in SEGMENT_KINDS}
+        half_overlap = self.split_overlap / 2
+        for index, (offset, result) in enumerate(zip(offsets, results)):
+            # This segment owns [lower, upper) of the recording
+            lower = offset + half_overlap if index > 0 else 0.0
+            upper = offsets[index + 1] + half_overlap if index + 1 < len(offsets) else float("inf")
+            for kind in SEGMENT_KINDS:
+                for segment in result.get(kind) or []:
+                    if segment.get("start") is None:
+                        continue
+                    start = segment["start"] + offset
+                    if lower <= start < upper:
+                        merged[kind].append({
+                            **segment,
+                            "start": start,
+                            "end": segment["end"] + offset if segment.get("end") is not None else None,
+                            "split_index": index
+                        })
+
+        # Rebuild the transcript from the de-duplicated segments when timed ones exist
+        if merged["utterances"]:
+            transcript = " ".join(segment["text"] for segment in merged["utterances"])
+        elif merged["paragraphs"]:
+            transcript = "\n\n".join(segment["text"] for segment in merged["paragraphs"])
+        else:
+            transcript = " ".join(result.get("transcript", "") for result in results)
+
+        confidences = [r["confidence"] for r in results if r.get("confidence") is not None]
+        return {
+            "transcript": transcript,
+            "language": results[0].get("language"),
+            "duration": duration,
+            "confidence": sum(confidences) / len(confidences) if confidences else None,
+            **merged,
+            "split_segments": len(offsets)
+        }
+
+    def _transcribe(self, source: str, content_hash: str) -> Tuple[Dict[str, Any], bool]:
+        """Transcribe a source, reusing a cached transcript when available.
+
+        Returns:
+            The backend result and whether it came from the cache
+        """
+        cache_path = self._cache_path(content_hash) if self.cache_dir else None
+        if cache_path and os.path.exists(cache_path):
+            try:
+                with open(cache_path, "r", encoding="utf-8") as f:
+                    cached = json.load(f)
+                # Entries written before segment support lack the segment lists
+                if not self.segment_by or self.segment_by in cached:
+                    return cached, True
+            except (OSError, json.JSONDecodeError) as e:
+                logger.warning(f"Ignoring unreadable transcript cache {cache_path}: {str(e)}")
+
+        # Process URL or local file
+        if self._is_url(source):
+            logger.info(f"Transcribing audio from URL: {source}")
+            result = self.backend.transcribe_url(source)
+        else:
+            logger.info(f"Transcribing local audio file: {source}")
+            result = self._transcribe_file(source)
+
+        if cache_path and result.get("transcript"):
+            tmp_path = f"{cache_path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(result, f)
+            os.replace(tmp_path, cache_path)
+
+        return result, False
+
+    def _load_source(self, source: str) -> Dict[str, Any]:
+        """Transcribe one audio source into a document."""
+        logger.info(f"Processing audio from: {source}")
+        content_hash = self._content_hash(source)
+        result, cached = self._transcribe(source, content_hash)
+
+        transcription = result.get("transcript")
+        if not transcription:
+            raise ValueError("No transcription generated")
+
+        # Generate document ID
+        doc_id = hashlib.sha256(
+            (str(source) + transcription[:100]).encode()
+        ).hexdigest()[:16]
+
+        meta_data = {
+            "doc_id": doc_id,
+            "source": source,
+            "type": "audio",
+            "language": result.get("language"),
+            "duration": result.get("duration"),
+            "confidence": result.get("confidence"),
+            "content_hash": content_hash,
+            "backend": self.backend.name,
+            "cached": cached
+        }
+        if result.get("split_segments"):
+            meta_data["split_segments"] = result["split_segments"]
+
+        logger.info(f"Successfully transcribed audio from: {source}")
+        return {
+            "content": transcription,
+            "meta_data": meta_data,
+            "segments": (result.get(self.segment_by) or []) if self.segment_by else []
+        }
+
+    def _segment_documents(self, document: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Split a transcript document into one document per timestamped segment.
+
+        Falls back to the whole transcript when the backend returned no
+        segments with text. For split recordings, speaker labels only
+        identify the same speaker within one ``split_index``.
+        """
+        segments = [segment for segment in document.pop("segments", []) if segment.get("text")]
+        if not segments:
+            return [document]
+
+        meta_data = document["meta_data"]
+        documents = []
+        for index, segment in enumerate(segments):
+            segment_meta = {
+                **meta_data,
+                "segment_type": self.segment_by[:-1],
+                "segment_index": index,
+                "start": segment.get("start"),
+                "end": segment.get("end"),
+                "speaker": segment.get("speaker")
+            }
+            if "split_index" in segment:
+                segment_meta["split_index"] = segment["split_index"]
+            documents.append({"content": segment["text"], "meta_data": segment_meta})
+        return documents
+
+    def _load_units(self, source: str) -> List[Dict[str, Any]]:
+        """Transcribe a source into its document units."""
+        document = self._load_source(source)
+        if self.segment_by:
+            return self._segment_documents(document)
+        document.pop("segments", None)
+        return [document]
+
+    def load_batch(self, sources: List[str]) -> List[Dict[str, Any]]:
+        """Transcribe many audio sources concurrently, one document per unit.
+
+        Sources that fail are logged and skipped so one bad file does not
+        abort a backfill.
+
+        Args:
+            sources: Local audio file paths or URLs
+
+        Returns:
+            Documents for the sources that transcribed, in input order
+        """
+        return list(self._iter_batch(sources))
+
+    def _iter_batch(self, sources: List[str]) -> Iterator[Dict[str, Any]]:
+        """Transcribe sources on a worker pool, yielding documents in input order."""
+        def transcribe(source: str) -> List[Dict[str, Any]]:
+            try:
+                return self._load_units(source)
+            except Exception as e:
+                logger.error(f"Error processing audio {source}: {str(e)}")
+                return []
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for documents in executor.map(transcribe, sources):
+                yield from documents
+
+    def lazy_load(self, source: str) -> Iterator[Dict[str, Any]]:
+        """Yield transcripts; a directory source transcribes its audio files concurrently.
+
+        Args:
+            source: Path to local audio file, directory of audio files, or URL
+        """
+        if not self._is_url(source) and os.path.isdir(source):
+            files = sorted(
+                str(path) for path in Path(source).rglob("*")
+                if path.is_file() and path.suffix.lower() in AUDIO_EXTENSIONS
+            )
+            if not files:
+                raise ValueError(f"No audio files found in directory: {source}")
+            yield from self._iter_batch(files)
+            return
+
+        try:
+            yield from self._load_units(source)
+        except Exception as e:
+            logger.error(f"Error processing audio: {str(e)}")
+            raise ValueError(f"Audio processing failed: {str(e)}")
+
     def load(self, source: str) -> Dict[str, Any]:
         """Load and transcribe audio from file or URL.
 
@@ -38,66 +512,21 @@ class AudioLoader(BaseLoader):
             Dict containing:
                 - content: The transcribed text
                 - meta_data: Audio metadata
+            or, with ``segment_by`` set, the document ID and one entry per segment
         """
         try:
-            logger.info(f"Processing audio from: {source}")
-
-            # Configure transcription options
-            options = self.PrerecordedOptions(
-                model="nova-2",  # Using Nova 2 model for better accuracy
-                smart_format=True,
-                language="en",
-                detect_language=True
-            )
-
-            # Process URL or local file
-            if source.startswith(('http://', 'https://')):
-                logger.info(f"Transcribing audio from URL: {source}")
-                source_obj = {"url": source}
-                response = self.client.listen.prerecorded.v("1").transcribe_url(
-                    source_obj, options
-                )
-            else:
-                logger.info(f"Transcribing local audio file: {source}")
-                with open(source, "rb") as audio:
-                    source_obj = {"buffer": audio}
-                    response = self.client.listen.prerecorded.v("1").transcribe_file(
-                        source_obj, options
-                    )
-
-            # Extract transcription and metadata
-            transcription = response.results.channels[0].alternatives[0].transcript
-            if not transcription:
-                raise ValueError("No transcription generated")
-
-            # Generate document ID
-            doc_id = hashlib.sha256(
-                (str(source) + transcription[:100]).encode()
-            ).hexdigest()[:16]
-
-            # Extract metadata
-            metadata = {
-                "source": source,
-                "type": "audio",
-                "language": response.results.channels[0].detected_language,
-                "duration": response.results.channels[0].duration,
-                "confidence": response.results.channels[0].alternatives[0].confidence
-            }
-
-            logger.info(f"Successfully transcribed audio from: {source}")
-            return {
-                "content": transcription,
-                "meta_data": {
-                    "doc_id": doc_id,
-                    "source": source,
-                    "type": "audio",
-                    **metadata
+            if self.segment_by:
+                data = self._load_units(source)
+                return {
+                    "doc_id": data[0]["meta_data"]["doc_id"],
+                    "data": data
                 }
-            }
-
+            document = self._load_source(source)
+            document.pop("segments", None)
+            return document
         except Exception as e:
             logger.error(f"Error processing audio: {str(e)}")
             raise ValueError(f"Audio processing failed: {str(e)}")
 
 # For backward compatibility and explicit exports
-__all__ = ['AudioLoader']
\ No newline at end of file
+__all__ = ['AudioLoader', 'TranscriptionBackend', 'DeepgramBackend', 'StubBackend']
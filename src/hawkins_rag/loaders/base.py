@@ -1,23 +1,4 @@
-from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional
+"""Base loader re-exported for loaders importing it from this package."""
+from ..utils.base import BaseLoader
 
-class BaseLoader(ABC):
-    """Base class for all document loaders."""
-
-    def __init__(self, config: Optional[Dict] = None):
-        """Initialize loader with optional configuration."""
-        self.config = config or {}
-
-    @abstractmethod
-    def load(self, source: str) -> Dict[str, Any]:
-        """Load data from source.
-
-        Args:
-            source: Path or URL to load data from
-
-        Returns:
-            Dict containing:
-                - content: The main content
-                - meta_data: Dictionary of metadata about the content
-        """
-        pass
\ No newline at end of file
+__all__ = ['BaseLoader']
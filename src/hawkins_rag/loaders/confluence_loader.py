@@ -1,18 +1,37 @@
 import hashlib
-from typing import Any, Dict, List, Optional
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional
+from datetime import datetime
 from atlassian import Confluence
 from .base import BaseLoader
+from ..utils.sync_state import SyncStateStore, query_timestamp
+
+logger = logging.getLogger(__name__)
+
+# Comments are expanded inline so a page costs no extra request
+PAGE_EXPAND = (
+    'body.storage,version,space,history,ancestors,'
+    'children.comment.body.view,children.comment.history'
+)
 
 class ConfluenceLoader(BaseLoader):
     """Loader for Confluence pages and spaces."""
 
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         """Initialize Confluence loader with configuration.
-        
+
         Required config:
         - url: Confluence instance URL
         - username: Username/email
         - password: API token or password
+
+        Optional config:
+        - page_limit: Pages requested per listing call (default 50)
+        - max_workers: Listing calls issued concurrently (default 4)
+        - incremental: Only load pages modified since the last sync
+        - state_path: Sync state file, required for incremental mode
+        - overlap_minutes: Look-back applied to the lastmodified filter (default 1440)
         """
         if not config or not all(k in config for k in ['url', 'username', 'password']):
             raise ValueError(
@@ -20,6 +39,17 @@ class ConfluenceLoader(BaseLoader):
                 "Get API token from https://id.atlassian.com/manage/api-tokens"
             )
 
+        super().__init__(config)
+        self.page_limit = self.config.get('page_limit', 50)
+        self.max_workers = self.config.get('max_workers', 4)
+        self.overlap_minutes = self.config.get('overlap_minutes', 1440)
+
+        state_path = self.config.get('state_path')
+        self.state = SyncStateStore(state_path) if state_path else None
+        self.incremental = self.config.get('incremental', False)
+        if self.incremental and not self.state:
+            raise ValueError("Incremental Confluence sync requires config['state_path']")
+
         try:
             self.confluence = Confluence(
                 url=config['url'],
@@ -41,22 +71,38 @@ class ConfluenceLoader(BaseLoader):
             clean = re.compile('<.*?>')
             return re.sub(clean, '', content)
 
-    def _get_page_content(self, page_id: str) -> Dict[str, Any]:
-        """Get full page content and metadata."""
-        page = self.confluence.get_page_by_id(
-            page_id,
-            expand='body.storage,version,space,ancestors,descendants.page'
-        )
+    def _get_comments(self, page: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Return page comments, using the inline expansion when complete."""
+        comments = page.get('children', {}).get('comment', {})
+        results = comments.get('results', [])
+        if 'next' not in comments.get('_links', {}):
+            return results
 
+        # More comments than the expansion returns: page through the rest
+        start = len(results)
+        while True:
+            response = self.confluence.get_page_comments(
+                page['id'],
+                expand='body.view,history',
+                start=start,
+                limit=self.page_limit
+            )
+            batch = response.get('results', [])
+            results.extend(batch)
+            if not batch or 'next' not in response.get('_links', {}):
+                return results
+            start += len(batch)
+
+    def _format_page(self, page: Dict[str, Any]) -> Dict[str, Any]:
+        """Build a document from a page fetched with PAGE_EXPAND."""
         # Extract clean content
         content = self._clean_content(page['body']['storage']['value'])
 
-        # Get comments
-        comments = self.confluence.get_page_comments(page_id, expand='body.view')
         formatted_comments = []
-        for comment in comments:
-            author = comment['author']['displayName']
-            created = comment['created']
+        for comment in self._get_comments(page):
+            history = comment.get('history', {})
+            author = history.get('createdBy', {}).get('displayName', 'Unknown')
+            created = history.get('createdDate', '')
             body = self._clean_content(comment['body']['view']['value'])
             formatted_comments.append(f"[{created}] {author}: {body}")
 
@@ -69,7 +115,10 @@ class ConfluenceLoader(BaseLoader):
             *formatted_comments
         ]
 
+        history = page.get('history', {})
         return {
+            # A stable name lets an updated page replace its own chunks
+            "name": f"{page['space']['key']}_{page['id']}",
             "content": "\n".join(full_content),
             "meta_data": {
                 "id": page['id'],
@@ -77,8 +126,8 @@ class ConfluenceLoader(BaseLoader):
                 "space_key": page['space']['key'],
                 "space_name": page['space']['name'],
                 "version": page['version']['number'],
-                "created": page['created'],
-                "creator": page['history']['createdBy']['displayName'],
+                "created": history.get('createdDate'),
+                "creator": history.get('createdBy', {}).get('displayName'),
                 "last_modified": page['version']['when'],
                 "last_modifier": page['version']['by']['displayName'],
                 "ancestor_ids": [a['id'] for a in page.get('ancestors', [])],
@@ -88,6 +137,128 @@ class ConfluenceLoader(BaseLoader):
             }
         }
 
+    def _get_page_content(self, page_id: str) -> Dict[str, Any]:
+        """Get full page content and metadata."""
+        page = self.confluence.get_page_by_id(
+            page_id,
+            expand=f'{PAGE_EXPAND},descendants.page'
+        )
+        return self._format_page(page)
+
+    def _get_space_pages(self, space_key: str, start: int) -> Dict[str, Any]:
+        """Fetch one listing window of fully expanded pages."""
+        return self.confluence.get(
+            'rest/api/content',
+            params={
+                'spaceKey': space_key,
+                'type': 'page',
+                'start': start,
+                'limit': self.page_limit,
+                'expand': PAGE_EXPAND
+            }
+        ) or {}
+
+    def _get_modified_pages(self, space_key: str, since: str, start: int) -> Dict[str, Any]:
+        """Fetch one window of pages modified since a watermark via CQL."""
+        cql = (
+            f'space = "{space_key}" AND type = page '
+            f'AND lastmodified >= "{query_timestamp(since, self.overlap_minutes)}"'
+        )
+        return self.confluence.get(
+            'rest/api/content/search',
+            params={'cql': cql, 'start': start, 'limit': self.page_limit, 'expand': PAGE_EXPAND}
+        ) or {}
+
+    def _iter_space_pages(self, space_key: str, since: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """Yield every page of a space, or only those modified since ``since``.
+
+        Confluence may lower ``limit`` on its own for heavy expansions, so
+        windows step by the limit the first response reports. The remaining
+        windows are requested ``max_workers`` at a time until a response has
+        no ``_links.next``.
+        """
+        if since:
+            fetch = lambda offset: self._get_modified_pages(space_key, since, offset)
+        else:
+            fetch = lambda offset: self._get_space_pages(space_key, offset)
+
+        first = fetch(0)
+        results = first.get('results', [])
+        yield from results
+        if not results or 'next' not in first.get('_links', {}):
+            return
+
+        step = first.get('limit') or len(results)
+        if step < self.page_limit:
+            logger.info(f"Confluence capped the listing limit at {step} for space {space_key}")
+
+        start = step
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            while True:
+                offsets = [start + i * step for i in range(self.max_workers)]
+                for response in executor.map(fetch, offsets):
+                    results = response.get('results', [])
+                    yield from results
+                    if not results or 'next' not in response.get('_links', {}):
+                        return
+                start = offsets[-1] + step
+
+    def lazy_load(self, source: str) -> Iterator[Dict[str, Any]]:
+        """Yield Confluence pages one document at a time.
+
+        In incremental mode a space load yields only pages created or
+        edited since the stored ``version.when`` watermark.
+
+        Args:
+            source: Space key and optional page title (e.g., "DEMO" or "DEMO:Home Page")
+        """
+        space_key = source.split(':')[0]
+        page_title = source.split(':', 1)[1] if ':' in source else None
+
+        if page_title:
+            # Get single page
+            page = self.confluence.get_page_by_title(space_key, page_title)
+            if not page:
+                raise ValueError(f"Page not found: {page_title} in space {space_key}")
+            yield self._get_page_content(page['id'])
+            return
+
+        if not self.incremental:
+            found = False
+            for page in self._iter_space_pages(space_key):
+                found = True
+                yield self._format_page(page)
+
+            if not found:
+                raise ValueError(f"No pages found in space: {space_key}")
+            return
+
+        # Incremental: only pages whose version moved past the stored one
+        state_key = f"space:{space_key}"
+        sync_state = self.state.get(state_key) or {"watermark": None, "versions": {}}
+        versions = sync_state['versions']
+        watermark = sync_state['watermark']
+        completed = False
+
+        try:
+            for page in self._iter_space_pages(space_key, since=sync_state['watermark']):
+                if versions.get(page['id']) == page['version']['number']:
+                    continue
+                yield self._format_page(page)
+                # Recorded only once the consumer has stored the page
+                versions[page['id']] = page['version']['number']
+                when = page['version']['when']
+                if not watermark or datetime.fromisoformat(when) > datetime.fromisoformat(watermark):
+                    watermark = when
+            completed = True
+        finally:
+            # Results are not ordered by modification time, so the watermark
+            # only moves after a complete run; versions still skip stored pages
+            self.state.set(state_key, {
+                "watermark": watermark if completed else sync_state['watermark'],
+                "versions": versions
+            })
+
     def load(self, source: str) -> Any:
         """Load content from Confluence.
 
@@ -98,49 +269,17 @@ class ConfluenceLoader(BaseLoader):
             Dict containing document ID and array of page data
         """
         try:
-            space_key = source.split(':')[0]
-            page_title = source.split(':', 1)[1] if ':' in source else None
-
-            if page_title:
-                # Get single page
-                page = self.confluence.get_page_by_title(space_key, page_title)
-                if not page:
-                    raise ValueError(f"Page not found: {page_title} in space {space_key}")
-                
-                page_data = self._get_page_content(page['id'])
-                
-                # Generate document ID
-                doc_id = hashlib.sha256(
-                    (source + page_data['content']).encode()
-                ).hexdigest()
-
-                return {
-                    "doc_id": doc_id,
-                    "data": [page_data]
-                }
-            else:
-                # Get all pages in space
-                pages = self.confluence.get_all_pages_from_space(space_key, limit=100)
-                if not pages:
-                    raise ValueError(f"No pages found in space: {space_key}")
-
-                data = []
-                all_content = []
-
-                for page in pages:
-                    page_data = self._get_page_content(page['id'])
-                    data.append(page_data)
-                    all_content.append(page_data['content'])
-
-                # Generate document ID
-                doc_id = hashlib.sha256(
-                    (source + "".join(all_content)).encode()
-                ).hexdigest()
-
-                return {
-                    "doc_id": doc_id,
-                    "data": data
-                }
+            data = list(self.lazy_load(source))
+
+            # Generate document ID
+            doc_id = hashlib.sha256(
+                (source + "".join(page['content'] for page in data)).encode()
+            ).hexdigest()
+
+            return {
+                "doc_id": doc_id,
+                "data": data
+            }
 
         except Exception as e:
             raise ValueError(f"Error loading from Confluence: {str(e)}")
@@ -1,10 +1,12 @@
 """CSV file loader implementation."""
 import csv
+import io
 import hashlib
-from typing import Any, Dict, Optional
+import itertools
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional, TextIO, Tuple
 from pathlib import Path
 import logging
-from io import StringIO
 import requests
 from urllib.parse import urlparse
 from ..utils.base import BaseLoader
@@ -19,6 +21,9 @@ class CSVLoader(BaseLoader):
         super().__init__(config)
         self.config = config or {}
         self.delimiter = self.config.get('delimiter', ',')
+        # Rows per streamed document
+        self.group_size = self.config.get('group_size', 1000)
+        self.timeout = self.config.get('timeout', 30)
 
     def _detect_delimiter(self, sample: str) -> str:
         """Detect the delimiter used in the CSV content."""
@@ -29,6 +34,94 @@ class CSVLoader(BaseLoader):
         counts = {d: sample.count(d) for d in common_delimiters}
         return max(counts.items(), key=lambda x: x[1])[0]
 
+    @contextmanager
+    def _open_source(self, source: str) -> Iterator[Tuple[TextIO, Dict[str, Any]]]:
+        """Open a CSV file or stream a URL as a text stream, with source metadata."""
+        # Determine if source is URL or file
+        url = urlparse(source)
+        if all([url.scheme, url.netloc]):
+            if url.scheme not in ['http', 'https']:
+                raise ValueError("Only HTTP(S) URLs are supported")
+            with requests.get(source, stream=True, timeout=self.timeout) as response:
+                response.raise_for_status()
+                # Decode the body as it arrives instead of buffering response.text
+                response.raw.decode_content = True
+                stream = io.TextIOWrapper(
+                    response.raw,
+                    encoding=response.encoding or 'utf-8',
+                    newline=''
+                )
+                try:
+                    yield stream, {
+                        "source_type": "url",
+                        "url": source
+                    }
+                finally:
+                    stream.close()
+        else:
+            path = Path(source)
+            if not path.exists():
+                raise ValueError(f"CSV file not found: {source}")
+            with open(path, 'r', encoding='utf-8', newline='') as stream:
+                yield stream, {
+                    "source_type": "file",
+                    "file_path": str(path),
+                    "file_size": path.stat().st_size
+                }
+
+    def _format_row(self, row: Dict[str, Any]) -> str:
+        """Format a row as "header: value" pairs, skipping empty values."""
+        return " | ".join([f"{k}: {v}" for k, v in row.items() if v])
+
+    def lazy_load(self, source: str) -> Iterator[Dict[str, Any]]:
+        """Stream CSV rows as documents of ``group_size`` rows each.
+
+        Rows are parsed as the file or HTTP body is read, so memory use is
+        bounded by the group size rather than the file size. Each group
+        carries the CSV header in its metadata.
+
+        Args:
+            source: Path to CSV file or URL
+        """
+        with self._open_source(source) as (stream, metadata):
+            # Read first line to detect delimiter, then replay it to the reader
+            first_line = stream.readline()
+            delimiter = self._detect_delimiter(first_line)
+            reader = csv.DictReader(itertools.chain([first_line], stream), delimiter=delimiter)
+            headers = reader.fieldnames if reader.fieldnames else []
+
+            group_index = 0
+            row_start = 0
+            lines = []
+
+            def build_group() -> Dict[str, Any]:
+                return {
+                    "content": "\n".join(lines),
+                    "meta_data": {
+                        "source": source,
+                        "type": "csv",
+                        "headers": headers,
+                        "group_index": group_index,
+                        "row_start": row_start,
+                        "row_count": len(lines),
+                        **metadata
+                    }
+                }
+
+            for row in reader:
+                line = self._format_row(row)
+                if not line:  # Skip empty rows
+                    continue
+                lines.append(line)
+                if len(lines) >= self.group_size:
+                    yield build_group()
+                    group_index += 1
+                    row_start += len(lines)
+                    lines = []
+
+            if lines or group_index == 0:
+                yield build_group()
+
     def load(self, source: str) -> Dict[str, Any]:
         """Load and process CSV data from file or URL.
 
@@ -40,70 +133,36 @@ class CSVLoader(BaseLoader):
                 - content: Processed CSV content as text
                 - meta_data: Dictionary of metadata about the content
         """
-        csv_content = None
         try:
-            # Determine if source is URL or file
-            url = urlparse(source)
-            if all([url.scheme, url.netloc]):
-                if url.scheme not in ['http', 'https']:
-                    raise ValueError("Only HTTP(S) URLs are supported")
-                response = requests.get(source)
-                response.raise_for_status()
-                csv_content = StringIO(response.text)
-                metadata = {
-                    "source_type": "url",
-                    "url": source
-                }
-            else:
-                path = Path(source)
-                if not path.exists():
-                    raise ValueError(f"CSV file not found: {source}")
-                csv_content = open(path, 'r', encoding='utf-8')
-                metadata = {
-                    "source_type": "file",
-                    "file_path": str(path),
-                    "file_size": path.stat().st_size
-                }
-
-            # Read first line to detect delimiter
-            first_line = csv_content.readline()
-            csv_content.seek(0)
-            delimiter = self._detect_delimiter(first_line)
-
-            # Process CSV content
-            reader = csv.DictReader(csv_content, delimiter=delimiter)
-            headers = reader.fieldnames if reader.fieldnames else []
-            content_lines = []
-
-            for row in reader:
-                line = " | ".join([f"{k}: {v}" for k, v in row.items() if v])
-                if line:  # Only append non-empty lines
-                    content_lines.append(line)
-
+            groups = []
+            total_rows = 0
+            meta_data = {}
+            for group in self.lazy_load(source):
+                groups.append(group["content"])
+                total_rows += group["meta_data"]["row_count"]
+                meta_data = group["meta_data"]
+
+            headers = meta_data.get("headers", [])
             # Create content string
             content = f"Headers: {', '.join(headers)}\n\n"
-            content += "\n".join(content_lines)
+            content += "\n".join(g for g in groups if g)
 
             # Generate document ID
             doc_id = hashlib.sha256(content.encode()).hexdigest()[:16]
 
+            for key in ("group_index", "row_start", "row_count"):
+                meta_data.pop(key, None)
+
             logger.info(f"Successfully loaded CSV from {source}")
             return {
                 "content": content,
                 "meta_data": {
                     "doc_id": doc_id,
-                    "source": source,
-                    "type": "csv",
-                    "headers": headers,
-                    "total_rows": len(content_lines),
-                    **metadata
+                    **meta_data,
+                    "total_rows": total_rows
                 }
             }
 
         except Exception as e:
             logger.error(f"Error loading CSV: {str(e)}")
             raise ValueError(f"Error loading CSV: {str(e)}")
-
-        finally:
-            if csv_content:
-                csv_content.close()
\ No newline at end of file
@@ -1,18 +1,46 @@
 import os
+import queue
+import asyncio
 import hashlib
-from typing import Any, Dict, List, Optional
+import logging
+import threading
+from typing import Any, Dict, Iterator, List, Optional
 from ..utils.loader_registry import BaseLoader
+from ..utils.sync_state import SyncStateStore
+
+logger = logging.getLogger(__name__)
+
+# Marks the end of the client's output on the message queue
+_DONE = object()
+
+class _Stopped(Exception):
+    """Raised inside the client when the consumer stopped reading."""
 
 class DiscordLoader(BaseLoader):
     """Loader for Discord channels."""
 
     def __init__(self, config: Optional[Dict[str, Any]] = None):
-        """Initialize Discord loader with configuration."""
+        """Initialize Discord loader with configuration.
+
+        Optional config:
+        - max_concurrency: Thread histories read concurrently (default 4)
+        - queue_size: Messages buffered between the client and the consumer (default 1000)
+        - incremental: Only load messages newer than the last sync
+        - state_path: Sync state file, required for incremental mode
+        """
         super().__init__(config)
         if not os.environ.get("DISCORD_TOKEN"):
             raise ValueError("DISCORD_TOKEN environment variable required")
 
         self.token = os.environ.get("DISCORD_TOKEN")
+        self.max_concurrency = self.config.get("max_concurrency", 4)
+        self.queue_size = self.config.get("queue_size", 1000)
+
+        state_path = self.config.get("state_path")
+        self.state = SyncStateStore(state_path) if state_path else None
+        self.incremental = self.config.get("incremental", False)
+        if self.incremental and not self.state:
+            raise ValueError("Incremental Discord sync requires config['state_path']")
 
     @staticmethod
     def _format_message(message):
@@ -58,45 +86,112 @@ class DiscordLoader(BaseLoader):
             ],
         }
 
-    def load(self, source: str) -> Any:
-        """Load content from Discord channel."""
+    @staticmethod
+    def _message_document(message: Dict[str, Any], channel: Any, thread: Any = None) -> Dict[str, Any]:
+        """Build a per-message document from a formatted message."""
+        content_parts = [f"[{message['created_at']}] {message['author']['name']}: {message['content']}"]
+        for embed in message["embeds"]:
+            embed_text = " - ".join(part for part in (embed["title"], embed["description"]) if part)
+            if embed_text:
+                content_parts.append(f"Embed: {embed_text}")
+
+        return {
+            # A stable name keeps later incremental runs off earlier messages' chunks
+            "name": f"{channel.id}_{message['message_id']}",
+            "content": "\n".join(content_parts),
+            "meta_data": {
+                "message_id": message["message_id"],
+                "channel_id": str(channel.id),
+                "channel_name": channel.name,
+                "guild_id": str(channel.guild.id) if channel.guild else None,
+                "thread_id": str(thread.id) if thread else None,
+                "thread_name": thread.name if thread else None,
+                "author_id": message["author"]["id"],
+                "author_name": message["author"]["name"],
+                "created_at": message["created_at"],
+                "attachment_urls": [a["url"] for a in message["attachments"]],
+            }
+        }
+
+    def _last_seen(self, state_key: str) -> Optional[int]:
+        """Return the last ingested message id for a channel or thread."""
+        if not self.incremental:
+            return None
+        last_seen = self.state.get(state_key)
+        return int(last_seen) if last_seen else None
+
+    def _run_client(self, channel_ids: List[int], out: queue.Queue, stop: threading.Event) -> None:
+        """Run one gateway session that reads every channel and feeds ``out``."""
         try:
             import discord
-            from discord.ext import commands
         except ImportError:
-            raise ImportError(
-                "Discord client required. Install with: pip install discord.py"
-            )
+            out.put(ImportError("Discord client required. Install with: pip install discord.py"))
+            out.put(_DONE)
+            return
 
-        channel_id = source
-        messages: List[Dict[str, Any]] = []
+        loader = self
+        semaphore_holder: Dict[str, asyncio.Semaphore] = {}
+
+        async def emit(item: Any) -> None:
+            # Hand items over without blocking the event loop; give up once the consumer left
+            while not stop.is_set():
+                try:
+                    await asyncio.to_thread(out.put, item, True, 0.5)
+                    return
+                except queue.Full:
+                    continue
+            raise _Stopped()
+
+        async def read_history(history_source: Any, channel: Any, thread: Any = None) -> None:
+            state_key = f"{'thread' if thread else 'channel'}:{history_source.id}"
+            last_seen = loader._last_seen(state_key)
+            after = discord.Object(id=last_seen) if last_seen else None
+            async with semaphore_holder["history"]:
+                async for message in history_source.history(limit=None, after=after, oldest_first=True):
+                    document = DiscordLoader._message_document(
+                        DiscordLoader._format_message(message), channel, thread
+                    )
+                    await emit((state_key, document))
+
+        async def list_threads(channel: Any) -> List[Any]:
+            threads = {thread.id: thread for thread in channel.threads}
+            try:
+                async for thread in channel.archived_threads(limit=None):
+                    threads.setdefault(thread.id, thread)
+            except discord.Forbidden:
+                logger.warning(f"No access to archived threads of channel {channel.id}")
+            return list(threads.values())
 
         class DiscordClient(discord.Client):
             async def setup_hook(self) -> None:
                 self.tree = discord.app_commands.CommandTree(self)
 
             async def on_ready(self) -> None:
+                semaphore_holder["history"] = asyncio.Semaphore(loader.max_concurrency)
                 try:
-                    channel = self.get_channel(int(channel_id))
-                    if not isinstance(channel, discord.TextChannel):
-                        raise ValueError(
-                            f"Channel {channel_id} is not a text channel. "
-                            "Only text channels are supported."
-                        )
-
-                    # Get channel threads
-                    threads = {thread.id: thread for thread in channel.threads}
-
-                    # Get messages from main channel
-                    async for message in channel.history(limit=None):
-                        messages.append(DiscordLoader._format_message(message))
-                        # Get messages from related thread if exists
-                        if message.id in threads:
-                            async for thread_message in threads[message.id].history(limit=None):
-                                messages.append(DiscordLoader._format_message(thread_message))
+                    for channel_id in channel_ids:
+                        channel = self.get_channel(channel_id) or await self.fetch_channel(channel_id)
+                        if not isinstance(channel, discord.TextChannel):
+                            raise ValueError(
+                                f"Channel {channel_id} is not a text channel. "
+                                "Only text channels are supported."
+                            )
 
+                        # Channel history and all thread histories are read concurrently
+                        threads = await list_threads(channel)
+                        await asyncio.gather(
+                            read_history(channel, channel),
+                            *(read_history(thread, channel, thread) for thread in threads)
+                        )
+                    await emit(_DONE)
+                except _Stopped:
+                    pass
                 except Exception as e:
-                    print(f"Error loading Discord content: {e}")
+                    try:
+                        await emit(e)
+                        await emit(_DONE)
+                    except _Stopped:
+                        pass
                 finally:
                     await self.close()
 
@@ -105,24 +200,79 @@ class DiscordLoader(BaseLoader):
         intents.message_content = True
         client = DiscordClient(intents=intents)
 
-        # Run client
-        client.run(self.token)
+        try:
+            # Run client
+            client.run(self.token, log_handler=None)
+        except Exception as e:
+            out.put(e)
+            out.put(_DONE)
+
+    def lazy_load(self, source: str) -> Iterator[Dict[str, Any]]:
+        """Yield one document per message of one or more channels.
+
+        All channels are read over a single client session, with thread
+        histories read concurrently. In incremental mode only messages after
+        the last seen id of each channel and thread are fetched.
+
+        Args:
+            source: Channel ID, or comma-separated channel IDs
+        """
+        channel_ids = [int(channel_id) for channel_id in source.split(",") if channel_id.strip()]
+        if not channel_ids:
+            raise ValueError("No Discord channel ID given")
+
+        out: queue.Queue = queue.Queue(maxsize=self.queue_size)
+        stop = threading.Event()
+        worker = threading.Thread(target=self._run_client, args=(channel_ids, out, stop), daemon=True)
+        worker.start()
+
+        last_seen: Dict[str, str] = {}
+        try:
+            while True:
+                item = out.get()
+                if item is _DONE:
+                    break
+                if isinstance(item, ImportError):
+                    raise item
+                if isinstance(item, Exception):
+                    raise ValueError(f"Error loading Discord content: {str(item)}")
+
+                state_key, document = item
+                yield document
+                last_seen[state_key] = document["meta_data"]["message_id"]
+        finally:
+            stop.set()
+            if self.incremental:
+                for state_key, message_id in last_seen.items():
+                    self.state.set(state_key, message_id)
+
+    def load(self, source: str) -> Any:
+        """Load content from Discord channels.
+
+        Args:
+            source: Channel ID, or comma-separated channel IDs
+
+        Returns:
+            Dict containing document ID and one entry per channel
+        """
+        channels: Dict[str, List[str]] = {}
+        for document in self.lazy_load(source):
+            channels.setdefault(document["meta_data"]["channel_id"], []).append(document["content"])
 
-        # Format all messages into text
-        content = "\n\n".join(
-            f"[{msg['created_at']}] {msg['author']['name']}: {msg['content']}"
-            for msg in messages
-        )
+        data = []
+        for channel_id, contents in channels.items():
+            # Format all messages into text
+            content = "\n\n".join(contents)
+            data.append({
+                "content": content,
+                "meta_data": {"url": channel_id},
+            })
 
-        doc_id = hashlib.sha256((content + channel_id).encode()).hexdigest()
-        metadata = {"url": channel_id}
+        doc_id = hashlib.sha256(
+            ("".join(item["content"] for item in data) + source).encode()
+        ).hexdigest()
 
         return {
             "doc_id": doc_id,
-            "data": [
-                {
-                    "content": content,
-                    "meta_data": metadata,
-                }
-            ],
-        }
\ No newline at end of file
+            "data": data,
+        }
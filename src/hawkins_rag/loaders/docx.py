@@ -1,7 +1,7 @@
 """DOCX document loader implementation."""
 import docx2txt
 import hashlib
-from typing import Any, Dict, Optional
+from typing import Any, BinaryIO, Dict, Optional
 from pathlib import Path
 import logging
 from ..utils.base import BaseLoader
@@ -59,4 +59,41 @@ class DocxLoader(BaseLoader):
 
         except Exception as e:
             logger.error(f"Error loading DOCX: {str(e)}")
-            raise ValueError(f"Error loading DOCX: {str(e)}")
\ No newline at end of file
+            raise ValueError(f"Error loading DOCX: {str(e)}")
+
+    def load_stream(self, stream: BinaryIO, name: str) -> Dict[str, Any]:
+        """Load text content from an in-memory DOCX stream.
+
+        Args:
+            stream: Binary file-like object containing the DOCX archive
+            name: File name used for metadata and the document ID
+
+        Returns:
+            Dict containing:
+                - content: The document content as text
+                - meta_data: Dictionary of metadata about the content
+        """
+        try:
+            # docx2txt opens its input with zipfile, which accepts file objects
+            content = docx2txt.process(stream)
+            if not content:
+                raise ValueError("Empty document or failed to extract content")
+
+            content = content.strip()
+            doc_id = hashlib.sha256(
+                (name + content[:100]).encode()
+            ).hexdigest()[:16]
+
+            return {
+                "content": content,
+                "meta_data": {
+                    "doc_id": doc_id,
+                    "source": name,
+                    "type": "docx",
+                    "file_name": name
+                }
+            }
+
+        except Exception as e:
+            logger.error(f"Error loading DOCX stream {name}: {str(e)}")
+            raise ValueError(f"Error loading DOCX: {str(e)}")
@@ -1,13 +1,39 @@
+"""Dropbox content loader implementation."""
 import os
-from typing import Any
-from pathlib import Path
+import shutil
+import hashlib
+import logging
 import tempfile
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import closing
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Set
 from .base import BaseLoader
+from ..utils.loader_registry import get_loader
+from ..utils.sync_state import SyncStateStore
+
+logger = logging.getLogger(__name__)
+
+# Bytes written per step while streaming a download to disk
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+class _UnparsableFile(Exception):
+    """Raised when a downloaded file cannot be parsed by its loader."""
 
 class DropboxLoader(BaseLoader):
     """Loader for Dropbox content."""
 
-    def __init__(self):
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        """Initialize Dropbox loader from DROPBOX_ACCESS_TOKEN.
+
+        Optional config:
+        - max_workers: Files downloaded and parsed concurrently (default 4)
+        - extensions: Only load files with these extensions (e.g. ["pdf", "md"])
+        - incremental: Only load files changed since the last sync
+        - state_path: Sync state file, required for incremental mode
+        """
+        super().__init__(config)
         if not os.environ.get("DROPBOX_ACCESS_TOKEN"):
             raise ValueError("DROPBOX_ACCESS_TOKEN environment variable required")
 
@@ -17,43 +43,340 @@ class DropboxLoader(BaseLoader):
         except ImportError:
             raise ImportError("dropbox package required. Install with: pip install dropbox")
 
-    def load(self, source: str) -> Any:
-        """Load content from Dropbox path."""
+        self.max_workers = self.config.get("max_workers", 4)
+        self.extensions = self.config.get("extensions")
+        self._local = threading.local()
+
+        state_path = self.config.get("state_path")
+        self.state = SyncStateStore(state_path) if state_path else None
+        self.incremental = self.config.get("incremental", False)
+        if self.incremental and not self.state:
+            raise ValueError("Incremental Dropbox sync requires config['state_path']")
+
+    def _get_client(self):
+        """Return a Dropbox client with its own HTTP session for the calling thread."""
+        client = getattr(self._local, "client", None)
+        if client is None:
+            from dropbox import create_session
+            client = self.client.clone(session=create_session())
+            self._local.client = client
+        return client
+
+    @staticmethod
+    def _normalize_path(source: str) -> str:
+        """Convert a source to a Dropbox API path ("" is the root folder)."""
+        path = source.strip().strip("/")
+        return f"/{path}" if path else ""
+
+    def _iter_pages(self, path: str, cursor: Optional[str] = None) -> Iterator[Any]:
+        """Yield list_folder result pages, from the start or from a saved cursor."""
+        if cursor:
+            result = self.client.files_list_folder_continue(cursor)
+        else:
+            result = self.client.files_list_folder(path, recursive=True)
+        while True:
+            yield result
+            if not result.has_more:
+                return
+            result = self.client.files_list_folder_continue(result.cursor)
+
+    def _iter_entries(self, path: str) -> Iterator[Any]:
+        """Yield every entry below a folder, following list_folder cursors."""
+        for page in self._iter_pages(path):
+            yield from page.entries
+
+    def _is_selected(self, entry: Any) -> bool:
+        """Check whether a file entry has a loadable extension."""
+        file_type = Path(entry.name).suffix.lower()[1:]
+        if not file_type:
+            return False
+        return not self.extensions or file_type in self.extensions
+
+    def _download(self, entry: Any, local_path: Path) -> None:
+        """Stream a file to disk in chunks instead of holding it in memory."""
+        _, response = self._get_client().files_download(entry.id)
+        with closing(response), open(local_path, "wb") as f:
+            for chunk in response.iter_content(DOWNLOAD_CHUNK_SIZE):
+                f.write(chunk)
+
+    def _process_entry(self, entry: Any, root: str, temp_dir: str) -> List[Dict[str, Any]]:
+        """Download one file, parse it with its loader, and delete the local copy."""
+        file_type = Path(entry.name).suffix.lower()[1:]
         try:
-            # Import here to avoid circular dependency
-            from .directory import DirectoryLoader
+            loader = get_loader(file_type)
+        except ValueError:
+            logger.info(f"Skipping Dropbox file without a loader: {entry.path_display}")
+            return []
 
-            if source.startswith("/"):
-                source = source[1:]
+        # One directory per file keeps names (and extensions) intact without collisions
+        file_dir = Path(temp_dir) / hashlib.sha256(entry.id.encode()).hexdigest()[:16]
+        file_dir.mkdir()
+        local_path = file_dir / entry.name
+        try:
+            self._download(entry, local_path)
+            logger.info(f"Processing Dropbox file: {entry.path_display}")
+            try:
+                result = loader.load(str(local_path))
+            except Exception as e:
+                # Parsing the same bytes again would fail the same way
+                raise _UnparsableFile(str(e)) from e
+        finally:
+            shutil.rmtree(file_dir, ignore_errors=True)
 
-            # Create temporary directory
-            with tempfile.TemporaryDirectory() as temp_dir:
-                self._download_content(source, temp_dir)
+        file_meta = {
+            "source": "dropbox",
+            "dropbox_path": entry.path_display,
+            "file_path": entry.path_display[len(root):].lstrip("/"),
+            "dropbox_id": entry.id,
+            "content_hash": entry.content_hash,
+            "rev": entry.rev,
+            "size": entry.size,
+            "server_modified": entry.server_modified.isoformat() if entry.server_modified else None
+        }
+        documents = result.get("data", [result]) if isinstance(result, dict) else []
+        for index, document in enumerate(documents):
+            document["meta_data"] = {**document.get("meta_data", {}), **file_meta}
+            # Stable names let a changed file replace its own chunks
+            document["name"] = entry.id if len(documents) == 1 else f"{entry.id}_{index}"
+        return documents
 
-                # Use DirectoryLoader to process downloaded content
-                dir_loader = DirectoryLoader()
-                content = dir_loader.load(temp_dir)
+    def _process_entries(
+        self,
+        entries: Iterator[Any],
+        root: str,
+        failed: Optional[Dict[str, str]] = None,
+        unparsable: Optional[Dict[str, str]] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """Download and parse files concurrently, yielding each as it completes.
 
-                return content
+        At most ``2 * max_workers`` files are in flight, and every local copy
+        is deleted once parsed, so disk and memory use stay bounded. Files
+        that fail are logged and skipped. If ``failed`` or ``unparsable`` is
+        given, the paths of files whose download failed or whose loader
+        rejected them are also recorded in it by id.
+        """
+        in_flight: Dict[Future, Any] = {}
 
-        except Exception as e:
-            raise ValueError(f"Error loading from Dropbox: {str(e)}")
+        def collect(futures: List[Future]) -> Iterator[Dict[str, Any]]:
+            for future in futures:
+                entry = in_flight.pop(future)
+                try:
+                    yield from future.result()
+                except _UnparsableFile as e:
+                    logger.error(f"Error parsing Dropbox file {entry.path_display}: {str(e)}")
+                    if unparsable is not None:
+                        unparsable[entry.id] = entry.path_lower
+                except Exception as e:
+                    logger.error(f"Error processing Dropbox file {entry.path_display}: {str(e)}")
+                    if failed is not None:
+                        failed[entry.id] = entry.path_lower
+
+        with tempfile.TemporaryDirectory() as temp_dir, \
+                ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            pending = set()
+            for entry in entries:
+                future = executor.submit(self._process_entry, entry, root, temp_dir)
+                in_flight[future] = entry
+                pending.add(future)
+                if len(pending) >= 2 * self.max_workers:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    yield from collect(list(done))
+
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                yield from collect(list(done))
+
+    def lazy_load(self, source: str) -> Iterator[Dict[str, Any]]:
+        """Yield one document per Dropbox file as soon as it is downloaded.
+
+        In incremental mode only changed files are downloaded, and moves and
+        deletions are yielded as empty-content units (see ``_sync_folder``).
 
-    def _download_content(self, dbx_path: str, local_dir: str):
-        """Download content from Dropbox preserving structure."""
+        Args:
+            source: Dropbox folder path ("" or "/" for the whole Dropbox)
+        """
+        from dropbox.files import FileMetadata
+
+        root = self._normalize_path(source)
+        if self.incremental:
+            yield from self._sync_folder(root)
+            return
+
+        files = (
+            entry for entry in self._iter_entries(root)
+            if isinstance(entry, FileMetadata) and self._is_selected(entry)
+        )
+        yield from self._process_entries(files, root)
+
+    @staticmethod
+    def _change_event(event: str, file_id: str, path: str, previous_path: Optional[str] = None) -> Dict[str, Any]:
+        """Build an empty-content unit reporting a deleted or moved file."""
+        return {
+            "content": "",
+            "meta_data": {
+                "source": "dropbox",
+                "event": event,
+                "dropbox_id": file_id,
+                "dropbox_path": path,
+                "previous_path": previous_path
+            }
+        }
+
+    def _sync_folder(self, root: str) -> Iterator[Dict[str, Any]]:
+        """Yield only what changed under a folder since the stored cursor.
+
+        The first run lists the folder in full and stores the final cursor.
+        Later runs read files_list_folder_continue from that cursor. Files
+        whose content_hash matches a known file, including renamed or moved
+        ones, are not downloaded again; they and deletions are yielded as
+        empty-content "moved" and "deleted" units.
+
+        Files that fail to download are stored under "failed" and fetched
+        again by id on the next run, since the saved cursor no longer lists
+        them. Files their loader rejects are recorded with their
+        content_hash instead, so they are only tried again once changed.
+        """
+        from dropbox.exceptions import ApiError
+        from dropbox.files import DeletedMetadata, FileMetadata
+
+        state_key = f"folder:{root.lower()}"
+        sync_state = self.state.get(state_key) or {"cursor": None, "files": {}}
+        files: Dict[str, Dict[str, str]] = sync_state["files"]
+        previous_failed: Dict[str, str] = sync_state.get("failed", {})
+        failed: Dict[str, str] = {}
+        unparsable: Dict[str, str] = {}
+        # Deletions are held back until the listing ends, since a move shows
+        # up as a deletion plus a new entry in no guaranteed order
+        pending_deletes: Dict[str, Dict[str, str]] = {}
+        submitted: Dict[str, Dict[str, str]] = {}
+        retried: Set[str] = set()
+        listed_retries: Set[str] = set()
+        moved: List[Dict[str, Any]] = []
+        cursor_holder = {"cursor": sync_state["cursor"]}
+
+        def take_known(entry: Any) -> Optional[Dict[str, str]]:
+            known = files.get(entry.id) or pending_deletes.pop(entry.id, None)
+            if known:
+                return known
+            # Deleted and re-uploaded under a new id with identical content
+            for file_id, info in pending_deletes.items():
+                if info["content_hash"] == entry.content_hash:
+                    return pending_deletes.pop(file_id)
+            return None
+
+        def needs_download(entry: Any) -> bool:
+            known = take_known(entry)
+            if known and known["content_hash"] == entry.content_hash:
+                files[entry.id] = {"content_hash": entry.content_hash, "path": entry.path_lower}
+                if known["path"] != entry.path_lower:
+                    moved.append(self._change_event("moved", entry.id, entry.path_display, known["path"]))
+                return False
+            submitted[entry.id] = {"content_hash": entry.content_hash, "path": entry.path_lower}
+            return True
+
+        def retried_files() -> Iterator[Any]:
+            for file_id, path in previous_failed.items():
+                try:
+                    entry = self.client.files_get_metadata(file_id)
+                except ApiError as e:
+                    # Deleted or no longer accessible; the listing reports deletions
+                    logger.info(f"Not retrying Dropbox file {path}: {str(e)}")
+                    continue
+                except Exception as e:
+                    logger.error(f"Error fetching Dropbox file {path}: {str(e)}")
+                    failed[file_id] = path
+                    continue
+                in_root = not root or entry.path_lower.startswith(f"{root.lower()}/")
+                if isinstance(entry, FileMetadata) and self._is_selected(entry) and in_root:
+                    if needs_download(entry):
+                        retried.add(entry.id)
+                        yield entry
+
+        def changed_files() -> Iterator[Any]:
+            yield from retried_files()
+            for page in self._iter_pages(root, sync_state["cursor"]):
+                for entry in page.entries:
+                    if isinstance(entry, DeletedMetadata):
+                        prefix = entry.path_lower
+                        for file_id, info in list(files.items()):
+                            if info["path"] == prefix or info["path"].startswith(f"{prefix}/"):
+                                pending_deletes[file_id] = files.pop(file_id)
+                        continue
+                    if not isinstance(entry, FileMetadata) or not self._is_selected(entry):
+                        continue
+                    # Already fetched as a retry with its latest metadata
+                    if entry.id in retried:
+                        listed_retries.add(entry.id)
+                        continue
+                    if needs_download(entry):
+                        yield entry
+                cursor_holder["cursor"] = page.cursor
+
+        completed = False
+        try:
+            for document in self._process_entries(changed_files(), root, failed, unparsable):
+                file_id = document["meta_data"]["dropbox_id"]
+                files[file_id] = submitted[file_id]
+                yield document
+            for file_id in unparsable:
+                files[file_id] = submitted[file_id]
+
+            yield from moved
+            # A retried file that the listing shows as moved still exists
+            for file_id in listed_retries:
+                pending_deletes.pop(file_id, None)
+            for file_id, info in pending_deletes.items():
+                yield self._change_event("deleted", file_id, info["path"])
+            pending_deletes.clear()
+            completed = True
+        finally:
+            if completed:
+                sync_state["cursor"] = cursor_holder["cursor"]
+                sync_state["failed"] = failed
+            else:
+                # Keep files whose deletion was not reported yet
+                files.update(pending_deletes)
+                sync_state["failed"] = {**previous_failed, **failed}
+            self.state.set(state_key, sync_state)
+
+        logger.info(
+            f"Dropbox sync of {root or '/'}: {len(submitted) - len(failed)} downloaded, "
+            f"{len(moved)} moved, {len(failed)} failed, {len(unparsable)} unparsable"
+        )
+
+    def load(self, source: str) -> Any:
+        """Load content from Dropbox path.
+
+        Args:
+            source: Dropbox folder path
+
+        Returns:
+            Dict containing document ID and one entry per file document
+        """
         try:
-            result = self.client.files_list_folder(dbx_path)
+            data = []
+            events = []
+            for item in self.lazy_load(source):
+                (events if "event" in item["meta_data"] else data).append(item)
 
-            for entry in result.entries:
-                local_path = Path(local_dir) / entry.name
+            if not data and not self.incremental:
+                raise ValueError(f"No valid files found in Dropbox folder: {source}")
 
-                if hasattr(entry, "is_dir") and entry.is_dir:
-                    local_path.mkdir(exist_ok=True)
-                    self._download_content(entry.path_display, str(local_path))
-                else:
-                    with open(local_path, "wb") as f:
-                        metadata, response = self.client.files_download(entry.path_display)
-                        f.write(response.content)
+            # Generate document ID
+            doc_id = hashlib.sha256(
+                (source + "".join(item["meta_data"]["content_hash"] for item in data)).encode()
+            ).hexdigest()[:16]
+
+            result = {
+                "doc_id": doc_id,
+                "data": data
+            }
+            if self.incremental:
+                result["meta_data"] = {
+                    "moved_files": [e["meta_data"] for e in events if e["meta_data"]["event"] == "moved"],
+                    "deleted_files": [e["meta_data"] for e in events if e["meta_data"]["event"] == "deleted"]
+                }
+            return result
 
         except Exception as e:
-            raise ValueError(f"Error downloading from Dropbox: {str(e)}")
\ No newline at end of file
+            raise ValueError(f"Error loading from Dropbox: {str(e)}")
@@ -1,6 +1,7 @@
 """Excel file loader implementation."""
 import hashlib
-from typing import Any, Dict, Optional
+import itertools
+from typing import Any, BinaryIO, Dict, Iterator, List, Tuple, Optional, Union
 from pathlib import Path
 import pandas as pd
 import logging
@@ -8,12 +9,158 @@ from ..utils.base import BaseLoader
 
 logger = logging.getLogger(__name__)
 
+# .xlsx workbooks are zip archives; legacy .xls files are OLE2 documents
+# that openpyxl cannot read
+ZIP_SIGNATURE = b"PK\x03\x04"
+
 class ExcelLoader(BaseLoader):
     """Loader for Excel files (.xls and .xlsx)."""
 
     def __init__(self, config: Optional[Dict[str, Any]] = None):
-        """Initialize Excel loader with optional configuration."""
+        """Initialize Excel loader with optional configuration.
+
+        Optional config:
+        - streaming: Iterate .xlsx rows with openpyxl in read-only mode instead
+          of building a DataFrame per sheet (default False); .xls files are
+          always read through pandas
+        - group_size: Rows per document yielded by lazy_load in streaming mode (default 1000)
+        """
         super().__init__(config)
+        self.streaming = self.config.get('streaming', False)
+        self.group_size = self.config.get('group_size', 1000)
+
+    @staticmethod
+    def _format_rows(df: pd.DataFrame) -> pd.Series:
+        """Format every row as "column: value" pairs using column-wise string ops."""
+        rows = pd.Series("", index=df.index, dtype=object)
+        for col in df.columns:
+            values = df[col]
+            present = values.notna()
+            cells = (f"{col}: " + values.astype(str)).where(present, "")
+            separator = pd.Series(" | ", index=df.index).where((rows != "") & present, "")
+            rows = rows + separator + cells
+        return rows[rows != ""]
+
+    @staticmethod
+    def _is_xlsx(workbook: Union[str, BinaryIO]) -> bool:
+        """Check whether a workbook path or stream is an .xlsx (zip) file."""
+        if isinstance(workbook, str):
+            with open(workbook, 'rb') as f:
+                return f.read(len(ZIP_SIGNATURE)) == ZIP_SIGNATURE
+        position = workbook.tell()
+        signature = workbook.read(len(ZIP_SIGNATURE))
+        workbook.seek(position)
+        return signature == ZIP_SIGNATURE
+
+    def _read_sheet(self, excel_file: pd.ExcelFile, sheet_name: str) -> Tuple[str, Dict[str, Any]]:
+        """Read one sheet of an open workbook into its text block and sheet info."""
+        df = excel_file.parse(sheet_name=sheet_name)
+        columns = [str(col) for col in df.columns]
+
+        content_parts = [
+            # Add sheet header
+            f"\n=== Sheet: {sheet_name} ===\n",
+            # Add column names
+            "Columns: " + ", ".join(columns),
+            *self._format_rows(df)
+        ]
+        return "\n".join(content_parts), {
+            "name": sheet_name,
+            "rows": len(df),
+            "columns": columns
+        }
+
+    def _iter_sheet_rows(self, workbook: Union[str, BinaryIO]) -> Iterator[Tuple[str, List[str], Iterator[str]]]:
+        """Yield (sheet name, columns, formatted rows) using openpyxl read-only iteration."""
+        from openpyxl import load_workbook
+
+        wb = load_workbook(workbook, read_only=True, data_only=True)
+        try:
+            for sheet in wb.worksheets:
+                rows = sheet.iter_rows(values_only=True)
+                header = next(rows, ())
+                columns = [
+                    str(value) if value is not None else f"Unnamed: {i}"
+                    for i, value in enumerate(header)
+                ]
+
+                def format_rows(rows=rows, columns=columns) -> Iterator[str]:
+                    for values in rows:
+                        line = " | ".join(
+                            f"{col}: {value}"
+                            for col, value in zip(columns, values)
+                            if value is not None
+                        )
+                        if line:
+                            yield line
+
+                yield sheet.title, columns, format_rows()
+        finally:
+            wb.close()
+
+    def _read_workbook(self, workbook: Union[str, BinaryIO]) -> Tuple[str, List[Dict[str, Any]]]:
+        """Convert every sheet of a workbook path or stream to text."""
+        if self.streaming and self._is_xlsx(workbook):
+            content_parts = []
+            sheet_info = []
+            for sheet_name, columns, rows in self._iter_sheet_rows(workbook):
+                content_parts.append(f"\n=== Sheet: {sheet_name} ===\n")
+                content_parts.append("Columns: " + ", ".join(columns))
+                row_count = len(content_parts)
+                content_parts.extend(rows)
+                sheet_info.append({
+                    "name": sheet_name,
+                    "rows": len(content_parts) - row_count,
+                    "columns": columns
+                })
+            return "\n".join(content_parts), sheet_info
+
+        # Parse the workbook (and its shared strings) once for all sheets
+        with pd.ExcelFile(workbook) as excel_file:
+            sheets = [self._read_sheet(excel_file, name) for name in excel_file.sheet_names]
+
+        return "\n".join(text for text, _ in sheets), [info for _, info in sheets]
+
+    def lazy_load(self, source: str) -> Iterator[Dict[str, Any]]:
+        """Yield a workbook in row groups when streaming, else as one document.
+
+        In streaming mode each document holds at most ``group_size`` rows of a
+        single sheet, so memory use does not grow with the workbook size.
+        Legacy .xls files are not streamable and load as one document.
+
+        Args:
+            source: Path to Excel file
+        """
+        path = Path(source)
+        if not self.streaming or not path.exists() or not self._is_xlsx(str(path)):
+            yield self.load(source)
+            return
+
+        for sheet_name, columns, rows in self._iter_sheet_rows(str(path)):
+            header = f"=== Sheet: {sheet_name} ===\nColumns: {', '.join(columns)}"
+            row_start = 0
+            group_index = 0
+            while True:
+                lines = list(itertools.islice(rows, self.group_size))
+                if not lines and group_index > 0:
+                    break
+                yield {
+                    "content": "\n".join([header, *lines]),
+                    "meta_data": {
+                        "source": str(path),
+                        "type": "excel",
+                        "file_name": path.name,
+                        "sheet": sheet_name,
+                        "columns": columns,
+                        "group_index": group_index,
+                        "row_start": row_start,
+                        "row_count": len(lines)
+                    }
+                }
+                if len(lines) < self.group_size:
+                    break
+                row_start += len(lines)
+                group_index += 1
 
     def load(self, source: str) -> Dict[str, Any]:
         """Load and process Excel file content.
@@ -32,31 +179,7 @@ class ExcelLoader(BaseLoader):
                 raise ValueError(f"Excel file not found: {source}")
 
             # Read all sheets
-            excel_file = pd.ExcelFile(str(path))
-            content_parts = []
-            sheet_info = []
-
-            for sheet_name in excel_file.sheet_names:
-                df = pd.read_excel(excel_file, sheet_name=sheet_name)
-                sheet_info.append({
-                    "name": sheet_name,
-                    "rows": len(df),
-                    "columns": list(df.columns)
-                })
-
-                # Add sheet header
-                content_parts.append(f"\n=== Sheet: {sheet_name} ===\n")
-
-                # Add column names
-                content_parts.append("Columns: " + ", ".join(df.columns))
-
-                # Convert each row to text
-                for idx, row in df.iterrows():
-                    row_text = " | ".join([f"{col}: {value}" for col, value in row.items() if pd.notna(value)])
-                    content_parts.append(row_text)
-
-            # Join all content
-            content = "\n".join(content_parts)
+            content, sheet_info = self._read_workbook(str(path))
 
             # Generate document ID
             doc_id = hashlib.sha256(
@@ -79,4 +202,38 @@ class ExcelLoader(BaseLoader):
 
         except Exception as e:
             logger.error(f"Error loading Excel file: {str(e)}")
-            raise ValueError(f"Error loading Excel file: {str(e)}")
\ No newline at end of file
+            raise ValueError(f"Error loading Excel file: {str(e)}")
+
+    def load_stream(self, stream: BinaryIO, name: str) -> Dict[str, Any]:
+        """Load and process Excel content from an in-memory stream.
+
+        Args:
+            stream: Binary file-like object containing the workbook
+            name: File name used for metadata and the document ID
+
+        Returns:
+            Dict containing:
+                - content: Processed Excel content as text
+                - meta_data: Dictionary of metadata about the content
+        """
+        try:
+            content, sheet_info = self._read_workbook(stream)
+            doc_id = hashlib.sha256(
+                (name + content[:100]).encode()
+            ).hexdigest()[:16]
+
+            return {
+                "content": content,
+                "meta_data": {
+                    "doc_id": doc_id,
+                    "source": name,
+                    "type": "excel",
+                    "file_name": name,
+                    "sheets": sheet_info,
+                    "total_sheets": len(sheet_info)
+                }
+            }
+
+        except Exception as e:
+            logger.error(f"Error loading Excel stream {name}: {str(e)}")
+            raise ValueError(f"Error loading Excel file: {str(e)}")
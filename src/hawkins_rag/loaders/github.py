@@ -1,14 +1,40 @@
 """GitHub content loader implementation."""
+import io
+import json
+import base64
 import hashlib
 import logging
+import tarfile
+import tempfile
+import threading
 import time
-from typing import Any, Dict, List, Optional, cast
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional, Tuple, cast
+import requests
 from github import Github, GithubException, UnknownObjectException
 from requests.exceptions import RequestException
 from ..utils.base import BaseLoader
+from ..utils.loader_registry import get_loader
+from ..utils.rate_limit import RateLimiter
+from ..utils.sync_state import SyncStateStore
 
 logger = logging.getLogger(__name__)
 
+GITHUB_API_URL = "https://api.github.com"
+# The compare API lists at most this many changed files
+COMPARE_FILE_LIMIT = 300
+# Items per page for PyGithub paginated lists
+PER_PAGE = 100
+
+# Binary formats handed to the matching HawkinsRAG loader's load_stream
+EXTENSION_LOADERS = {
+    'pdf': 'pdf',
+    'docx': 'docx',
+    'xlsx': 'excel',
+    'xls': 'excel',
+}
+
 class GithubLoader(BaseLoader):
     """Loader for GitHub content."""
 
@@ -16,6 +42,22 @@ class GithubLoader(BaseLoader):
         """Initialize GitHub loader with configuration."""
         super().__init__(config)
         config = config or {}
+        self.token = config.get('token')
+        self.max_workers = config.get('max_workers', 8)
+        self.max_file_size = config.get('max_file_size', 1024 * 1024)
+        self.extensions = config.get('extensions')
+        self.include_paths = config.get('include_paths')
+        self.exclude_paths = config.get('exclude_paths', [])
+        self.archive_format = config.get('archive_format', 'tarball')
+        self.search_limit = config.get('search_limit', 100)
+        self.rate_limiter = RateLimiter(config.get('requests_per_second', 10))
+
+        # Incremental mode diffs against the last ingested commit per repo/branch
+        state_path = config.get('state_path')
+        self.state = SyncStateStore(state_path) if state_path else None
+        self.incremental = config.get('incremental', False)
+        if self.incremental and not self.state:
+            raise ValueError("Incremental GitHub sync requires config['state_path']")
 
         if 'token' not in config:
             raise ValueError(
@@ -29,7 +71,7 @@ class GithubLoader(BaseLoader):
                 login_or_token=config['token'],
                 timeout=30,
                 retry=3,
-                per_page=100  # Increase items per page for efficiency
+                per_page=PER_PAGE  # Increase items per page for efficiency
             )
             self._test_connection()
         except Exception as e:
@@ -149,12 +191,374 @@ class GithubLoader(BaseLoader):
 
         raise ValueError("Failed to fetch file content after maximum retries")
 
+    def _resolve_commit(self, repo: Any, branch: Optional[str]) -> Tuple[str, str]:
+        """Resolve a branch (or the default branch) to its head commit SHA."""
+        ref = branch or repo.default_branch
+        self.rate_limiter.wait()
+        return ref, repo.get_commit(ref).sha
+
+    def _get_tree(self, repo: Any, commit_sha: str) -> Tuple[Dict[str, Dict[str, Any]], bool]:
+        """Resolve the full git tree of a commit in a single API call.
+
+        Returns:
+            Blob SHA and size keyed by path, and whether GitHub truncated
+            the tree listing
+        """
+        self.rate_limiter.wait()
+        tree = repo.get_git_tree(commit_sha, recursive=True)
+        truncated = bool(tree.raw_data.get('truncated'))
+        if truncated:
+            logger.warning(f"Git tree for {repo.full_name} is truncated; filtering on archive members only")
+        blobs = {
+            element.path: {"sha": element.sha, "size": element.size}
+            for element in tree.tree
+            if element.type == "blob"
+        }
+        return blobs, truncated
+
+    def _is_selected(self, path: str, size: Optional[int] = None, prefix: Optional[str] = None) -> bool:
+        """Apply path, extension and size filters to a repository file."""
+        if prefix and not path.startswith(prefix):
+            return False
+        if self.include_paths and not any(path.startswith(p) for p in self.include_paths):
+            return False
+        if any(path.startswith(p) for p in self.exclude_paths):
+            return False
+        if self.extensions:
+            extension = path.rsplit('.', 1)[-1].lower() if '.' in path else ''
+            if extension not in self.extensions:
+                return False
+        if size is not None and size > self.max_file_size:
+            return False
+        return True
+
+    def _iter_archive(self, repo: Any, commit_sha: str) -> Iterator[Tuple[str, bytes]]:
+        """Download the repository archive once and yield (path, bytes) per file.
+
+        Tarballs are read as a stream; zipballs need random access and are
+        spooled to a temporary file first. The archive's top-level
+        ``owner-repo-sha/`` directory is stripped from member paths.
+        """
+        self.rate_limiter.wait()
+        url = repo.get_archive_link(self.archive_format, ref=commit_sha)
+        headers = {"Authorization": f"token {self.token}"} if self.token else {}
+        self.rate_limiter.wait()
+
+        with requests.get(url, headers=headers, stream=True, timeout=60) as response:
+            response.raise_for_status()
+
+            if self.archive_format == 'tarball':
+                response.raw.decode_content = True
+                with tarfile.open(fileobj=response.raw, mode='r|gz') as archive:
+                    for member in archive:
+                        if not member.isfile():
+                            continue
+                        path = member.name.split('/', 1)[-1]
+                        if not self._is_selected(path, member.size):
+                            continue
+                        extracted = archive.extractfile(member)
+                        if extracted:
+                            yield path, extracted.read()
+            else:
+                with tempfile.SpooledTemporaryFile(max_size=64 * 1024 * 1024) as spool:
+                    for block in response.iter_content(chunk_size=1024 * 1024):
+                        spool.write(block)
+                    spool.seek(0)
+                    with zipfile.ZipFile(spool) as archive:
+                        for info in archive.infolist():
+                            if info.is_dir():
+                                continue
+                            path = info.filename.split('/', 1)[-1]
+                            if not self._is_selected(path, info.file_size):
+                                continue
+                            yield path, archive.read(info)
+
+    def _process_member(self, path: str, data: bytes) -> Optional[Dict[str, Any]]:
+        """Convert one repository file to text using the matching loader."""
+        try:
+            extension = path.rsplit('.', 1)[-1].lower() if '.' in path else ''
+            loader_type = EXTENSION_LOADERS.get(extension)
+            if loader_type:
+                content = get_loader(loader_type).load_stream(io.BytesIO(data), path)['content']
+            else:
+                try:
+                    content = data.decode('utf-8')
+                except UnicodeDecodeError:
+                    logger.debug(f"Skipping binary file: {path}")
+                    return None
+
+            if not content.strip():
+                return None
+            return {"path": path, "content": content}
+
+        except Exception as e:
+            logger.warning(f"Failed to process {path}: {str(e)}")
+            return None
+
+    def _process_archive(self, members: Iterator[Tuple[str, bytes]]) -> List[Dict[str, Any]]:
+        """Parse archive members on a thread pool while the download streams.
+
+        At most ``2 * max_workers`` members are held in memory at once.
+        """
+        in_flight = threading.BoundedSemaphore(self.max_workers * 2)
+        futures = []
+
+        def process(path: str, data: bytes) -> Optional[Dict[str, Any]]:
+            try:
+                return self._process_member(path, data)
+            finally:
+                in_flight.release()
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for path, data in members:
+                in_flight.acquire()
+                futures.append(executor.submit(process, path, data))
+
+        return [f.result() for f in futures if f.result()]
+
+    def _load_repository(
+        self,
+        source: str,
+        repo_name: str,
+        branch: Optional[str],
+        prefix: Optional[str],
+        commit_sha: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Load every selected file of a repository from a single archive download."""
+        try:
+            self.rate_limiter.wait()
+            repo = self.client.get_repo(repo_name)
+        except UnknownObjectException:
+            raise ValueError(f"Repository not found or not accessible: {repo_name}")
+
+        if commit_sha:
+            ref = branch or repo.default_branch
+        else:
+            ref, commit_sha = self._resolve_commit(repo, branch)
+        tree, truncated = self._get_tree(repo, commit_sha)
+        selected = {
+            path: blob for path, blob in tree.items()
+            if self._is_selected(path, blob['size'], prefix)
+        }
+        logger.info(f"Selected {len(selected)} of {len(tree)} files from {repo_name}@{commit_sha[:7]}")
+
+        members = (
+            (path, data) for path, data in self._iter_archive(repo, commit_sha)
+            if path in selected or (truncated and self._is_selected(path, prefix=prefix))
+        )
+        files = self._process_archive(members)
+        for f in files:
+            f['sha'] = selected.get(f['path'], {}).get('sha')
+
+        return self._build_repository_result(source, repo_name, ref, commit_sha, files)
+
+    def _build_repository_result(
+        self,
+        source: str,
+        repo_name: str,
+        ref: str,
+        commit_sha: str,
+        files: List[Dict[str, Any]],
+        extra_meta: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Combine processed repository files into the loader result."""
+        all_content = [f"### File: {f['path']}\n\n{f['content']}" for f in files]
+        combined_content = "\n\n=== FILE SEPARATOR ===\n\n".join(all_content)
+
+        doc_id = hashlib.sha256(
+            f"{repo_name}@{commit_sha}".encode()
+        ).hexdigest()[:16]
+
+        return {
+            "content": combined_content,
+            "meta_data": {
+                "doc_id": doc_id,
+                "source": source,
+                "type": "github",
+                "repository": repo_name,
+                "branch": ref,
+                "commit_sha": commit_sha,
+                "file_count": len(files),
+                "files": [{"path": f['path'], "sha": f.get('sha')} for f in files],
+                **(extra_meta or {})
+            }
+        }
+
+    def _api_get(self, path: str, accept: str = "application/vnd.github+json", cache: bool = False) -> str:
+        """GET a REST API path, optionally through the persisted ETag cache.
+
+        Cached responses are revalidated with If-None-Match; GitHub answers
+        unchanged resources with 304, which does not count against the rate
+        limit.
+        """
+        url = f"{GITHUB_API_URL}{path}"
+        headers = {"Accept": accept}
+        if self.token:
+            headers["Authorization"] = f"token {self.token}"
+
+        etags = self.state.get('etags', {}) if cache else {}
+        cached = etags.get(url)
+        if cached:
+            headers["If-None-Match"] = cached["etag"]
+
+        self.rate_limiter.wait()
+        response = requests.get(url, headers=headers, timeout=30)
+        if response.status_code == 304 and cached:
+            return cached["body"]
+        response.raise_for_status()
+
+        if cache and response.headers.get("ETag"):
+            etags[url] = {"etag": response.headers["ETag"], "body": response.text}
+            self.state.set('etags', etags)
+        return response.text
+
+    def _get_blob(self, repo_name: str, path: str, blob_sha: str) -> Optional[Dict[str, Any]]:
+        """Fetch one blob by SHA and convert it to text, raising on API errors.
+
+        Returns None for files that are too large, binary or empty.
+        """
+        blob = json.loads(self._api_get(f"/repos/{repo_name}/git/blobs/{blob_sha}"))
+        if blob.get('size', 0) > self.max_file_size:
+            return None
+        result = self._process_member(path, base64.b64decode(blob['content']))
+        if result:
+            result['sha'] = blob_sha
+        return result
+
+    def _fetch_blob(self, repo_name: str, path: str, blob_sha: str) -> Optional[Dict[str, Any]]:
+        """Fetch one blob by SHA and convert it to text."""
+        try:
+            return self._get_blob(repo_name, path, blob_sha)
+        except Exception as e:
+            logger.warning(f"Failed to fetch {path} ({blob_sha}): {str(e)}")
+            return None
+
+    def _sync_repository(self, source: str, repo_name: str, branch: Optional[str], prefix: Optional[str]) -> Dict[str, Any]:
+        """Load only the files changed since the last ingested commit."""
+        if not branch:
+            branch = json.loads(self._api_get(f"/repos/{repo_name}", cache=True))['default_branch']
+
+        state_key = f"repo:{repo_name}@{branch}:{prefix or ''}"
+        sync_state = self.state.get(state_key)
+
+        # A 304 here means no new commits and costs no rate limit
+        commit_sha = self._api_get(
+            f"/repos/{repo_name}/commits/{branch}",
+            accept="application/vnd.github.sha",
+            cache=True
+        ).strip()
+
+        if sync_state and sync_state['commit_sha'] == commit_sha and not sync_state.get('failed'):
+            logger.info(f"{repo_name}@{branch} unchanged at {commit_sha[:7]}")
+            return self._build_repository_result(source, repo_name, branch, commit_sha, [], {
+                "sync_mode": "incremental",
+                "base_sha": commit_sha,
+                "removed_paths": []
+            })
+
+        comparison = None
+        if sync_state:
+            comparison = json.loads(self._api_get(
+                f"/repos/{repo_name}/compare/{sync_state['commit_sha']}...{commit_sha}"
+            ))
+            if comparison.get('status') not in ('ahead', 'identical') or \
+                    len(comparison.get('files', [])) >= COMPARE_FILE_LIMIT:
+                logger.info(f"Diff for {repo_name} is not a fast-forward or too large; reloading archive")
+                comparison = None
+
+        if comparison is None:
+            result = self._load_repository(source, repo_name, branch, prefix, commit_sha)
+            known = set(sync_state['files']) if sync_state else set()
+            files = {f['path']: f['sha'] for f in result['meta_data']['files']}
+            result['meta_data'].update({
+                "sync_mode": "full",
+                "removed_paths": sorted(known - set(files))
+            })
+            self.state.set(state_key, {"commit_sha": commit_sha, "files": files, "failed": {}})
+            return result
+
+        known_files: Dict[str, Optional[str]] = sync_state['files']
+        # Files whose fetch failed in an earlier sync, retried unless the diff supersedes them
+        failed_files: Dict[str, str] = dict(sync_state.get('failed', {}))
+        removed = []
+        to_fetch = []
+        for changed in comparison.get('files', []):
+            path = changed['filename']
+            failed_files.pop(path, None)
+            if changed['status'] == 'renamed':
+                failed_files.pop(changed.get('previous_filename'), None)
+            if changed['status'] == 'renamed' and changed.get('previous_filename') in known_files:
+                known_files.pop(changed['previous_filename'])
+                removed.append(changed['previous_filename'])
+            if changed['status'] == 'removed':
+                if path in known_files:
+                    known_files.pop(path)
+                    removed.append(path)
+            elif self._is_selected(path, prefix=prefix):
+                to_fetch.append((path, changed['sha']))
+            elif path in known_files:
+                known_files.pop(path)
+                removed.append(path)
+
+        to_fetch.extend(failed_files.items())
+        logger.info(
+            f"{repo_name} {sync_state['commit_sha'][:7]}..{commit_sha[:7]}: "
+            f"{len(to_fetch)} changed, {len(removed)} removed"
+        )
+
+        def fetch(item: Tuple[str, str]) -> Tuple[str, str, Optional[Dict[str, Any]], bool]:
+            path, blob_sha = item
+            try:
+                return path, blob_sha, self._get_blob(repo_name, path, blob_sha), False
+            except Exception as e:
+                logger.warning(f"Failed to fetch {path} ({blob_sha}), will retry next sync: {str(e)}")
+                return path, blob_sha, None, True
+
+        files = []
+        failed_files = {}
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for path, blob_sha, f, error in executor.map(fetch, to_fetch):
+                if error:
+                    failed_files[path] = blob_sha
+                elif f:
+                    known_files[path] = blob_sha
+                    files.append(f)
+                elif path in known_files:
+                    # Grew past max_file_size or became binary/empty
+                    known_files.pop(path)
+                    removed.append(path)
+
+        self.state.set(state_key, {"commit_sha": commit_sha, "files": known_files, "failed": failed_files})
+
+        return self._build_repository_result(source, repo_name, branch, commit_sha, files, {
+            "sync_mode": "incremental",
+            "base_sha": sync_state['commit_sha'],
+            "removed_paths": removed,
+            "failed_paths": sorted(failed_files)
+        })
+
     def load(self, source: str) -> Dict[str, Any]:
-        """Load GitHub content based on source specification."""
+        """Load GitHub content based on source specification.
+
+        Args:
+            source: "repo:username/repo[/path][@branch]". A file path loads
+                that file; no path, or a path ending in "/", loads every
+                matching file of the repository from one archive download.
+                "search:<query>" loads the files matched by a code search.
+
+        Returns:
+            Dict containing:
+                - content: File content, or combined content of all files
+                - meta_data: Repository and file metadata
+        """
         try:
+            if source.startswith("search:"):
+                return self._load_search(source, source[7:])
+
             if not source.startswith("repo:"):
                 raise ValueError(
-                    'Invalid source format. Use "repo:username/repo[/path][@branch]" format'
+                    'Invalid source format. Use "repo:username/repo[/path][@branch]" '
+                    'or "search:<code search query>" format'
                 )
 
             repo_query = source[5:]  # Remove 'repo:' prefix
@@ -170,16 +574,16 @@ class GithubLoader(BaseLoader):
 
             logger.info(f"Loading from repository: {repo_name} (branch: {branch}, path: {path})")
 
-            if not path:
-                return cast(Dict[str, Any], {
-                    "content": "", 
-                    "meta_data": {
-                        "source": source, 
-                        "error": "No file path specified",
-                        "type": "github",
-                        "repository": repo_name
-                    }
-                })
+            if not path or path.endswith("/"):
+                # Repository mode: whole repo, or every file under a directory prefix
+                start_time = time.time()
+                if self.incremental:
+                    result = self._sync_repository(source, repo_name, branch, path)
+                else:
+                    result = self._load_repository(source, repo_name, branch, path)
+                result["meta_data"]["load_time"] = time.time() - start_time
+                logger.info(f"Repository loaded in {result['meta_data']['load_time']:.2f} seconds")
+                return cast(Dict[str, Any], result)
 
             start_time = time.time()
             result = self._get_file_content(repo_name, path, branch)
@@ -211,32 +615,71 @@ class GithubLoader(BaseLoader):
             raise ValueError(f"GitHub loader failed: {str(e)}")
 
     def _search_code(self, query: str) -> List[Dict[str, Any]]:
-        """Search GitHub code."""
-        try:
-            results = []
-            code_results = self.client.search_code(query)
+        """Search GitHub code and fetch the matching file contents.
 
-            for item in code_results:
-                try:
-                    content = item.decoded_content.decode('utf-8')
-                    metadata = {
-                        "url": item.html_url,
-                        "repository": item.repository.full_name,
-                        "path": item.path,
-                        "sha": item.sha
-                    }
-                    results.append({
-                        "content": content,
-                        "meta_data": metadata
-                    })
-                except Exception as e:
-                    logger.warning(f"Failed to process code result {item.html_url}: {str(e)}")
+        Hits are capped at ``search_limit`` unique blobs and deduplicated by
+        blob SHA, so a file vendored into many repositories is fetched once.
+        Contents are fetched concurrently under the loader's rate limiter.
+        """
+        try:
+            hits = []
+            seen_shas = set()
+            self.rate_limiter.wait()
+            for index, item in enumerate(self.client.search_code(query)):
+                if len(hits) >= self.search_limit:
+                    break
+                if index % PER_PAGE == PER_PAGE - 1:
+                    # Last item of a page: the next one triggers a page request
+                    self.rate_limiter.wait()
+                if item.sha in seen_shas:
                     continue
-
-            return results
+                seen_shas.add(item.sha)
+                hits.append({
+                    "url": item.html_url,
+                    "repository": item.repository.full_name,
+                    "path": item.path,
+                    "sha": item.sha
+                })
         except GithubException as e:
             logger.error(f"GitHub API error in code search: {str(e)}")
             raise ValueError(f"GitHub code search failed: {str(e)}")
 
+        def fetch(hit: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+            blob = self._fetch_blob(hit['repository'], hit['path'], hit['sha'])
+            if not blob:
+                logger.warning(f"Failed to process code result {hit['url']}")
+                return None
+            return {"content": blob['content'], "meta_data": hit}
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            return [result for result in executor.map(fetch, hits) if result]
+
+    def _load_search(self, source: str, query: str) -> Dict[str, Any]:
+        """Load the files matching a code search query."""
+        logger.info(f"Searching GitHub code: {query}")
+        results = self._search_code(query)
+
+        all_content = [
+            f"### File: {r['meta_data']['repository']}/{r['meta_data']['path']}\n\n{r['content']}"
+            for r in results
+        ]
+        combined_content = "\n\n=== FILE SEPARATOR ===\n\n".join(all_content)
+
+        doc_id = hashlib.sha256(
+            (source + "".join(r['meta_data']['sha'] for r in results)).encode()
+        ).hexdigest()[:16]
+
+        return {
+            "content": combined_content,
+            "meta_data": {
+                "doc_id": doc_id,
+                "source": source,
+                "type": "github",
+                "search_query": query,
+                "result_count": len(results),
+                "files": [r['meta_data'] for r in results]
+            }
+        }
+
 # For backward compatibility and explicit exports
 __all__ = ['GithubLoader']
\ No newline at end of file
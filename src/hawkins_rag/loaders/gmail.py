@@ -1,14 +1,31 @@
 """Gmail content loader implementation."""
 import os
+import json
+import time
 import hashlib
-from typing import Any, Optional, Dict
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Optional, Dict, List
 from base64 import urlsafe_b64decode
 import logging
 from ..utils.base import BaseLoader
+from ..utils.sync_state import SyncStateStore
 from ..utils.google_auth import get_google_oauth_config, initialize_oauth_flow, handle_oauth_error
 
 logger = logging.getLogger(__name__)
 
+# Gmail accepts at most 100 calls per batch request
+MAX_BATCH_SIZE = 100
+# Upper bound for a single messages().list page
+LIST_PAGE_SIZE = 500
+# Headers requested when fetching message metadata only
+METADATA_HEADERS = ['From', 'To', 'Subject', 'Date']
+# Statuses (and 403 reasons) of batched calls worth retrying
+RETRY_STATUSES = (429, 500, 503)
+RATE_LIMIT_REASONS = ('rateLimitExceeded', 'userRateLimitExceeded')
+# Slack subtracted from the last sync time when matching new messages to the query
+QUERY_WINDOW_MARGIN = 24 * 60 * 60
+
 class GmailLoader(BaseLoader):
     """Loader for Gmail messages with OAuth2 authentication."""
 
@@ -17,6 +34,21 @@ class GmailLoader(BaseLoader):
         super().__init__(config)
         self.config = config or {}
         self.service = None
+        self.credentials = None
+        self.batch_size = min(self.config.get('batch_size', MAX_BATCH_SIZE), MAX_BATCH_SIZE)
+        self.max_workers = self.config.get('max_workers', 4)
+        self.max_retries = self.config.get('max_retries', 3)
+        self._local = threading.local()
+
+        # Optional state file used to skip messages ingested by earlier runs
+        state_path = self.config.get('state_path')
+        self.state = SyncStateStore(state_path) if state_path else None
+
+        # Incremental mode syncs through the history API after the first run
+        self.incremental = self.config.get('incremental', False)
+        if self.incremental and not self.state:
+            raise ValueError("Incremental Gmail sync requires config['state_path']")
+
         self._initialize_service()
 
     def _initialize_service(self) -> None:
@@ -52,6 +84,7 @@ class GmailLoader(BaseLoader):
                         raise ValueError("Failed to initialize OAuth flow")
 
             # Create Gmail API service
+            self.credentials = creds
             self.service = build('gmail', 'v1', credentials=creds)
             logger.info("Gmail API service initialized successfully")
 
@@ -113,97 +146,467 @@ class GmailLoader(BaseLoader):
             logger.error(f"Error decoding message: {str(e)}")
             return {"content": "", "headers": {}, "error": str(e)}
 
-    def load(self, source: str) -> Dict[str, Any]:
-        """Load Gmail messages matching the search query.
-
-        Args:
-            source: Gmail search query (e.g., 'from:example@gmail.com')
+    def _get_http(self):
+        """Get an authorized HTTP object for the current thread.
 
-        Returns:
-            Dict containing:
-                - content: Processed email content
-                - meta_data: Email metadata and stats
+        httplib2 connections are not thread-safe, so every worker executing
+        batch requests gets its own transport.
         """
-        try:
-            if not self.service:
-                self._initialize_service()
-
-            # Search for messages
-            logger.info(f"Searching Gmail with query: {source}")
-            results = self.service.users().messages().list(
+        http = getattr(self._local, 'http', None)
+        if http is None:
+            import httplib2
+            from google_auth_httplib2 import AuthorizedHttp
+            http = AuthorizedHttp(self.credentials, http=httplib2.Http())
+            self._local.http = http
+        return http
+
+    def _list_messages(self, query: str, max_results: Optional[int] = None) -> List[Dict[str, Any]]:
+        """List all messages matching the query, following nextPageToken."""
+        messages = []
+        page_token = None
+
+        while True:
+            page_size = LIST_PAGE_SIZE
+            if max_results:
+                page_size = min(page_size, max_results - len(messages))
+
+            response = self.service.users().messages().list(
                 userId='me',
-                q=source,
-                maxResults=self.config.get('max_results', 100)
+                q=query,
+                maxResults=page_size,
+                pageToken=page_token
             ).execute()
 
-            messages = results.get('messages', [])
-            if not messages:
-                logger.warning("No messages found matching the query")
-                return {
-                    "content": "",
-                    "meta_data": {
-                        "query": source,
-                        "message_count": 0,
-                        "type": "gmail"
-                    }
-                }
+            messages.extend(response.get('messages', []))
+            page_token = response.get('nextPageToken')
 
-            # Process messages
-            all_content = []
-            processed_messages = []
-
-            for msg in messages:
-                try:
-                    # Get full message details
-                    full_msg = self.service.users().messages().get(
-                        userId='me',
-                        id=msg['id'],
-                        format='full'
-                    ).execute()
-
-                    # Decode message content
-                    decoded = self._decode_message(full_msg)
-                    if decoded['content']:
-                        all_content.append(decoded['content'])
-                        processed_messages.append({
-                            "message_id": msg['id'],
-                            "thread_id": full_msg.get('threadId'),
-                            "headers": decoded['headers'],
-                            "has_attachments": decoded.get('has_attachments', False),
-                            "attachment_count": decoded.get('attachment_count', 0),
-                            "labels": full_msg.get('labelIds', []),
-                            "date": decoded['headers'].get('date'),
-                            "snippet": full_msg.get('snippet', '')
-                        })
+            if not page_token:
+                break
+            if max_results and len(messages) >= max_results:
+                logger.info(f"Stopping message listing at max_results={max_results}")
+                break
+
+        return messages
 
-                except Exception as e:
-                    logger.warning(f"Error processing message {msg['id']}: {str(e)}")
-                    continue
+    @staticmethod
+    def _is_retryable(exception: Exception) -> bool:
+        """Check whether a failed call was rate limited or hit a transient error."""
+        from googleapiclient.errors import HttpError
 
-            if not all_content:
-                raise ValueError("Failed to extract content from any messages")
+        if not isinstance(exception, HttpError):
+            return False
+        if exception.resp.status in RETRY_STATUSES:
+            return True
+        if exception.resp.status != 403:
+            return False
+        try:
+            errors = json.loads(exception.content).get('error', {}).get('errors', [])
+        except (ValueError, TypeError, AttributeError):
+            return False
+        return any(error.get('reason') in RATE_LIMIT_REASONS for error in errors)
 
-            # Create combined content with clear separation
-            combined_content = "\n\n===== EMAIL SEPARATOR =====\n\n".join(all_content)
+    def _execute_batch(self, message_ids: List[str], message_format: str) -> Dict[str, Any]:
+        """Fetch a group of messages in a single batch HTTP request.
 
-            # Generate document ID
-            doc_id = hashlib.sha256(
-                (source + combined_content[:100]).encode()
-            ).hexdigest()[:16]
+        Returns:
+            Dict containing:
+                - messages: Message resources keyed by message ID
+                - retry: IDs that failed with a retryable status
+                - gone: IDs of messages that no longer exist
+        """
+        from googleapiclient.errors import HttpError
+
+        fetched = {}
+        retry = []
+        gone = []
+
+        def callback(request_id: str, response: Dict[str, Any], exception: Optional[Exception]) -> None:
+            if exception is None:
+                fetched[request_id] = response
+            elif self._is_retryable(exception):
+                retry.append(request_id)
+            elif isinstance(exception, HttpError) and exception.resp.status == 404:
+                gone.append(request_id)
+            else:
+                logger.warning(f"Error fetching message {request_id}: {str(exception)}")
+
+        batch = self.service.new_batch_http_request(callback=callback)
+        for message_id in message_ids:
+            request_args = {'userId': 'me', 'id': message_id, 'format': message_format}
+            if message_format == 'metadata':
+                request_args['metadataHeaders'] = METADATA_HEADERS
+            batch.add(self.service.users().messages().get(**request_args), request_id=message_id)
+
+        batch.execute(http=self._get_http())
+        return {"messages": fetched, "retry": retry, "gone": gone}
+
+    def _batch_get_messages(
+        self,
+        message_ids: List[str],
+        message_format: str,
+        gone: Optional[List[str]] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """Fetch messages using concurrent batch requests.
+
+        Rate-limited or failed calls inside a batch are retried with
+        exponential backoff up to ``max_retries`` times. If ``gone`` is
+        given, IDs of messages that no longer exist are added to it.
+        """
+        results: Dict[str, Dict[str, Any]] = {}
+        pending = list(message_ids)
+        attempt = 0
+
+        while pending:
+            groups = [
+                pending[i:i + self.batch_size]
+                for i in range(0, len(pending), self.batch_size)
+            ]
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                batch_results = list(executor.map(
+                    lambda group: self._execute_batch(group, message_format),
+                    groups
+                ))
+
+            pending = []
+            for batch_result in batch_results:
+                results.update(batch_result['messages'])
+                pending.extend(batch_result['retry'])
+                if gone is not None:
+                    gone.extend(batch_result['gone'])
+
+            if pending:
+                attempt += 1
+                if attempt > self.max_retries:
+                    logger.warning(f"Giving up on {len(pending)} messages after {self.max_retries} retries")
+                    break
+                time.sleep(2 ** attempt)
+
+        return results
+
+    def _message_metadata(self, message: Dict[str, Any], headers: Dict[str, str]) -> Dict[str, Any]:
+        """Build per-message metadata from a message resource."""
+        return {
+            "message_id": message['id'],
+            "thread_id": message.get('threadId'),
+            "headers": headers,
+            "labels": message.get('labelIds', []),
+            "date": headers.get('date'),
+            "snippet": message.get('snippet', '')
+        }
+
+    def _fetch_contents(self, message_ids: List[str]) -> Dict[str, Any]:
+        """Fetch full messages in batches and decode their bodies.
+
+        IDs that could not be fetched, other than deleted messages, are
+        returned under ``unfetched`` so they can be retried later.
+        """
+        gone: List[str] = []
+        full_messages = self._batch_get_messages(message_ids, 'full', gone)
+        gone_ids = set(gone)
+        unfetched = [
+            msg_id for msg_id in message_ids
+            if msg_id not in full_messages and msg_id not in gone_ids
+        ]
+        all_content = []
+        processed_messages = []
+
+        for message_id in message_ids:
+            full_msg = full_messages.get(message_id)
+            if not full_msg:
+                continue
+
+            try:
+                # Decode message content
+                decoded = self._decode_message(full_msg)
+                if decoded['content']:
+                    all_content.append(decoded['content'])
+                    processed_messages.append({
+                        **self._message_metadata(full_msg, decoded['headers']),
+                        "has_attachments": decoded.get('has_attachments', False),
+                        "attachment_count": decoded.get('attachment_count', 0)
+                    })
+
+            except Exception as e:
+                logger.warning(f"Error processing message {message_id}: {str(e)}")
+                continue
+
+        return {"content": all_content, "messages": processed_messages, "unfetched": unfetched}
+
+    def _headers_metadata(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        """Build per-message metadata from a format='metadata' resource."""
+        headers = {
+            header['name'].lower(): header['value']
+            for header in message.get('payload', {}).get('headers', [])
+        }
+        return self._message_metadata(message, headers)
+
+    def _ingested_key(self, source: str) -> str:
+        """State key holding the message IDs ingested for a query."""
+        return f"ingested_message_ids:{source}"
+
+    def _failed_key(self, source: str) -> str:
+        """State key holding message IDs of a query that could not be fetched."""
+        return f"failed:{source}"
+
+    def _ingested_ids(self, source: str) -> List[str]:
+        """Message IDs already ingested for a query."""
+        return self.state.get(self._ingested_key(source), [])
+
+    def _record_ingested(self, source: str, added_ids: List[str], removed_ids: Optional[List[str]] = None) -> None:
+        """Update the set of message IDs ingested for a query."""
+        removed = set(removed_ids or [])
+        ingested = [msg_id for msg_id in self._ingested_ids(source) if msg_id not in removed]
+        ingested.extend(added_ids)
+        self.state.set(self._ingested_key(source), ingested)
+
+    def _get_history_id(self) -> str:
+        """Get the current mailbox historyId."""
+        profile = self.service.users().getProfile(userId='me').execute()
+        return profile['historyId']
+
+    def _list_history(self, start_history_id: str) -> Optional[Dict[str, Any]]:
+        """List mailbox changes since ``start_history_id``.
 
-            logger.info(f"Successfully processed {len(processed_messages)} Gmail messages")
+        Returns:
+            Dict with added, changed and deleted message IDs plus the latest
+            historyId, or None if the start ID has expired and a full sync
+            is required.
+        """
+        from googleapiclient.errors import HttpError
+
+        added: Dict[str, None] = {}
+        changed: Dict[str, None] = {}
+        deleted: Dict[str, None] = {}
+        history_id = start_history_id
+        page_token = None
+
+        request_args = {
+            'userId': 'me',
+            'startHistoryId': start_history_id,
+            'historyTypes': ['messageAdded', 'messageDeleted', 'labelAdded', 'labelRemoved']
+        }
+        if self.config.get('history_label_id'):
+            request_args['labelId'] = self.config['history_label_id']
+
+        while True:
+            try:
+                response = self.service.users().history().list(
+                    pageToken=page_token,
+                    **request_args
+                ).execute()
+            except HttpError as e:
+                if e.resp.status == 404:
+                    return None
+                raise
+
+            for record in response.get('history', []):
+                for item in record.get('messagesAdded', []):
+                    added[item['message']['id']] = None
+                for item in record.get('messagesDeleted', []):
+                    deleted[item['message']['id']] = None
+                for key in ('labelsAdded', 'labelsRemoved'):
+                    for item in record.get(key, []):
+                        changed[item['message']['id']] = None
+
+            history_id = response.get('historyId', history_id)
+            page_token = response.get('nextPageToken')
+            if not page_token:
+                break
+
+        return {
+            "added": [msg_id for msg_id in added if msg_id not in deleted],
+            "changed": [msg_id for msg_id in changed if msg_id not in added and msg_id not in deleted],
+            "deleted": list(deleted),
+            "history_id": history_id
+        }
+
+    def _build_result(self, source: str, fetched: Dict[str, Any], extra_meta: Dict[str, Any]) -> Dict[str, Any]:
+        """Combine fetched messages into the loader result."""
+        # Create combined content with clear separation
+        combined_content = "\n\n===== EMAIL SEPARATOR =====\n\n".join(fetched['content'])
+
+        # Generate document ID
+        doc_id = hashlib.sha256(
+            (source + combined_content[:100]).encode()
+        ).hexdigest()[:16]
+
+        return {
+            "content": combined_content,
+            "meta_data": {
+                "doc_id": doc_id,
+                "source": source,
+                "type": "gmail",
+                "message_count": len(fetched['messages']),
+                "query": source,
+                "messages": fetched['messages'],
+                **extra_meta
+            }
+        }
+
+    def _load_full(self, source: str) -> Dict[str, Any]:
+        """Search the mailbox and fetch every matching message."""
+        logger.info(f"Searching Gmail with query: {source}")
+        messages = self._list_messages(source, self.config.get('max_results'))
+        if not messages:
+            logger.warning("No messages found matching the query")
             return {
-                "content": combined_content,
+                "content": "",
                 "meta_data": {
-                    "doc_id": doc_id,
-                    "source": source,
-                    "type": "gmail",
-                    "message_count": len(processed_messages),
                     "query": source,
-                    "messages": processed_messages
+                    "message_count": 0,
+                    "type": "gmail"
                 }
             }
 
+        message_ids = [msg['id'] for msg in messages]
+        skipped_ids = []
+
+        if self.state:
+            # Full bodies only for messages not ingested before
+            ingested_ids = set(self._ingested_ids(source))
+            skipped_ids = [msg_id for msg_id in message_ids if msg_id in ingested_ids]
+            message_ids = [msg_id for msg_id in message_ids if msg_id not in ingested_ids]
+            logger.info(
+                f"Skipping {len(skipped_ids)} already ingested messages, "
+                f"fetching {len(message_ids)} new messages"
+            )
+
+        fetched = self._fetch_contents(message_ids)
+
+        if self.state:
+            self._record_ingested(source, [msg['message_id'] for msg in fetched['messages']])
+            self.state.set(self._failed_key(source), fetched['unfetched'])
+        elif not fetched['content']:
+            raise ValueError("Failed to extract content from any messages")
+
+        logger.info(f"Successfully processed {len(fetched['messages'])} Gmail messages")
+        return self._build_result(source, fetched, {
+            "sync_mode": "full",
+            "skipped_count": len(skipped_ids),
+            "skipped_message_ids": skipped_ids,
+            "unfetched_message_ids": fetched['unfetched']
+        })
+
+    def _match_query(self, source: str, message_ids: List[str], since: Optional[float]) -> List[str]:
+        """Keep only the message IDs that match the search query.
+
+        History lists every message added to the mailbox, so new IDs are
+        intersected with a search for the query limited to messages received
+        after the last sync (minus a safety margin).
+        """
+        if not message_ids or not source.strip():
+            return message_ids
+
+        query = source
+        if since:
+            query = f"{source} after:{int(since - QUERY_WINDOW_MARGIN)}"
+        matching = {msg['id'] for msg in self._list_messages(query)}
+        return [msg_id for msg_id in message_ids if msg_id in matching]
+
+    def _load_changes(self, source: str, start_history_id: str) -> Optional[Dict[str, Any]]:
+        """Fetch only messages added or changed since the last sync."""
+        sync_started = time.time()
+        changes = self._list_history(start_history_id)
+        if changes is None:
+            logger.warning(f"History ID {start_history_id} has expired, falling back to full sync")
+            return None
+
+        ingested_ids = set(self._ingested_ids(source))
+        # Messages that failed last time already matched the query; history won't list them again
+        deleted = set(changes['deleted'])
+        retry_ids = [
+            msg_id for msg_id in self.state.get(self._failed_key(source), [])
+            if msg_id not in ingested_ids and msg_id not in deleted
+        ]
+        skip_ids = ingested_ids | set(retry_ids)
+        new_ids = self._match_query(
+            source,
+            [msg_id for msg_id in changes['added'] if msg_id not in skip_ids],
+            self.state.get(self._synced_at_key(source))
+        )
+        added_ids = retry_ids + new_ids
+        # Updates and deletions only concern messages ingested for this query
+        changed_ids = [
+            msg_id for msg_id in changes['changed'] + changes['added']
+            if msg_id in ingested_ids
+        ]
+        deleted_ids = [msg_id for msg_id in changes['deleted'] if msg_id in ingested_ids]
+        logger.info(
+            f"Gmail history since {start_history_id}: {len(new_ids)} added, "
+            f"{len(changed_ids)} changed, {len(deleted_ids)} deleted, {len(retry_ids)} retried"
+        )
+
+        fetched = self._fetch_contents(added_ids)
+
+        # Label changes never alter the body, so metadata is all we need
+        updated_messages = [
+            self._headers_metadata(message)
+            for message in self._batch_get_messages(changed_ids, 'metadata').values()
+        ]
+
+        self._record_ingested(
+            source,
+            [msg['message_id'] for msg in fetched['messages']],
+            removed_ids=deleted_ids
+        )
+        self.state.set(self._failed_key(source), fetched['unfetched'])
+        self.state.set(self._history_key(source), changes['history_id'])
+        self.state.set(self._synced_at_key(source), sync_started)
+
+        return self._build_result(source, fetched, {
+            "sync_mode": "incremental",
+            "history_id": changes['history_id'],
+            "updated_messages": updated_messages,
+            "deleted_message_ids": deleted_ids,
+            "unfetched_message_ids": fetched['unfetched']
+        })
+
+    def _history_key(self, source: str) -> str:
+        """State key holding the last synced historyId for a query."""
+        return f"history_id:{source}"
+
+    def _synced_at_key(self, source: str) -> str:
+        """State key holding the time of the last sync for a query."""
+        return f"synced_at:{source}"
+
+    def load(self, source: str) -> Dict[str, Any]:
+        """Load Gmail messages matching the search query.
+
+        In incremental mode later runs replay mailbox history (optionally
+        restricted to config['history_label_id']), keep only new messages
+        that match the query, and report deleted message IDs in
+        meta_data['deleted_message_ids'].
+
+        Args:
+            source: Gmail search query (e.g., 'from:example@gmail.com')
+
+        Returns:
+            Dict containing:
+                - content: Processed email content
+                - meta_data: Email metadata and stats
+        """
+        try:
+            if not self.service:
+                self._initialize_service()
+
+            if not self.incremental:
+                return self._load_full(source)
+
+            last_history_id = self.state.get(self._history_key(source))
+            if last_history_id:
+                result = self._load_changes(source, last_history_id)
+                if result is not None:
+                    return result
+
+            # Capture the history position before listing so no change is missed
+            sync_started = time.time()
+            history_id = self._get_history_id()
+            result = self._load_full(source)
+            self.state.set(self._history_key(source), history_id)
+            self.state.set(self._synced_at_key(source), sync_started)
+            result['meta_data']['history_id'] = history_id
+            return result
+
         except Exception as e:
             logger.error(f"Error loading Gmail messages: {str(e)}")
             raise ValueError(f"Gmail loader failed: {str(e)}")
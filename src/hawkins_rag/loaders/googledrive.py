@@ -1,15 +1,29 @@
 """Google Drive content loader implementation."""
 import os
-import tempfile
+import io
 import hashlib
-from typing import Any, Optional, Dict, List
-from pathlib import Path
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Optional, Dict, List, Set, Tuple
 import logging
 from ..utils.base import BaseLoader
+from ..utils.loader_registry import get_loader
+from ..utils.sync_state import SyncStateStore
 from ..utils.google_auth import get_google_oauth_config, initialize_oauth_flow, handle_oauth_error
 
 logger = logging.getLogger(__name__)
 
+FOLDER_MIME_TYPE = 'application/vnd.google-apps.folder'
+FILE_FIELDS = "id, name, mimeType, createdTime, modifiedTime, size, md5Checksum, parents, trashed"
+
+# Binary formats handed to the matching HawkinsRAG loader's load_stream
+MIME_TYPE_LOADERS = {
+    'application/pdf': 'pdf',
+    'application/vnd.openxmlformats-officedocument.wordprocessingml.document': 'docx',
+    'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet': 'excel',
+    'application/vnd.ms-excel': 'excel',
+}
+
 class GoogleDriveLoader(BaseLoader):
     """Loader for Google Drive files and folders."""
 
@@ -18,6 +32,17 @@ class GoogleDriveLoader(BaseLoader):
         super().__init__(config)
         self.config = config or {}
         self.service = None
+        self.credentials = None
+        self.max_workers = self.config.get('max_workers', 8)
+        self._local = threading.local()
+
+        # Incremental mode follows the Drive changes feed after the first run
+        state_path = self.config.get('state_path')
+        self.state = SyncStateStore(state_path) if state_path else None
+        self.incremental = self.config.get('incremental', False)
+        if self.incremental and not self.state:
+            raise ValueError("Incremental Google Drive sync requires config['state_path']")
+
         self._initialize_service()
 
     def _initialize_service(self) -> None:
@@ -54,6 +79,7 @@ class GoogleDriveLoader(BaseLoader):
                         raise ValueError("Failed to initialize OAuth flow")
 
             # Create Drive API service
+            self.credentials = creds
             self.service = build('drive', 'v3', credentials=creds)
             self.MediaIoBaseDownload = MediaIoBaseDownload
             logger.info("Google Drive API service initialized successfully")
@@ -68,84 +94,488 @@ class GoogleDriveLoader(BaseLoader):
             logger.error(f"Failed to initialize Google Drive service: {error_msg}")
             raise ValueError(f"Google Drive service initialization failed: {error_msg}")
 
-    def _download_file(self, file_id: str, file_name: str, save_path: str) -> Optional[Dict[str, Any]]:
-        """Download and process a file from Google Drive."""
+    def _get_http(self):
+        """Get an authorized HTTP object for the current thread.
+
+        httplib2 connections are not thread-safe, so every worker gets its
+        own transport.
+        """
+        http = getattr(self._local, 'http', None)
+        if http is None:
+            import httplib2
+            from google_auth_httplib2 import AuthorizedHttp
+            http = AuthorizedHttp(self.credentials, http=httplib2.Http())
+            self._local.http = http
+        return http
+
+    def _extract_content(self, file_name: str, mime_type: str, data: bytes) -> str:
+        """Extract text from downloaded bytes using the loader for its MIME type."""
+        loader_type = MIME_TYPE_LOADERS.get(mime_type)
+        if loader_type:
+            loader = get_loader(loader_type, self.config.get(loader_type))
+            return loader.load_stream(io.BytesIO(data), file_name)['content']
+
         try:
-            # Get file metadata first
-            file_metadata = self.service.files().get(
-                fileId=file_id, 
-                fields="id, name, mimeType, createdTime, modifiedTime, size"
-            ).execute()
-
-            # Download file content
-            request = self.service.files().get_media(fileId=file_id)
-            file_path = os.path.join(save_path, file_name)
-
-            with open(file_path, 'wb') as f:
-                downloader = self.MediaIoBaseDownload(f, request)
-                done = False
-                while not done:
-                    _, done = downloader.next_chunk()
-
-            # Read content based on file type
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-            except UnicodeDecodeError:
-                logger.warning(f"File {file_name} appears to be binary, skipping content extraction")
-                content = f"[Binary file: {file_name}]"
-
-            return {
-                "content": content,
-                "meta_data": {
-                    "file_id": file_id,
-                    "name": file_name,
-                    "mime_type": file_metadata.get('mimeType', ''),
-                    "created_time": file_metadata.get('createdTime', ''),
-                    "modified_time": file_metadata.get('modifiedTime', ''),
-                    "size": file_metadata.get('size', '0')
-                }
+            return data.decode('utf-8')
+        except UnicodeDecodeError:
+            logger.warning(f"File {file_name} appears to be binary, skipping content extraction")
+            return f"[Binary file: {file_name}]"
+
+    def _fetch_bytes(self, file: Dict[str, Any]) -> bytes:
+        """Download a file into memory."""
+        request = self.service.files().get_media(fileId=file['id'], supportsAllDrives=True)
+        request.http = self._get_http()
+
+        buffer = io.BytesIO()
+        downloader = self.MediaIoBaseDownload(buffer, request)
+        done = False
+        while not done:
+            _, done = downloader.next_chunk()
+        return buffer.getvalue()
+
+    @staticmethod
+    def _file_result(file: Dict[str, Any], content: str) -> Dict[str, Any]:
+        """Build the processed-file entry for a downloaded file."""
+        return {
+            "content": content,
+            "meta_data": {
+                "file_id": file['id'],
+                "name": file['name'],
+                "path": file.get('path', file['name']),
+                "mime_type": file.get('mimeType', ''),
+                "created_time": file.get('createdTime', ''),
+                "modified_time": file.get('modifiedTime', ''),
+                "size": file.get('size', '0'),
+                "md5_checksum": file.get('md5Checksum', '')
             }
+        }
+
+    def _download_file(self, file: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Download a file into memory and process it with the matching loader."""
+        try:
+            data = self._fetch_bytes(file)
+            content = self._extract_content(file['name'], file['mimeType'], data)
+            return self._file_result(file, content)
 
         except Exception as e:
-            logger.error(f"Error downloading file {file_name}: {str(e)}")
+            logger.error(f"Error downloading file {file.get('name')}: {str(e)}")
             return None
 
+    def _download_and_extract(self, file: Dict[str, Any]) -> Tuple[str, Optional[Dict[str, Any]]]:
+        """Download and process a file, telling download errors from parse errors.
+
+        Returns:
+            Tuple of ("ok" | "failed" | "unparsable", processed file or None)
+        """
+        try:
+            data = self._fetch_bytes(file)
+        except Exception as e:
+            logger.error(f"Error downloading file {file.get('name')}: {str(e)}")
+            return "failed", None
+
+        try:
+            content = self._extract_content(file['name'], file['mimeType'], data)
+        except Exception as e:
+            logger.error(f"Error extracting content from file {file.get('name')}: {str(e)}")
+            return "unparsable", None
+        return "ok", self._file_result(file, content)
+
+    def _list_folder(self, folder_id: str) -> List[Dict[str, Any]]:
+        """List all direct children of a folder, following nextPageToken."""
+        items = []
+        page_token = None
+
+        while True:
+            response = self.service.files().list(
+                q=f"'{folder_id}' in parents and trashed = false",
+                fields=f"nextPageToken, files({FILE_FIELDS})",
+                pageSize=1000,
+                pageToken=page_token,
+                supportsAllDrives=True,
+                includeItemsFromAllDrives=True
+            ).execute(http=self._get_http())
+
+            items.extend(response.get('files', []))
+            page_token = response.get('nextPageToken')
+            if not page_token:
+                break
+
+        return items
+
+    def _collect_files(
+        self,
+        folder_id: str,
+        folder_name: str,
+        executor: ThreadPoolExecutor,
+        folders: Optional[Dict[str, str]] = None
+    ) -> List[Dict[str, Any]]:
+        """Walk the folder tree breadth-first, listing each level concurrently.
+
+        When ``folders`` is given it is filled with the path of every folder
+        in the tree, keyed by folder ID.
+        """
+        files = []
+        level = [(folder_id, folder_name)]
+
+        while level:
+            listings = list(executor.map(lambda folder: self._list_folder(folder[0]), level))
+            next_level = []
+
+            for (parent_id, parent_path), items in zip(level, listings):
+                if folders is not None:
+                    folders[parent_id] = parent_path
+                logger.info(f"Found {len(items)} items in folder {parent_path}")
+                for item in items:
+                    item_path = f"{parent_path}/{item['name']}"
+                    if item['mimeType'] == FOLDER_MIME_TYPE:
+                        next_level.append((item['id'], item_path))
+                    elif not item['mimeType'].startswith('application/vnd.google-apps'):
+                        # Google Workspace files can't be downloaded directly
+                        files.append({**item, "path": item_path})
+
+            level = next_level
+
+        return files
+
+    def _download_files(
+        self,
+        files: List[Dict[str, Any]],
+        executor: ThreadPoolExecutor
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """Download files concurrently.
+
+        Returns:
+            Tuple of (processed files, file resources whose download failed,
+            file resources whose content could not be extracted)
+        """
+        processed = []
+        failed = []
+        unparsable = []
+        for file, (status, result) in zip(files, executor.map(self._download_and_extract, files)):
+            if status == "ok":
+                processed.append(result)
+            elif status == "failed":
+                failed.append(file)
+            else:
+                unparsable.append(file)
+        return processed, failed, unparsable
+
     def _process_folder(self, folder_id: str, folder_name: str) -> List[Dict[str, Any]]:
-        """Process all files in a folder recursively."""
+        """Process all files in a folder tree with a concurrent download pool."""
         try:
-            results = self.service.files().list(
-                q=f"'{folder_id}' in parents",
-                fields="files(id, name, mimeType, createdTime, modifiedTime, size)",
-                pageSize=1000
-            ).execute()
-
-            files = results.get('files', [])
-            logger.info(f"Found {len(files)} items in folder {folder_name}")
-
-            processed_files = []
-            with tempfile.TemporaryDirectory() as temp_dir:
-                for file in files:
-                    if file['mimeType'] == 'application/vnd.google-apps.folder':
-                        # Recursively process subfolders
-                        subfolder_files = self._process_folder(file['id'], file['name'])
-                        processed_files.extend(subfolder_files)
-                    else:
-                        # Skip Google Workspace files that can't be downloaded directly
-                        if not file['mimeType'].startswith('application/vnd.google-apps'):
-                            result = self._download_file(file['id'], file['name'], temp_dir)
-                            if result:
-                                processed_files.append(result)
-
-            return processed_files
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                files = self._collect_files(folder_id, folder_name, executor)
+                logger.info(f"Downloading {len(files)} files from folder {folder_name}")
+                processed, _, _ = self._download_files(files, executor)
+                return processed
 
         except Exception as e:
             logger.error(f"Error processing folder {folder_name}: {str(e)}")
             return []
 
+    def _get_start_page_token(self) -> str:
+        """Get the current changes feed position."""
+        request_args = {'supportsAllDrives': True}
+        if self.config.get('drive_id'):
+            request_args['driveId'] = self.config['drive_id']
+        response = self.service.changes().getStartPageToken(**request_args).execute()
+        return response['startPageToken']
+
+    def _list_changes(self, page_token: str) -> Dict[str, Any]:
+        """List every change since ``page_token``.
+
+        Returns:
+            Dict with the changes and the token to resume from next time
+        """
+        changes = []
+        request_args = {
+            'fields': f"nextPageToken, newStartPageToken, changes(fileId, removed, file({FILE_FIELDS}))",
+            'pageSize': 1000,
+            'includeRemoved': True,
+            'supportsAllDrives': True,
+            'includeItemsFromAllDrives': True
+        }
+        if self.config.get('drive_id'):
+            request_args['driveId'] = self.config['drive_id']
+
+        while True:
+            response = self.service.changes().list(pageToken=page_token, **request_args).execute()
+            changes.extend(response.get('changes', []))
+            if 'newStartPageToken' in response:
+                return {"changes": changes, "page_token": response['newStartPageToken']}
+            page_token = response['nextPageToken']
+
+    def _apply_changes(self, changes: List[Dict[str, Any]], sync_state: Dict[str, Any]) -> Dict[str, Any]:
+        """Resolve raw changes against the watched folder tree.
+
+        Folder changes are applied first so files created inside a new
+        subfolder in the same sync are recognised as in scope. Folders that
+        newly enter the tree (created, or moved in from outside) are
+        returned so their existing contents can be listed.
+
+        Returns:
+            Dict with files to download, moved files, deleted file IDs and
+            the IDs of folders new to the tree
+        """
+        folders: Dict[str, str] = sync_state['folders']
+        known_files: Dict[str, Dict[str, Any]] = sync_state['files']
+        deleted: Dict[str, None] = {}
+        new_folders: List[str] = []
+        entered: Set[str] = set()
+
+        def remove_folder(folder_id: str) -> None:
+            prefix = folders.pop(folder_id) + "/"
+            for child_id in [fid for fid, path in folders.items() if path.startswith(prefix)]:
+                folders.pop(child_id)
+            for child_id in [fid for fid, info in known_files.items() if info['path'].startswith(prefix)]:
+                known_files.pop(child_id)
+                deleted[child_id] = None
+
+        def parent_path(file: Dict[str, Any]) -> Optional[str]:
+            for parent in file.get('parents', []):
+                if parent in folders:
+                    return folders[parent]
+            return None
+
+        folder_changes: Dict[str, Dict[str, Any]] = {}
+        file_changes = []
+        for change in changes:
+            if (change.get('file') or {}).get('mimeType') == FOLDER_MIME_TYPE:
+                folder_changes[change['fileId']] = change
+            else:
+                file_changes.append(change)
+
+        # Apply parents before children, so a new nested folder finds its new parent
+        ordered_folder_changes = []
+        while folder_changes:
+            ready = [
+                change for change in folder_changes.values()
+                if not any(parent in folder_changes for parent in change['file'].get('parents', []))
+            ] or list(folder_changes.values())
+            for change in ready:
+                folder_changes.pop(change['fileId'])
+            ordered_folder_changes.extend(ready)
+
+        for change in ordered_folder_changes:
+            folder = change['file']
+            folder_id = change['fileId']
+            parent = parent_path(folder)
+            if change.get('removed') or folder.get('trashed') or parent is None:
+                if folder_id in folders and folder_id != sync_state['root_id']:
+                    remove_folder(folder_id)
+            elif folders.get(folder_id) != f"{parent}/{folder['name']}":
+                if folder_id in folders:
+                    # Renamed or moved within the tree: rewrite descendant paths
+                    old_prefix = folders[folder_id] + "/"
+                    new_prefix = f"{parent}/{folder['name']}/"
+                    for fid, path in list(folders.items()):
+                        if path.startswith(old_prefix):
+                            folders[fid] = new_prefix + path[len(old_prefix):]
+                    for info in known_files.values():
+                        if info['path'].startswith(old_prefix):
+                            info['path'] = new_prefix + info['path'][len(old_prefix):]
+                else:
+                    # Subfolders of a folder that is new as well are listed with it
+                    if not any(p in entered for p in folder.get('parents', [])):
+                        new_folders.append(folder_id)
+                    entered.add(folder_id)
+                folders[folder_id] = f"{parent}/{folder['name']}"
+
+        to_download = []
+        moved = []
+        for change in file_changes:
+            file_id = change['fileId']
+            file = change.get('file') or {}
+            parent = parent_path(file) if file else None
+
+            if change.get('removed') or file.get('trashed') or parent is None:
+                if file_id in folders and file_id != sync_state['root_id']:
+                    # Removed folders arrive without a file resource
+                    remove_folder(file_id)
+                elif known_files.pop(file_id, None) is not None:
+                    deleted[file_id] = None
+                continue
+
+            if file['mimeType'].startswith('application/vnd.google-apps'):
+                continue
+
+            path = f"{parent}/{file['name']}"
+            known = known_files.get(file_id)
+            if known and known['md5'] and known['md5'] == file.get('md5Checksum'):
+                # Content-identical update: only the location may have changed
+                if known['path'] != path:
+                    known['path'] = path
+                    moved.append({"file_id": file_id, "path": path})
+                continue
+
+            to_download.append({**file, "path": path})
+
+        return {
+            "download": to_download,
+            "moved": moved,
+            "deleted": list(deleted),
+            "new_folders": new_folders
+        }
+
+    def _retry_files(self, sync_state: Dict[str, Any], scheduled: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Fetch current resources for files whose download failed in an earlier sync."""
+        scheduled_ids = {file['id'] for file in scheduled}
+        retry = []
+        for file_id in sync_state.get('failed', []):
+            known = sync_state['files'].get(file_id)
+            if not known or file_id in scheduled_ids:
+                continue
+            try:
+                file = self.service.files().get(
+                    fileId=file_id,
+                    fields=FILE_FIELDS,
+                    supportsAllDrives=True
+                ).execute()
+            except Exception as e:
+                logger.warning(f"Dropping failed file {file_id} from retries: {str(e)}")
+                sync_state['files'].pop(file_id, None)
+                continue
+            if file.get('trashed'):
+                sync_state['files'].pop(file_id, None)
+                continue
+            retry.append({**file, "path": known['path']})
+        return retry
+
+    @staticmethod
+    def _record_downloads(
+        sync_state: Dict[str, Any],
+        processed_files: List[Dict[str, Any]],
+        failed_files: List[Dict[str, Any]],
+        unparsable_files: List[Dict[str, Any]]
+    ) -> None:
+        """Store downloaded files and keep failed ones for retry on the next sync.
+
+        Files whose content could not be extracted are stored with their
+        checksum like processed ones, so they are only tried again once
+        their content changes.
+        """
+        for f in processed_files:
+            sync_state['files'][f['meta_data']['file_id']] = {
+                "md5": f['meta_data']['md5_checksum'],
+                "path": f['meta_data']['path']
+            }
+        for file in unparsable_files:
+            sync_state['files'][file['id']] = {"md5": file.get('md5Checksum'), "path": file['path']}
+        # Failed files are tracked without a checksum so any later change downloads them
+        for file in failed_files:
+            sync_state['files'][file['id']] = {"md5": None, "path": file['path']}
+        sync_state['failed'] = [file['id'] for file in failed_files]
+        if failed_files:
+            logger.warning(f"{len(failed_files)} Drive files failed to download and will be retried")
+
+    def _build_folder_result(
+        self,
+        source: str,
+        folder_id: str,
+        item: Dict[str, Any],
+        processed_files: List[Dict[str, Any]],
+        extra_meta: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Combine processed folder files into the loader result."""
+        # Combine content from all files
+        all_content = []
+        for file_data in processed_files:
+            if file_data['content']:
+                all_content.append(
+                    f"### File: {file_data['meta_data']['path']}\n\n"
+                    f"{file_data['content']}"
+                )
+
+        combined_content = "\n\n=== FILE SEPARATOR ===\n\n".join(all_content)
+
+        # Generate document ID
+        doc_id = hashlib.sha256(
+            f"{folder_id}-{len(processed_files)}".encode()
+        ).hexdigest()[:16]
+
+        return {
+            "content": combined_content,
+            "meta_data": {
+                "doc_id": doc_id,
+                "source": source,
+                "type": "gdrive",
+                "item_type": "folder",
+                "folder_id": folder_id,
+                "folder_name": item['name'],
+                "file_count": len(processed_files),
+                "created_time": item.get('createdTime', ''),
+                "modified_time": item.get('modifiedTime', ''),
+                "processed_files": [
+                    f['meta_data'] for f in processed_files
+                ],
+                **(extra_meta or {})
+            }
+        }
+
+    def _sync_folder(self, source: str, folder_id: str, item: Dict[str, Any]) -> Dict[str, Any]:
+        """Load a folder incrementally through the Drive changes feed."""
+        state_key = f"folder:{folder_id}"
+        sync_state = self.state.get(state_key)
+
+        if not sync_state:
+            # Capture the feed position before listing so no change is missed.
+            # Listing errors propagate: saving the token after a partial listing
+            # would skip everything that was not listed.
+            page_token = self._get_start_page_token()
+            folders: Dict[str, str] = {}
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                files = self._collect_files(folder_id, item['name'], executor, folders)
+                logger.info(f"Downloading {len(files)} files from folder {item['name']}")
+                processed_files, failed_files, unparsable_files = self._download_files(files, executor)
+
+            sync_state = {
+                "root_id": folder_id,
+                "page_token": page_token,
+                "folders": folders,
+                "files": {}
+            }
+            self._record_downloads(sync_state, processed_files, failed_files, unparsable_files)
+            self.state.set(state_key, sync_state)
+            return self._build_folder_result(source, folder_id, item, processed_files, {
+                "sync_mode": "full"
+            })
+
+        feed = self._list_changes(sync_state['page_token'])
+        resolved = self._apply_changes(feed['changes'], sync_state)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            # Files already inside a folder that entered the tree produce no changes
+            to_download = {file['id']: file for file in resolved['download']}
+            for new_folder_id in resolved['new_folders']:
+                folder_path = sync_state['folders'][new_folder_id]
+                for file in self._collect_files(new_folder_id, folder_path, executor, sync_state['folders']):
+                    to_download.setdefault(file['id'], file)
+            scheduled = list(to_download.values())
+            scheduled += self._retry_files(sync_state, scheduled)
+            logger.info(
+                f"Drive changes for folder {item['name']}: {len(scheduled)} to download, "
+                f"{len(resolved['moved'])} moved, {len(resolved['deleted'])} deleted"
+            )
+            processed_files, failed_files, unparsable_files = self._download_files(scheduled, executor)
+
+        self._record_downloads(sync_state, processed_files, failed_files, unparsable_files)
+        sync_state['page_token'] = feed['page_token']
+        self.state.set(state_key, sync_state)
+
+        return self._build_folder_result(source, folder_id, item, processed_files, {
+            "sync_mode": "incremental",
+            "moved_files": resolved['moved'],
+            "deleted_file_ids": resolved['deleted']
+        })
+
     def load(self, source: str) -> Dict[str, Any]:
         """Load content from Google Drive folder or file.
 
+        In incremental mode the first folder load records a changes-feed
+        start page token; later loads download only files created or
+        modified under the folder, skip content-identical updates by
+        md5Checksum, and report moved and deleted files in meta_data.
+
         Args:
             source: Google Drive file/folder ID or shared URL
 
@@ -169,73 +599,43 @@ class GoogleDriveLoader(BaseLoader):
             try:
                 item = self.service.files().get(
                     fileId=file_id,
-                    fields="id, name, mimeType, createdTime, modifiedTime, size"
+                    fields=FILE_FIELDS,
+                    supportsAllDrives=True
                 ).execute()
             except Exception as e:
                 raise ValueError(f"Invalid Google Drive ID or URL: {str(e)}")
 
-            processed_files = []
-            if item['mimeType'] == 'application/vnd.google-apps.folder':
+            if item['mimeType'] == FOLDER_MIME_TYPE:
+                if self.incremental:
+                    return self._sync_folder(source, file_id, item)
+
                 # Process folder contents
                 processed_files = self._process_folder(file_id, item['name'])
                 if not processed_files:
                     raise ValueError("No compatible files found in the folder")
 
-                # Combine content from all files
-                all_content = []
-                for file_data in processed_files:
-                    if file_data['content']:
-                        all_content.append(
-                            f"### File: {file_data['meta_data']['name']}\n\n"
-                            f"{file_data['content']}"
-                        )
-
-                combined_content = "\n\n=== FILE SEPARATOR ===\n\n".join(all_content)
+                return self._build_folder_result(source, file_id, item, processed_files)
+            else:
+                # Process single file
+                result = self._download_file(item)
+                if not result:
+                    raise ValueError("Failed to process file")
 
                 # Generate document ID
                 doc_id = hashlib.sha256(
-                    f"{file_id}-{len(processed_files)}".encode()
+                    f"{file_id}-{item.get('modifiedTime', '')}".encode()
                 ).hexdigest()[:16]
 
                 return {
-                    "content": combined_content,
+                    "content": result['content'],
                     "meta_data": {
                         "doc_id": doc_id,
                         "source": source,
                         "type": "gdrive",
-                        "item_type": "folder",
-                        "folder_id": file_id,
-                        "folder_name": item['name'],
-                        "file_count": len(processed_files),
-                        "created_time": item.get('createdTime', ''),
-                        "modified_time": item.get('modifiedTime', ''),
-                        "processed_files": [
-                            f['meta_data'] for f in processed_files
-                        ]
+                        "item_type": "file",
+                        **result['meta_data']
                     }
                 }
-            else:
-                # Process single file
-                with tempfile.TemporaryDirectory() as temp_dir:
-                    result = self._download_file(file_id, item['name'], temp_dir)
-                    if not result:
-                        raise ValueError("Failed to process file")
-
-                    # Generate document ID
-                    doc_id = hashlib.sha256(
-                        f"{file_id}-{item.get('modifiedTime', '')}".encode()
-                    ).hexdigest()[:16]
-
-                    return {
-                        "content": result['content'],
-                        "meta_data": {
-                            "doc_id": doc_id,
-                            "source": source,
-                            "type": "gdrive",
-                            "item_type": "file",
-                            **result['meta_data']
-                        }
-                    }
 
         except Exception as e:
             logger.error(f"Error loading from Google Drive: {str(e)}")
@@ -1,7 +1,17 @@
+import re
 import hashlib
-from typing import Any, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional
 from atlassian import Jira
 from .base import BaseLoader
+from ..utils.sync_state import SyncStateStore, query_timestamp
+
+# Fields needed to format an issue; requested instead of '*all'
+ISSUE_FIELDS = [
+    'summary', 'issuetype', 'status', 'description', 'created', 'updated',
+    'assignee', 'reporter', 'labels', 'comment'
+]
 
 class JiraLoader(BaseLoader):
     """Loader for Jira issues and content."""
@@ -13,6 +23,14 @@ class JiraLoader(BaseLoader):
         - url: Jira instance URL
         - username: Jira username/email
         - password: Jira API token or password
+
+        Optional config:
+        - page_size: Issues requested per search call (default 100)
+        - max_workers: Search pages fetched concurrently (default 4)
+        - fields: Extra fields to request on top of the ones formatted
+        - incremental: Only load issues updated since the last sync
+        - state_path: Sync state file, required for incremental mode
+        - overlap_minutes: Look-back applied to the updated filter (default 1440)
         """
         if not config or not all(k in config for k in ['url', 'username', 'password']):
             raise ValueError(
@@ -20,6 +38,20 @@ class JiraLoader(BaseLoader):
                 "Get API token from https://id.atlassian.com/manage/api-tokens"
             )
 
+        super().__init__(config)
+        self.page_size = self.config.get('page_size', 100)
+        self.max_workers = self.config.get('max_workers', 4)
+        self.fields = ISSUE_FIELDS + [
+            field for field in self.config.get('fields', []) if field not in ISSUE_FIELDS
+        ]
+        self.overlap_minutes = self.config.get('overlap_minutes', 1440)
+
+        state_path = self.config.get('state_path')
+        self.state = SyncStateStore(state_path) if state_path else None
+        self.incremental = self.config.get('incremental', False)
+        if self.incremental and not self.state:
+            raise ValueError("Incremental Jira sync requires config['state_path']")
+
         try:
             self.jira = Jira(
                 url=config['url'],
@@ -41,8 +73,11 @@ class JiraLoader(BaseLoader):
             "\nComments:"
         ]
 
-        # Add comments
-        comments = self.jira.get_issue_comments(issue['key'])
+        # Add comments, using the ones embedded in the search result when complete
+        embedded = fields.get('comment') or {}
+        comments = embedded.get('comments', [])
+        if embedded.get('total', 0) > len(comments):
+            comments = self.jira.get_issue_comments(issue['key']).get('comments', [])
         for comment in comments:
             author = comment['author']['displayName']
             created = comment['created']
@@ -51,6 +86,115 @@ class JiraLoader(BaseLoader):
 
         return "\n".join(parts)
 
+    def _format_document(self, issue: Dict[str, Any], source: str) -> Dict[str, Any]:
+        """Build a document from a Jira issue."""
+        return {
+            # A stable name lets an updated issue replace its own chunks
+            "name": issue['key'],
+            "content": self._format_issue(issue),
+            "meta_data": {
+                "key": issue['key'],
+                "id": issue['id'],
+                "type": issue['fields']['issuetype']['name'],
+                "status": issue['fields']['status']['name'],
+                "created": issue['fields']['created'],
+                "updated": issue['fields']['updated'],
+                "assignee": (
+                    (issue['fields'].get('assignee') or {}).get('displayName', 'Unassigned')
+                ),
+                "reporter": (
+                    (issue['fields'].get('reporter') or {}).get('displayName', 'Unknown')
+                ),
+                "labels": issue['fields'].get('labels', []),
+                "query": source
+            }
+        }
+
+    def _scoped_jql(self, jql: str, since: str) -> str:
+        """Restrict a JQL query to issues updated since a watermark."""
+        match = re.search(r'\border\s+by\b', jql, re.IGNORECASE)
+        query, order_by = (jql[:match.start()], jql[match.start():]) if match else (jql, "")
+        updated = query_timestamp(since, self.overlap_minutes)
+        return f'({query.strip()}) AND updated >= "{updated}" {order_by}'.strip()
+
+    def _search_page(self, jql: str, start: int) -> Dict[str, Any]:
+        """Fetch one page of JQL results with the projected fields."""
+        return self.jira.jql(
+            jql,
+            fields=",".join(self.fields),
+            start=start,
+            limit=self.page_size
+        )
+
+    def _search_issues(self, jql: str) -> Iterator[Dict[str, Any]]:
+        """Yield every issue matching a JQL query.
+
+        The first page reports the total and the page size the server
+        actually applied (Cloud caps ``maxResults`` at 100); the remaining
+        pages step by that size and are fetched ``max_workers`` at a time, so
+        at most that many pages are held in memory while issues are yielded
+        in order.
+        """
+        first_page = self._search_page(jql, 0)
+        issues = first_page.get('issues', [])
+        yield from issues
+
+        total = first_page.get('total', 0)
+        step = first_page.get('maxResults') or len(issues)
+        if not step:
+            return
+        offsets = list(range(step, total, step))
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for i in range(0, len(offsets), self.max_workers):
+                window = offsets[i:i + self.max_workers]
+                for page in executor.map(lambda start: self._search_page(jql, start), window):
+                    yield from page.get('issues', [])
+
+    def lazy_load(self, source: str) -> Iterator[Dict[str, Any]]:
+        """Yield one document per Jira issue, page by page.
+
+        In incremental mode the query is narrowed with ``updated >=`` the
+        stored watermark, and issues whose ``updated`` value is unchanged
+        are skipped.
+
+        Args:
+            source: JQL query string (e.g., "project = DEMO AND status = Open")
+        """
+        if not self.incremental:
+            found = False
+            for issue in self._search_issues(source):
+                found = True
+                yield self._format_document(issue, source)
+            if not found:
+                raise ValueError(f"No issues found matching query: {source}")
+            return
+
+        state_key = f"jql:{source}"
+        sync_state = self.state.get(state_key) or {"watermark": None, "updated": {}}
+        seen = sync_state['updated']
+        watermark = sync_state['watermark']
+        jql = self._scoped_jql(source, watermark) if watermark else source
+        completed = False
+
+        try:
+            for issue in self._search_issues(jql):
+                updated = issue['fields']['updated']
+                if seen.get(issue['key']) == updated:
+                    continue
+                yield self._format_document(issue, source)
+                # Recorded only once the consumer has stored the issue
+                seen[issue['key']] = updated
+                if not watermark or datetime.fromisoformat(updated) > datetime.fromisoformat(watermark):
+                    watermark = updated
+            completed = True
+        finally:
+            # Results are not ordered by update time, so the watermark only
+            # moves after a complete run; seen versions still skip stored issues
+            self.state.set(state_key, {
+                "watermark": watermark if completed else sync_state['watermark'],
+                "updated": seen
+            })
+
     def load(self, source: str) -> Any:
         """Load content from Jira using JQL query.
 
@@ -61,42 +205,11 @@ class JiraLoader(BaseLoader):
             Dict containing document ID and array of issue data
         """
         try:
-            # Search for issues using JQL
-            issues = self.jira.jql(source)
-            
-            if not issues['issues']:
-                raise ValueError(f"No issues found matching query: {source}")
-
-            data = []
-            all_content = []
-
-            for issue in issues['issues']:
-                content = self._format_issue(issue)
-                all_content.append(content)
-
-                data.append({
-                    "content": content,
-                    "meta_data": {
-                        "key": issue['key'],
-                        "id": issue['id'],
-                        "type": issue['fields']['issuetype']['name'],
-                        "status": issue['fields']['status']['name'],
-                        "created": issue['fields']['created'],
-                        "updated": issue['fields']['updated'],
-                        "assignee": (
-                            issue['fields'].get('assignee', {}).get('displayName', 'Unassigned')
-                        ),
-                        "reporter": (
-                            issue['fields'].get('reporter', {}).get('displayName', 'Unknown')
-                        ),
-                        "labels": issue['fields'].get('labels', []),
-                        "query": source
-                    }
-                })
+            data = list(self.lazy_load(source))
 
             # Generate document ID
             doc_id = hashlib.sha256(
-                (source + "".join(all_content)).encode()
+                (source + "".join(item['content'] for item in data)).encode()
             ).hexdigest()
 
             return {
@@ -1,7 +1,10 @@
 """JSON document loader implementation."""
+import io
+import re
 import json
 import hashlib
-from typing import Any, Dict, Optional
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, TextIO, Tuple
 from pathlib import Path
 import requests
 from urllib.parse import urlparse
@@ -10,13 +13,277 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Characters read per refill while streaming a top-level array
+READ_SIZE = 64 * 1024
+# Sources larger than this (or of unknown size) parse top-level arrays incrementally
+STREAM_THRESHOLD = 64 * 1024 * 1024
+JSON_LINES_EXTENSIONS = ('.jsonl', '.ndjson')
+JSON_LINES_CONTENT_TYPES = ('application/x-ndjson', 'application/jsonl', 'application/json-lines')
+_PATH_TOKEN = re.compile(r"([^.\[\]]+)|\[(\*|-?\d+)\]")
+
+def _parse_path(path: str) -> List[Any]:
+    """Split a JSON path like ``$.user.tags[*]`` into keys, indexes and ``*``."""
+    path = path.strip()
+    if path.startswith("$"):
+        path = path[1:]
+    tokens = []
+    for key, index in _PATH_TOKEN.findall(path):
+        if key:
+            tokens.append(key)
+        else:
+            tokens.append(index if index == "*" else int(index))
+    return tokens
+
+def _select(value: Any, tokens: List[Any]) -> List[Any]:
+    """Return every value at a parsed JSON path; missing paths give no values."""
+    values = [value]
+    for token in tokens:
+        selected = []
+        for item in values:
+            if token == "*":
+                if isinstance(item, list):
+                    selected.extend(item)
+                elif isinstance(item, dict):
+                    selected.extend(item.values())
+            elif isinstance(token, int):
+                if isinstance(item, list) and -len(item) <= token < len(item):
+                    selected.append(item[token])
+            elif isinstance(item, dict) and token in item:
+                selected.append(item[token])
+        values = selected
+    return values
+
 class JsonLoader(BaseLoader):
     """Loader for JSON files and APIs."""
 
     def __init__(self, config: Optional[Dict[str, Any]] = None):
-        """Initialize JSON loader with optional configuration."""
+        """Initialize JSON loader with optional configuration.
+
+        Optional config:
+        - fields: JSON paths kept from each record (e.g. ["$.id", "$.user.name", "$.tags[*]"])
+        - json_lines: Treat the source as JSON Lines regardless of its extension
+        - streaming: Always parse top-level arrays item by item
+        - stream_threshold: Size in bytes above which arrays are parsed item
+          by item even without ``streaming`` (default 64 MB)
+        - timeout: HTTP timeout in seconds for URL sources (default 30)
+        """
         super().__init__(config)
         self.config = config or {}
+        self.fields = [(path, _parse_path(path)) for path in self.config.get('fields', [])]
+        self.json_lines = self.config.get('json_lines', False)
+        self.streaming = self.config.get('streaming', False)
+        self.stream_threshold = self.config.get('stream_threshold', STREAM_THRESHOLD)
+        self.timeout = self.config.get('timeout', 30)
+
+    @contextmanager
+    def _open_source(self, source: str) -> Iterator[Tuple[TextIO, Dict[str, Any]]]:
+        """Open a JSON file or stream a URL as a text stream, with source metadata."""
+        # Check if source is URL
+        url = urlparse(source)
+        if all([url.scheme, url.netloc]):
+            if url.scheme not in ["http", "https"]:
+                raise ValueError("Only HTTP(S) URLs are supported")
+            with requests.get(source, stream=True, timeout=self.timeout) as response:
+                response.raise_for_status()
+                response.raw.decode_content = True
+                stream = io.TextIOWrapper(response.raw, encoding=response.encoding or 'utf-8')
+                metadata = {
+                    "source_type": "url",
+                    "url": source,
+                    "content_type": response.headers.get('content-type', '')
+                }
+                if response.headers.get('content-length', '').isdigit():
+                    metadata["content_length"] = int(response.headers['content-length'])
+                try:
+                    yield stream, metadata
+                finally:
+                    stream.close()
+        else:
+            # Treat as local file path
+            path = Path(source)
+            if not path.exists():
+                raise ValueError(f"JSON file not found: {source}")
+            with open(path, 'r', encoding='utf-8') as stream:
+                yield stream, {
+                    "source_type": "file",
+                    "file_path": str(path),
+                    "file_size": path.stat().st_size,
+                    "modified_time": path.stat().st_mtime
+                }
+
+    def _is_json_lines(self, source: str, metadata: Dict[str, Any]) -> bool:
+        """Decide whether a source holds one JSON value per line."""
+        if self.json_lines:
+            return True
+        if urlparse(source).path.lower().endswith(JSON_LINES_EXTENSIONS):
+            return True
+        content_type = metadata.get("content_type", "").split(";")[0].strip().lower()
+        return content_type in JSON_LINES_CONTENT_TYPES
+
+    @staticmethod
+    def _iter_lines(stream: TextIO) -> Iterator[Any]:
+        """Yield the value on each non-blank line of a JSON Lines stream."""
+        for line_number, line in enumerate(stream, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"Invalid JSON on line {line_number}: {str(e)}")
+
+    @staticmethod
+    def _iter_array(stream: TextIO, buffer: str) -> Iterator[Any]:
+        """Yield the items of a top-level array one at a time.
+
+        ``buffer`` holds text already read from ``stream``, starting at the
+        opening bracket. Only the item being decoded is kept in memory.
+        """
+        decoder = json.JSONDecoder()
+        pos = buffer.index("[") + 1
+        read_size = READ_SIZE
+        eof = False
+        expect_item = True
+        after_comma = False
+
+        while True:
+            # Skip whitespace and separators, refilling the buffer as needed
+            while True:
+                while pos < len(buffer) and buffer[pos] in " \t\r\n":
+                    pos += 1
+                if pos < len(buffer) or eof:
+                    break
+                buffer = stream.read(READ_SIZE)
+                pos = 0
+                eof = not buffer
+
+            if pos >= len(buffer):
+                raise ValueError("Invalid JSON format: unterminated array")
+            if buffer[pos] == "]":
+                if expect_item and after_comma:
+                    raise ValueError("Invalid JSON format: trailing ',' in array")
+                return
+            if buffer[pos] == ",":
+                if expect_item:
+                    raise ValueError("Invalid JSON format: unexpected ','")
+                pos += 1
+                expect_item = True
+                after_comma = True
+                continue
+            if not expect_item:
+                raise ValueError("Invalid JSON format: expected ',' between array items")
+
+            try:
+                item, end = decoder.raw_decode(buffer, pos)
+                # A value cut by the buffer end may still decode (e.g. "1." as 1), so it is
+                # complete only once the following ',' or ']' has been read
+                following = buffer[end:].lstrip(" \t\r\n")
+                complete = eof or following[:1] in (",", "]")
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                complete = False
+
+            if not complete:
+                chunk = stream.read(read_size)
+                eof = not chunk
+                buffer = buffer[pos:] + chunk
+                pos = 0
+                # Grow reads so one very large item is not re-parsed many times
+                read_size *= 2
+                continue
+
+            read_size = READ_SIZE
+            buffer = buffer[end:]
+            pos = 0
+            expect_item = False
+            yield item
+
+    def _format_record(self, record: Any) -> str:
+        """Format a record, keeping only the configured fields if any."""
+        if self.fields:
+            lines = []
+            for path, tokens in self.fields:
+                for value in _select(record, tokens):
+                    text = value if isinstance(value, str) else json.dumps(value)
+                    lines.append(f"{path}: {text}")
+            return "\n".join(lines)
+        if isinstance(record, dict):
+            return "\n".join(
+                f"{key}: {json.dumps(value, indent=2)}" for key, value in record.items()
+            )
+        return json.dumps(record, indent=2)
+
+    def _should_stream(self, metadata: Dict[str, Any]) -> bool:
+        """Decide whether to parse a top-level array item by item.
+
+        The incremental parser is several times slower than ``json.loads``,
+        so it is only used when requested or for large (or unsized) sources.
+        """
+        if self.streaming:
+            return True
+        size = metadata.get("file_size", metadata.get("content_length"))
+        return size is None or size > self.stream_threshold
+
+    @contextmanager
+    def _open_records(self, source: str) -> Iterator[Tuple[Iterator[Any], str, Dict[str, Any]]]:
+        """Open a source as (records, data structure, source metadata).
+
+        JSON Lines are always read line by line, and top-level arrays are
+        parsed incrementally when ``_should_stream`` says so. Any other
+        document is decoded whole and is a single record.
+        """
+        with self._open_source(source) as (stream, metadata):
+            if self._is_json_lines(source, metadata):
+                yield self._iter_lines(stream), "lines", metadata
+                return
+
+            # Peek at the first significant character to find the top-level type
+            buffer = ""
+            while not buffer.strip():
+                chunk = stream.read(READ_SIZE)
+                if not chunk:
+                    raise ValueError("Invalid JSON format: empty document")
+                buffer += chunk
+
+            if buffer.lstrip().startswith("[") and self._should_stream(metadata):
+                yield self._iter_array(stream, buffer), "array", metadata
+                return
+
+            data = json.loads(buffer + stream.read())
+            if isinstance(data, list):
+                yield iter(data), "array", metadata
+            elif isinstance(data, dict):
+                yield iter([data]), "object", metadata
+            else:
+                raise ValueError("Invalid JSON format: must be object or array")
+
+    def lazy_load(self, source: str) -> Iterator[Dict[str, Any]]:
+        """Yield one document per record of a JSON array or JSON Lines source.
+
+        JSON Lines, and arrays in streaming mode or above ``stream_threshold``,
+        are parsed as the file or HTTP body is read, so memory use is bounded
+        by the largest record. A top-level object is one document.
+
+        Args:
+            source: Path to JSON file or URL
+        """
+        try:
+            with self._open_records(source) as (records, structure, metadata):
+                for index, record in enumerate(records):
+                    yield {
+                        "content": self._format_record(record),
+                        "meta_data": {
+                            "source": source,
+                            "type": "json",
+                            "data_structure": structure,
+                            "record_index": index,
+                            **metadata
+                        }
+                    }
+        except json.JSONDecodeError as e:
+            logger.error(f"Invalid JSON format: {str(e)}")
+            raise ValueError(f"Invalid JSON format: {str(e)}")
 
     def load(self, source: str) -> Dict[str, Any]:
         """Load and process JSON data from file or URL.
@@ -30,66 +297,39 @@ class JsonLoader(BaseLoader):
                 - meta_data: Dictionary of metadata about the content
         """
         try:
-            # Check if source is URL
-            url = urlparse(source)
-            if all([url.scheme, url.netloc]):
-                if url.scheme not in ["http", "https"]:
-                    raise ValueError("Only HTTP(S) URLs are supported")
-                response = requests.get(source)
-                response.raise_for_status()
-                data = response.json()
-                metadata = {
-                    "source_type": "url",
-                    "url": source,
-                    "content_type": response.headers.get('content-type', '')
-                }
-            else:
-                # Treat as local file path
-                path = Path(source)
-                if not path.exists():
-                    raise ValueError(f"JSON file not found: {source}")
-                with open(path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                metadata = {
-                    "source_type": "file",
-                    "file_path": str(path),
-                    "file_size": path.stat().st_size,
-                    "modified_time": path.stat().st_mtime
-                }
+            with self._open_records(source) as (records, structure, metadata):
+                records = list(records)
 
             # Convert JSON to string representation with proper formatting
-            if isinstance(data, (dict, list)):
-                # Format the JSON content for better readability
-                formatted_content = []
-                if isinstance(data, dict):
-                    for key, value in data.items():
-                        formatted_content.append(f"{key}: {json.dumps(value, indent=2)}")
-                    content = "\n".join(formatted_content)
-                else:
-                    content = json.dumps(data, indent=2)
-
-                # Generate document ID
-                doc_id = hashlib.sha256(
-                    (content + source).encode()
-                ).hexdigest()[:16]
-
-                logger.info(f"Successfully loaded JSON from {source}")
-                return {
-                    "content": content,
-                    "meta_data": {
-                        "doc_id": doc_id,
-                        "source": source,
-                        "type": "json",
-                        "data_structure": "object" if isinstance(data, dict) else "array",
-                        **metadata
-                    }
-                }
+            if structure == "object":
+                content = self._format_record(records[0])
+            elif self.fields:
+                content = "\n\n".join(self._format_record(record) for record in records)
+            elif structure == "lines":
+                content = "\n".join(json.dumps(record) for record in records)
             else:
-                raise ValueError("Invalid JSON format: must be object or array")
+                content = json.dumps(records, indent=2)
+
+            # Generate document ID
+            doc_id = hashlib.sha256(
+                (content + source).encode()
+            ).hexdigest()[:16]
+
+            logger.info(f"Successfully loaded JSON from {source}")
+            return {
+                "content": content,
+                "meta_data": {
+                    "doc_id": doc_id,
+                    "source": source,
+                    "type": "json",
+                    "data_structure": structure,
+                    **metadata
+                }
+            }
 
         except json.JSONDecodeError as e:
             logger.error(f"Invalid JSON format: {str(e)}")
             raise ValueError(f"Invalid JSON format: {str(e)}")
         except Exception as e:
             logger.error(f"Error loading JSON: {str(e)}")
-            raise ValueError(f"Error loading JSON: {str(e)}")
\ No newline at end of file
+            raise ValueError(f"Error loading JSON: {str(e)}")
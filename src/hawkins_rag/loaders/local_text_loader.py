@@ -1,15 +1,39 @@
 import hashlib
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 from pathlib import Path
 from ..utils.loader_registry import BaseLoader
+from ..utils.text_decoding import BLOCK_SIZE, DEFAULT_ENCODINGS, decode_bytes, iter_text_units
 
 class LocalTextLoader(BaseLoader):
     """Loader for local text files with customizable encoding support."""
 
     def __init__(self, config: Optional[Dict[str, Any]] = None):
-        """Initialize local text loader with optional configuration."""
+        """Initialize local text loader with optional configuration.
+
+        Optional config:
+        - encodings: Encodings tried in order when the file has no BOM
+          (default utf-8, cp1252, latin-1)
+        - streaming: Yield the file from lazy_load in decoded blocks
+        - block_size: Bytes read per block in streaming mode (default 1 MB)
+        """
         self.config = config or {}
-        self.encodings = self.config.get('encodings', ['utf-8', 'latin-1', 'cp1252'])
+        self.encodings = self.config.get('encodings', DEFAULT_ENCODINGS)
+        self.streaming = self.config.get('streaming', False)
+        self.block_size = self.config.get('block_size', BLOCK_SIZE)
+
+    def lazy_load(self, source: str) -> Iterator[Dict[str, Any]]:
+        """Yield the file in decoded blocks when streaming, else as one document.
+
+        Blocks end on line breaks and carry the same metadata as TextLoader's.
+
+        Args:
+            source: Path to text file
+        """
+        if not self.streaming:
+            yield from self.load(source)["data"]
+            return
+
+        yield from iter_text_units(source, self.encodings, self.block_size)
 
     def load(self, source: str) -> Any:
         """Load content from a local text file.
@@ -25,27 +49,11 @@ class LocalTextLoader(BaseLoader):
             if not path.exists():
                 raise ValueError(f"Text file not found: {source}")
 
-            content = None
-            successful_encoding = None
-            errors = []
-
-            # Try different encodings
-            for encoding in self.encodings:
-                try:
-                    with open(path, 'r', encoding=encoding) as f:
-                        content = f.read().strip()
-                    if content:
-                        successful_encoding = encoding
-                        break
-                except UnicodeDecodeError as e:
-                    errors.append(f"Failed with {encoding}: {str(e)}")
-                    continue
-
-            if not content or not successful_encoding:
-                error_msg = "\n".join(errors)
-                raise ValueError(
-                    f"Unable to decode file with supported encodings: {self.encodings}\n{error_msg}"
-                )
+            # Read once, then decode in memory
+            content, successful_encoding = decode_bytes(path.read_bytes(), self.encodings)
+            content = content.strip()
+            if not content:
+                raise ValueError(f"Text file is empty: {source}")
 
             # Generate document ID
             doc_id = hashlib.sha256(
@@ -1,14 +1,28 @@
 import os
-import hashlib
-from typing import Any, Dict, Optional
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 import mysql.connector
-from .base import BaseLoader
+from mysql.connector import pooling
+from ..utils.table_sync import SQLTableLoader
 
-class MySQLLoader(BaseLoader):
+# Connection pools shared by every loader with the same connection settings
+_POOLS: Dict[Tuple[Any, ...], pooling.MySQLConnectionPool] = {}
+_POOLS_LOCK = threading.Lock()
+
+class MySQLLoader(SQLTableLoader):
     """Loader for MySQL databases."""
 
     def __init__(self, config: Optional[Dict[str, Any]] = None):
-        """Initialize MySQL loader with configuration."""
+        """Initialize MySQL loader with configuration.
+
+        Optional config:
+        - batch_size: Rows fetched per round trip and per streamed document (default 1000)
+        - pool_size: Pooled connections per database (default 5, at most 32)
+        - primary_key / change_column: Key and monotonic change column for
+          "table:<name>" sources (default "id" / "updated_at")
+        - state_path: Sync state file holding each table's watermark
+        """
         if not config:
             # Try to get configuration from environment variables
             config = {
@@ -26,67 +40,89 @@ class MySQLLoader(BaseLoader):
             )
 
         self.config = config
+        self._init_table_sync()
 
+    def _get_pool(self) -> pooling.MySQLConnectionPool:
+        """Get the shared connection pool for this loader's settings."""
+        key = (
+            self.config.get("host", "localhost"),
+            self.config.get("port", 3306),
+            self.config["database"],
+            self.config["user"],
+        )
+        with _POOLS_LOCK:
+            pool = _POOLS.get(key)
+            if pool is None:
+                try:
+                    pool = pooling.MySQLConnectionPool(
+                        pool_name=f"hawkins_rag_{len(_POOLS)}",
+                        pool_size=self.config.get("pool_size", 5),
+                        host=self.config.get("host", "localhost"),
+                        port=self.config.get("port", 3306),
+                        database=self.config["database"],
+                        user=self.config["user"],
+                        password=self.config["password"]
+                    )
+                except mysql.connector.Error as e:
+                    raise ValueError(f"Failed to connect to MySQL: {str(e)}")
+                _POOLS[key] = pool
+            return pool
+
+    @contextmanager
     def _get_connection(self):
-        """Get database connection."""
+        """Borrow a pooled database connection."""
         try:
-            return mysql.connector.connect(
-                host=self.config["host"],
-                port=self.config["port"],
-                database=self.config["database"],
-                user=self.config["user"],
-                password=self.config["password"]
-            )
+            conn = self._get_pool().get_connection()
         except mysql.connector.Error as e:
             raise ValueError(f"Failed to connect to MySQL: {str(e)}")
+        try:
+            yield conn
+        finally:
+            # An abandoned unbuffered result must be drained before reuse
+            if conn.unread_result:
+                conn.consume_results()
+            # Returns the connection to the pool
+            conn.close()
+
+    def _iter_batches(self, query: str) -> Iterator[List[Dict[str, Any]]]:
+        """Stream query results in batches through an unbuffered cursor."""
+        with self._get_connection() as conn:
+            cursor = conn.cursor(dictionary=True, buffered=False)
+            try:
+                cursor.execute(query)
+                while True:
+                    rows = cursor.fetchmany(self.batch_size)
+                    if not rows:
+                        break
+                    yield rows
+            finally:
+                if conn.unread_result:
+                    conn.consume_results()
+                cursor.close()
+
+    def _fetch_rows(self, query: str, params: Tuple[Any, ...] = ()) -> List[Dict[str, Any]]:
+        """Run a bounded query and return all of its rows."""
+        with self._get_connection() as conn:
+            cursor = conn.cursor(dictionary=True)
+            try:
+                cursor.execute(query, params)
+                return cursor.fetchall()
+            finally:
+                cursor.close()
 
     def load(self, source: str) -> Any:
         """Load content from MySQL query.
 
         Args:
-            source: SQL query to execute
+            source: SQL query to execute, or "table:<name>" for a table sync
 
         Returns:
             Dict containing document ID and query results
         """
-        conn = None
-        cursor = None
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor(dictionary=True)
-            cursor.execute(source)
-            results = cursor.fetchall()
-
-            if not results:
-                raise ValueError("Query returned no results")
-
-            # Convert results to list of dicts
-            data = []
-            for row in results:
-                content = "\n".join(f"{k}: {v}" for k, v in row.items())
-                data.append({
-                    "content": content,
-                    "meta_data": {
-                        "query": source,
-                        "database": self.config["database"],
-                        "row_count": len(results)
-                    }
-                })
-
-            # Generate document ID
-            doc_id = hashlib.sha256(
-                (source + str(data)).encode()
-            ).hexdigest()
-
-            return {
-                "doc_id": doc_id,
-                "data": data
-            }
+            if self._table_name(source) is not None:
+                return self._load_table_result(source)
+            return self._load_query_result(source)
 
         except Exception as e:
             raise ValueError(f"Error executing MySQL query: {str(e)}")
-        finally:
-            if cursor:
-                cursor.close()
-            if conn:
-                conn.close()
\ No newline at end of file
@@ -1,8 +1,17 @@
 import os
-import time
 import hashlib
-from typing import Any, Dict, List, Optional
+import logging
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Deque, Dict, Iterator, List, Optional, Tuple
 from .base import BaseLoader
+from ..utils.rate_limit import RateLimiter
+from ..utils.sync_state import SyncStateStore
+
+logger = logging.getLogger(__name__)
+
+# Child pages and databases are loaded as separate documents, not part of the parent's text
+NESTED_DOCUMENT_TYPES = ("child_page", "child_database")
 
 class NotionLoader(BaseLoader):
     """Loader for Notion pages and databases."""
@@ -15,6 +24,17 @@ class NotionLoader(BaseLoader):
                 "https://www.notion.so/my-integrations"
             )
 
+        super().__init__(config)
+        self.max_workers = self.config.get("max_workers", 4)
+        # Notion API has a rate limit of 3 requests per second per integration
+        self.rate_limiter = RateLimiter(self.config.get("requests_per_second", 3))
+
+        state_path = self.config.get("state_path")
+        self.state = SyncStateStore(state_path) if state_path else None
+        self.incremental = self.config.get("incremental", False)
+        if self.incremental and not self.state:
+            raise ValueError("Incremental Notion sync requires config['state_path']")
+
         try:
             from notion_client import Client
             self.client = Client(auth=config["token"])
@@ -24,8 +44,8 @@ class NotionLoader(BaseLoader):
             )
 
     def _rate_limit_wait(self):
-        """Implement rate limiting."""
-        time.sleep(0.3)  # Notion API has a rate limit of 3 requests per second
+        """Implement rate limiting shared by all worker threads."""
+        self.rate_limiter.wait()
 
     def _extract_block_content(self, block: Dict[str, Any]) -> str:
         """Extract text content from a block."""
@@ -39,6 +59,9 @@ class NotionLoader(BaseLoader):
                 text.get("plain_text", "")
                 for text in block_data["rich_text"]
             )
+        elif isinstance(block_data.get("title"), str):
+            # child_page and child_database blocks carry a plain string title
+            return block_data["title"]
         elif "title" in block_data:
             return "".join(
                 text.get("plain_text", "")
@@ -53,6 +76,7 @@ class NotionLoader(BaseLoader):
         start_cursor = None
 
         while has_more:
+            self._rate_limit_wait()
             response = self.client.blocks.children.list(
                 block_id=block_id,
                 start_cursor=start_cursor,
@@ -60,98 +84,249 @@ class NotionLoader(BaseLoader):
             blocks.extend(response.get("results", []))
             has_more = response.get("has_more", False)
             start_cursor = response.get("next_cursor")
-            self._rate_limit_wait()
 
         return blocks
 
-    def _process_page(self, page_id: str) -> Dict[str, Any]:
-        """Process a Notion page and its content."""
-        page = self.client.pages.retrieve(page_id)
-        blocks = self._get_block_children(page_id)
+    def _get_block_tree(self, page_id: str, executor: ThreadPoolExecutor) -> Dict[str, List[Dict[str, Any]]]:
+        """Fetch a page's whole block tree, one level at a time.
 
-        # Extract page properties
-        properties = page.get("properties", {})
-        title = ""
-        for prop in properties.values():
-            if prop["type"] == "title":
-                title = "".join(
-                    text.get("plain_text", "")
-                    for text in prop["title"]
+        Every block with children on the current level is expanded
+        concurrently; the shared rate limiter keeps the pool within budget.
+
+        Returns:
+            Child blocks keyed by parent block ID
+        """
+        children = {page_id: self._get_block_children(page_id)}
+        level = [
+            block["id"] for block in children[page_id]
+            if block.get("has_children") and block.get("type") not in NESTED_DOCUMENT_TYPES
+        ]
+
+        while level:
+            results = list(executor.map(self._get_block_children, level))
+            next_level = []
+            for block_id, blocks in zip(level, results):
+                children[block_id] = blocks
+                next_level.extend(
+                    block["id"] for block in blocks
+                    if block.get("has_children") and block.get("type") not in NESTED_DOCUMENT_TYPES
                 )
-                break
+            level = next_level
+
+        return children
 
-        # Process blocks
+    def _render_blocks(self, children: Dict[str, List[Dict[str, Any]]], parent_id: str, depth: int = 0) -> List[str]:
+        """Render a fetched block tree in document order with indentation."""
         content_parts = []
-        for block in blocks:
-            # Get block content
+        stack = [(block, depth) for block in reversed(children.get(parent_id, []))]
+
+        while stack:
+            block, level = stack.pop()
             block_content = self._extract_block_content(block)
             if block_content:
-                content_parts.append(block_content)
+                content_parts.append("  " * level + block_content)
+            for child in reversed(children.get(block["id"], [])):
+                stack.append((child, level + 1))
 
-            # Process child blocks if they exist
-            if block.get("has_children", False):
-                child_blocks = self._get_block_children(block["id"])
-                for child in child_blocks:
-                    child_content = self._extract_block_content(child)
-                    if child_content:
-                        content_parts.append("  " + child_content)
+        return content_parts
+
+    def _get_page_title(self, page: Dict[str, Any]) -> str:
+        """Extract the title property of a page."""
+        for prop in page.get("properties", {}).values():
+            if prop["type"] == "title":
+                return "".join(
+                    text.get("plain_text", "")
+                    for text in prop["title"]
+                )
+        return ""
+
+    def _process_page(
+        self,
+        page_id: str,
+        page: Optional[Dict[str, Any]] = None,
+        executor: Optional[ThreadPoolExecutor] = None
+    ) -> Dict[str, Any]:
+        """Process a Notion page and its content."""
+        if page is None:
+            self._rate_limit_wait()
+            page = self.client.pages.retrieve(page_id)
+
+        if executor is None:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as block_executor:
+                children = self._get_block_tree(page_id, block_executor)
+        else:
+            children = self._get_block_tree(page_id, executor)
+
+        title = self._get_page_title(page)
+        content_parts = self._render_blocks(children, page_id)
+        nested = [block for blocks in children.values() for block in blocks]
 
         content = "\n".join([f"Title: {title}", *content_parts])
         metadata = {
             "page_id": page_id,
+            "title": title,
             "created_time": page.get("created_time"),
             "last_edited_time": page.get("last_edited_time"),
             "url": page.get("url"),
+            "child_page_ids": [block["id"] for block in nested if block.get("type") == "child_page"],
+            "child_database_ids": [block["id"] for block in nested if block.get("type") == "child_database"],
         }
 
         return {
+            "name": page_id,
             "content": content,
             "meta_data": metadata,
         }
 
-    def _process_database(self, database_id: str) -> List[Dict[str, Any]]:
-        """Process a Notion database and its pages."""
-        database = self.client.databases.retrieve(database_id)
-        pages = []
+    def _iter_database_pages(self, database_id: str) -> Iterator[Dict[str, Any]]:
+        """Yield every page object of a database, following cursors."""
         has_more = True
         start_cursor = None
 
         while has_more:
+            self._rate_limit_wait()
             response = self.client.databases.query(
                 database_id=database_id,
                 start_cursor=start_cursor,
             )
-            for page in response.get("results", []):
-                processed_page = self._process_page(page["id"])
-                if processed_page:
-                    pages.append(processed_page)
-                self._rate_limit_wait()
-
+            yield from response.get("results", [])
             has_more = response.get("has_more", False)
             start_cursor = response.get("next_cursor")
 
-        return pages
+    def _process_database(self, database_id: str) -> List[Dict[str, Any]]:
+        """Process a Notion database and its pages."""
+        return list(self._iter_database(database_id, {}))
+
+    def _iter_database(
+        self,
+        database_id: str,
+        edited_times: Dict[str, str],
+        skipped: Optional[List[str]] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """Process database pages concurrently, yielding each as it is built.
+
+        Pages whose ``last_edited_time`` matches ``edited_times`` are skipped
+        without fetching their blocks; if ``skipped`` is given, their IDs are
+        added to it.
+        """
+        with ThreadPoolExecutor(max_workers=self.max_workers) as block_executor, \
+                ThreadPoolExecutor(max_workers=self.max_workers) as page_executor:
+            batch = []
+            for page in self._iter_database_pages(database_id):
+                if edited_times.get(page["id"]) == page.get("last_edited_time"):
+                    if skipped is not None:
+                        skipped.append(page["id"])
+                    continue
+                batch.append(page)
+                if len(batch) == self.max_workers:
+                    yield from page_executor.map(
+                        lambda p: self._process_page(p["id"], p, block_executor), batch
+                    )
+                    batch = []
+            if batch:
+                yield from page_executor.map(
+                    lambda p: self._process_page(p["id"], p, block_executor), batch
+                )
+
+    def _extract_id(self, source: str) -> str:
+        """Extract ID from URL or direct ID."""
+        if "notion.so/" in source:
+            source_id = source.split("notion.so/")[-1].split("?")[0]
+            if "-" in source_id:
+                source_id = source_id.split("-")[-1]
+            return source_id
+        return source.strip()
+
+    def _iter_item(
+        self,
+        kind: str,
+        item_id: str,
+        page: Optional[Dict[str, Any]],
+        edited_times: Dict[str, str],
+        skipped: List[str]
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield the changed pages of one queued page or database."""
+        if kind == "database":
+            yield from self._iter_database(item_id, edited_times, skipped)
+            return
+
+        if page is None:
+            self._rate_limit_wait()
+            page = self.client.pages.retrieve(item_id)
+        if edited_times.get(page["id"]) == page.get("last_edited_time"):
+            skipped.append(page["id"])
+            return
+        yield self._process_page(page["id"], page)
+
+    def lazy_load(self, source: str) -> Iterator[Dict[str, Any]]:
+        """Yield each Notion page as its own document.
+
+        Child pages and databases found in a page's blocks are queued and
+        loaded as documents of their own. In incremental mode pages whose
+        ``last_edited_time`` is unchanged since the last sync are skipped,
+        and their children are taken from the sync state instead.
+        """
+        source_id = self._extract_id(source)
+        state_key = f"edited_times:{source_id}"
+        children_key = f"child_ids:{source_id}"
+        edited_times = self.state.get(state_key, {}) if self.incremental else {}
+        child_ids = self.state.get(children_key, {}) if self.incremental else {}
 
-    def load(self, source: str) -> Any:
-        """Load content from Notion page or database."""
         try:
-            # Extract ID from URL or direct ID
-            if "notion.so/" in source:
-                source_id = source.split("notion.so/")[-1].split("?")[0]
-                if "-" in source_id:
-                    source_id = source_id.split("-")[-1]
-            else:
-                source_id = source.strip()
-
-            try:
-                # Try as page first
-                data = [self._process_page(source_id)]
-            except Exception:
-                # If fails, try as database
+            # Try as page first
+            self._rate_limit_wait()
+            page = self.client.pages.retrieve(source_id)
+        except Exception:
+            page = None
+
+        # If fails, try as database
+        root = ("page", page["id"], page) if page is not None else ("database", source_id, None)
+        queue: Deque[Tuple[str, str, Optional[Dict[str, Any]]]] = deque([root])
+        seen = set()
+
+        def enqueue_children(children: Dict[str, List[str]]) -> None:
+            queue.extend(("page", child_id, None) for child_id in children.get("pages", []))
+            queue.extend(("database", child_id, None) for child_id in children.get("databases", []))
+
+        try:
+            while queue:
+                kind, item_id, item = queue.popleft()
+                if item_id in seen:
+                    continue
+                seen.add(item_id)
+
+                skipped: List[str] = []
                 try:
-                    data = self._process_database(source_id)
+                    for processed_page in self._iter_item(kind, item_id, item, edited_times, skipped):
+                        yield processed_page
+                        # Recorded only once the consumer has stored the page
+                        meta = processed_page["meta_data"]
+                        edited_times[meta["page_id"]] = meta["last_edited_time"]
+                        child_ids[meta["page_id"]] = {
+                            "pages": meta["child_page_ids"],
+                            "databases": meta["child_database_ids"]
+                        }
+                        enqueue_children(child_ids[meta["page_id"]])
                 except Exception as e:
-                    raise ValueError(f"Failed to load content: {str(e)}")
+                    if item_id == root[1]:
+                        raise
+                    # A nested page or database the integration cannot read
+                    logger.warning(f"Skipping Notion {kind} {item_id}: {str(e)}")
+                    continue
+
+                for page_id in skipped:
+                    enqueue_children(child_ids.get(page_id, {}))
+        except Exception as e:
+            raise ValueError(f"Failed to load content: {str(e)}")
+        finally:
+            if self.incremental:
+                self.state.set(state_key, edited_times)
+                self.state.set(children_key, child_ids)
+
+    def load(self, source: str) -> Any:
+        """Load content from Notion page or database."""
+        try:
+            data = list(self.lazy_load(source))
 
             # Generate document ID
             doc_id = hashlib.sha256(
@@ -164,4 +339,4 @@ class NotionLoader(BaseLoader):
             }
 
         except Exception as e:
-            raise ValueError(f"Error loading from Notion: {str(e)}")
\ No newline at end of file
+            raise ValueError(f"Error loading from Notion: {str(e)}")
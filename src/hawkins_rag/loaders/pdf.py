@@ -1,6 +1,6 @@
 """PDF document loader implementation."""
 import hashlib
-from typing import Any, Dict
+from typing import Any, BinaryIO, Dict, Tuple
 from pathlib import Path
 import PyPDF2
 import logging
@@ -11,6 +11,19 @@ logger = logging.getLogger(__name__)
 class PDFLoader(BaseLoader):
     """Loader for PDF files."""
 
+    def _extract_text(self, file: BinaryIO) -> Tuple[str, int]:
+        """Extract page-delimited text and page count from a PDF stream."""
+        pdf_reader = PyPDF2.PdfReader(file)
+        text_content = ""
+
+        for page_num, page in enumerate(pdf_reader.pages, 1):
+            text = page.extract_text()
+            if text.strip():
+                text_content += f"\n\n=== Page {page_num} ===\n\n"
+                text_content += text
+
+        return text_content.strip(), len(pdf_reader.pages)
+
     def load(self, source: str) -> Dict[str, Any]:
         """Load text content from a PDF file.
 
@@ -26,29 +39,21 @@ class PDFLoader(BaseLoader):
                 raise ValueError(f"PDF file not found: {source}")
 
             # Extract text from PDF
-            text_content = ""
-            metadata = {}
-
             with open(path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                metadata = {
-                    "total_pages": len(pdf_reader.pages),
-                    "file_name": path.name,
-                    "file_size": path.stat().st_size
-                }
+                text_content, total_pages = self._extract_text(file)
 
-                for page_num, page in enumerate(pdf_reader.pages, 1):
-                    text = page.extract_text()
-                    if text.strip():
-                        text_content += f"\n\n=== Page {page_num} ===\n\n"
-                        text_content += text
+            metadata = {
+                "total_pages": total_pages,
+                "file_name": path.name,
+                "file_size": path.stat().st_size
+            }
 
             # Generate document ID
             doc_id = hashlib.sha256(str(path).encode()).hexdigest()[:16]
 
             logger.info(f"Successfully loaded PDF: {path.name}")
             return {
-                "content": text_content.strip(),
+                "content": text_content,
                 "meta_data": {
                     "doc_id": doc_id,
                     "source": str(path),
@@ -59,4 +64,33 @@ class PDFLoader(BaseLoader):
 
         except Exception as e:
             logger.error(f"Error loading PDF: {str(e)}")
-            raise ValueError(f"Error loading PDF: {str(e)}")
\ No newline at end of file
+            raise ValueError(f"Error loading PDF: {str(e)}")
+
+    def load_stream(self, stream: BinaryIO, name: str) -> Dict[str, Any]:
+        """Load text content from an in-memory PDF stream.
+
+        Args:
+            stream: Binary file-like object positioned at the start of the PDF
+            name: File name used for metadata and the document ID
+
+        Returns:
+            Dict containing document content and metadata
+        """
+        try:
+            text_content, total_pages = self._extract_text(stream)
+            doc_id = hashlib.sha256(name.encode()).hexdigest()[:16]
+
+            return {
+                "content": text_content,
+                "meta_data": {
+                    "doc_id": doc_id,
+                    "source": name,
+                    "type": "pdf",
+                    "total_pages": total_pages,
+                    "file_name": name
+                }
+            }
+
+        except Exception as e:
+            logger.error(f"Error loading PDF stream {name}: {str(e)}")
+            raise ValueError(f"Error loading PDF: {str(e)}")
@@ -1,15 +1,29 @@
 import os
-import hashlib
-from typing import Any, Dict, Optional, List
-import psycopg2
+import uuid
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional, List, Tuple
 from psycopg2.extras import RealDictCursor
-from ..utils.loader_registry import BaseLoader
+from psycopg2.pool import ThreadedConnectionPool
+from ..utils.table_sync import SQLTableLoader
 
-class PostgreSQLLoader(BaseLoader):
+# Connection pools shared by every loader with the same connection settings
+_POOLS: Dict[Tuple[Any, ...], ThreadedConnectionPool] = {}
+_POOLS_LOCK = threading.Lock()
+
+class PostgreSQLLoader(SQLTableLoader):
     """Loader for PostgreSQL databases."""
 
     def __init__(self, config: Optional[Dict[str, Any]] = None):
-        """Initialize PostgreSQL loader with configuration."""
+        """Initialize PostgreSQL loader with configuration.
+
+        Optional config:
+        - batch_size: Rows fetched per round trip and per streamed document (default 1000)
+        - pool_min_size / pool_max_size: Connection pool bounds (default 1 / 5)
+        - primary_key / change_column: Key and monotonic change column for
+          "table:<name>" sources (default "id" / "updated_at")
+        - state_path: Sync state file holding each table's watermark
+        """
         if not config:
             # Try to get configuration from environment variables
             config = {
@@ -27,58 +41,77 @@ class PostgreSQLLoader(BaseLoader):
             )
 
         self.config = config
+        self._init_table_sync()
 
-    def _get_connection(self):
-        """Get database connection."""
-        return psycopg2.connect(
-            host=self.config["host"],
-            port=self.config["port"],
-            database=self.config["database"],
-            user=self.config["user"],
-            password=self.config["password"],
-            cursor_factory=RealDictCursor
+    def _get_pool(self) -> ThreadedConnectionPool:
+        """Get the shared connection pool for this loader's settings."""
+        key = (
+            self.config.get("host", "localhost"),
+            self.config.get("port", "5432"),
+            self.config["database"],
+            self.config["user"],
         )
+        with _POOLS_LOCK:
+            pool = _POOLS.get(key)
+            if pool is None or pool.closed:
+                pool = ThreadedConnectionPool(
+                    self.config.get("pool_min_size", 1),
+                    self.config.get("pool_max_size", 5),
+                    host=self.config.get("host", "localhost"),
+                    port=self.config.get("port", "5432"),
+                    database=self.config["database"],
+                    user=self.config["user"],
+                    password=self.config["password"],
+                    cursor_factory=RealDictCursor
+                )
+                _POOLS[key] = pool
+            return pool
+
+    @contextmanager
+    def _get_connection(self):
+        """Borrow a pooled database connection."""
+        pool = self._get_pool()
+        conn = pool.getconn()
+        try:
+            yield conn
+        finally:
+            # Queries are read-only; end the transaction before returning it
+            if not conn.closed:
+                conn.rollback()
+            pool.putconn(conn)
+
+    def _iter_batches(self, query: str) -> Iterator[List[Dict[str, Any]]]:
+        """Stream query results in batches through a named server-side cursor."""
+        with self._get_connection() as conn:
+            with conn.cursor(name=f"hawkins_rag_{uuid.uuid4().hex}") as cur:
+                cur.itersize = self.batch_size
+                cur.execute(query)
+                while True:
+                    rows = cur.fetchmany(self.batch_size)
+                    if not rows:
+                        break
+                    yield [dict(row) for row in rows]
+
+    def _fetch_rows(self, query: str, params: Tuple[Any, ...] = ()) -> List[Dict[str, Any]]:
+        """Run a bounded query and return all of its rows."""
+        with self._get_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(query, params)
+                return [dict(row) for row in cur.fetchall()]
 
     def load(self, source: str) -> Any:
         """Load content from PostgreSQL query.
 
         Args:
-            source: SQL query to execute
+            source: SQL query to execute, or "table:<name>" for a table sync
 
         Returns:
             Dict containing document ID and query results
         """
         try:
-            with self._get_connection() as conn:
-                with conn.cursor() as cur:
-                    cur.execute(source)
-                    results = cur.fetchall()
-
-                    if not results:
-                        raise ValueError("Query returned no results")
-
-                    # Convert results to list of dicts
-                    data = []
-                    for row in results:
-                        content = "\n".join(f"{k}: {v}" for k, v in dict(row).items())
-                        data.append({
-                            "content": content,
-                            "meta_data": {
-                                "query": source,
-                                "database": self.config["database"],
-                                "row_count": len(results)
-                            }
-                        })
-
-                    # Generate document ID
-                    doc_id = hashlib.sha256(
-                        (source + str(data)).encode()
-                    ).hexdigest()
-
-                    return {
-                        "doc_id": doc_id,
-                        "data": data
-                    }
+            if self._table_name(source) is not None:
+                return self._load_table_result(source)
+            return self._load_query_result(source)
 
         except Exception as e:
-            raise ValueError(f"Error executing PostgreSQL query: {str(e)}")
\ No newline at end of file
+            raise ValueError(f"Error executing PostgreSQL query: {str(e)}")
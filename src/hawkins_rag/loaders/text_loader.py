@@ -1,9 +1,10 @@
 """Text file loader implementation."""
 import hashlib
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterator, Optional
 from pathlib import Path
 import logging
 from ..utils.base import BaseLoader
+from ..utils.text_decoding import BLOCK_SIZE, DEFAULT_ENCODINGS, decode_bytes, iter_text_units
 
 logger = logging.getLogger(__name__)
 
@@ -11,9 +12,41 @@ class TextLoader(BaseLoader):
     """Loader for plain text files."""
 
     def __init__(self, config: Optional[Dict[str, Any]] = None):
-        """Initialize text loader with optional configuration."""
+        """Initialize text loader with optional configuration.
+
+        Optional config:
+        - encodings: Encodings tried in order when the file has no BOM
+          (default utf-8, cp1252, latin-1)
+        - streaming: Yield the file from lazy_load in decoded blocks instead
+          of reading it whole
+        - block_size: Bytes read per block in streaming mode (default 1 MB)
+        """
         super().__init__(config)
         self.config = config or {}
+        self.encodings = self.config.get('encodings', DEFAULT_ENCODINGS)
+        self.streaming = self.config.get('streaming', False)
+        self.block_size = self.config.get('block_size', BLOCK_SIZE)
+
+    def lazy_load(self, source: str) -> Iterator[Dict[str, Any]]:
+        """Yield the file in decoded blocks when streaming, else as one document.
+
+        Blocks end on line breaks, so only one block is held in memory.
+
+        Args:
+            source: Path to text file
+        """
+        if not self.streaming:
+            yield self.load(source)
+            return
+
+        logger.info(f"Streaming text file: {source}")
+        block_count = 0
+        for unit in iter_text_units(source, self.encodings, self.block_size):
+            yield unit
+            block_count += 1
+
+        if not block_count:
+            raise ValueError("Error loading text file: Empty or unreadable text file")
 
     def load(self, source: str) -> Dict[str, Any]:
         """Load and process text file.
@@ -33,22 +66,10 @@ class TextLoader(BaseLoader):
 
             logger.info(f"Loading text file: {source}")
 
-            # Try different encodings
-            encodings = ['utf-8', 'latin-1', 'cp1252']
-            content = None
-            used_encoding = None
-
-            for encoding in encodings:
-                try:
-                    with open(path, 'r', encoding=encoding) as f:
-                        content = f.read()
-                    if content and content.strip():
-                        used_encoding = encoding
-                        break
-                except UnicodeDecodeError:
-                    continue
-
-            if not content or not content.strip():
+            # Read once, then decode in memory
+            content, used_encoding = decode_bytes(path.read_bytes(), self.encodings)
+
+            if not content.strip():
                 raise ValueError("Empty or unreadable text file")
 
             # Generate document ID
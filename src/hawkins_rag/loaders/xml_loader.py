@@ -1,6 +1,7 @@
 """XML loader implementation."""
 import hashlib
-from typing import Any, Dict, Optional
+from contextlib import contextmanager
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple
 import xml.etree.ElementTree as ET
 from pathlib import Path
 import requests
@@ -17,6 +18,10 @@ class XMLLoader(BaseLoader):
         """Initialize XML loader with optional configuration."""
         super().__init__(config)
         self.config = config or {}
+        # Tag names (with or without namespace) whose elements become documents
+        self.record_tags = set(self.config.get('record_tags', []))
+        self.streaming = self.config.get('streaming', False)
+        self.timeout = self.config.get('timeout', 30)
         self.headers = {
             'User-Agent': (
                 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
@@ -32,42 +37,157 @@ class XMLLoader(BaseLoader):
         except Exception:
             return False
 
-    def _extract_text(self, element: ET.Element, path: str = "") -> str:
-        """Extract text content from XML element recursively.
+    def _extract_text(self, element: ET.Element, path: str = "", include_tail: bool = True) -> str:
+        """Extract text content from an XML element and its descendants.
+
+        Walks the subtree with an explicit stack, so deeply nested documents
+        do not hit the recursion limit.
 
         Args:
             element: XML element to process
-            path: Current XML path (for context)
+            path: XML path of the element's parent (for context)
+            include_tail: Whether to include the element's own tail text
 
         Returns:
             str: Formatted text content
         """
         content_parts = []
+        # (element, parent path, tail marker) in document order
+        stack = [(element, path, False)]
+
+        while stack:
+            node, parent_path, is_tail = stack.pop()
+
+            # Process tail text once all children are done
+            if is_tail:
+                if node.tail and node.tail.strip():
+                    content_parts.append(node.tail.strip())
+                continue
 
-        # Handle current element
-        current_path = f"{path}/{element.tag}" if path else element.tag
+            current_path = f"{parent_path}/{node.tag}" if parent_path else node.tag
 
-        # Process attributes
-        if element.attrib:
-            for key, value in element.attrib.items():
+            # Process attributes
+            for key, value in node.attrib.items():
                 content_parts.append(f"{current_path}/@{key}: {value}")
 
-        # Process text content
-        if element.text and element.text.strip():
-            content_parts.append(f"{current_path}: {element.text.strip()}")
+            # Process text content
+            if node.text and node.text.strip():
+                content_parts.append(f"{current_path}: {node.text.strip()}")
 
-        # Process child elements
-        for child in element:
-            child_text = self._extract_text(child, current_path)
-            if child_text:
-                content_parts.append(child_text)
+            if include_tail or node is not element:
+                stack.append((node, parent_path, True))
 
-        # Process tail text
-        if element.tail and element.tail.strip():
-            content_parts.append(element.tail.strip())
+            # Process child elements
+            for child in reversed(node):
+                stack.append((child, current_path, False))
 
         return "\n".join(content_parts)
 
+    @contextmanager
+    def _open_source(self, source: str) -> Iterator[Tuple[BinaryIO, Dict[str, Any]]]:
+        """Open an XML file or stream a URL as bytes, with source metadata.
+
+        Bytes are passed to the parser so the XML declaration's encoding is honored.
+        """
+        if self._is_url(source):
+            with requests.get(source, headers=self.headers, stream=True, timeout=self.timeout) as response:
+                response.raise_for_status()
+                response.raw.decode_content = True
+                yield response.raw, {
+                    "source_type": "url",
+                    "url": source
+                }
+        else:
+            path = Path(source)
+            if not path.exists():
+                raise ValueError(f"XML file not found: {source}")
+            with open(path, 'rb') as stream:
+                yield stream, {
+                    "source_type": "file",
+                    "file_path": str(path),
+                    "file_size": path.stat().st_size,
+                    "modified_time": path.stat().st_mtime
+                }
+
+    def _is_record(self, element: ET.Element, depth: int) -> bool:
+        """Check whether an element is a record boundary."""
+        if not self.record_tags:
+            # Without configured tags every child of the root is a record
+            return depth == 1
+        tag = element.tag
+        local_name = tag.rsplit('}', 1)[-1]
+        return tag in self.record_tags or local_name in self.record_tags
+
+    def _iter_records(self, stream: BinaryIO) -> Iterator[Tuple[str, ET.Element, str]]:
+        """Yield (root tag, record element, parent path) with iterparse.
+
+        Each record is detached from its parent once consumed, and elements
+        outside records are dropped when they end, so memory stays bounded by
+        the largest record rather than the document.
+        """
+        stack: List[ET.Element] = []
+        paths: List[str] = []
+        record_depth = None
+
+        for event, element in ET.iterparse(stream, events=("start", "end")):
+            if event == "start":
+                paths.append(f"{paths[-1]}/{element.tag}" if paths else element.tag)
+                stack.append(element)
+                if record_depth is None and self._is_record(element, len(stack) - 1):
+                    record_depth = len(stack)
+                continue
+
+            depth = len(stack)
+            stack.pop()
+            paths.pop()
+            if record_depth is not None and depth > record_depth:
+                # Inside a record: keep the subtree until the record ends
+                continue
+
+            if depth == record_depth:
+                record_depth = None
+                yield stack[0].tag if stack else element.tag, element, paths[-1] if paths else ""
+
+            # Free the consumed element
+            element.clear()
+            if stack:
+                stack[-1].remove(element)
+
+    def lazy_load(self, source: str) -> Iterator[Dict[str, Any]]:
+        """Yield XML content, one document per record in streaming mode.
+
+        Streaming is enabled by ``record_tags`` (each matching element is a
+        record) or ``streaming`` (each child of the root is a record).
+        Otherwise the whole document is yielded as by ``load``.
+
+        Args:
+            source: Path to XML file or URL
+        """
+        if not (self.streaming or self.record_tags):
+            yield self.load(source)
+            return
+
+        logger.info(f"Streaming XML records from {source}")
+        try:
+            with self._open_source(source) as (stream, metadata):
+                for index, (root_tag, record, parent_path) in enumerate(self._iter_records(stream)):
+                    content = self._extract_text(record, parent_path, include_tail=False)
+                    if not content:
+                        continue
+                    yield {
+                        "content": content,
+                        "meta_data": {
+                            "source": source,
+                            "type": "xml",
+                            "root_tag": root_tag,
+                            "record_tag": record.tag,
+                            "record_index": index,
+                            **metadata
+                        }
+                    }
+        except ET.ParseError as e:
+            raise ValueError(f"Invalid XML format: {str(e)}")
+
     def load(self, source: str) -> Dict[str, Any]:
         """Load content from XML file or URL.
 
@@ -83,34 +203,13 @@ class XMLLoader(BaseLoader):
             ValueError: If the XML cannot be loaded or parsed
         """
         try:
-            # Load XML content
+            # Load and parse XML
             logger.info(f"Loading XML from {source}")
-            if self._is_url(source):
-                response = requests.get(source, headers=self.headers)
-                response.raise_for_status()
-                xml_content = response.text
-                metadata = {
-                    "source_type": "url",
-                    "url": source
-                }
-            else:
-                path = Path(source)
-                if not path.exists():
-                    raise ValueError(f"XML file not found: {source}")
-                with open(path, 'r', encoding='utf-8') as f:
-                    xml_content = f.read()
-                metadata = {
-                    "source_type": "file",
-                    "file_path": str(path),
-                    "file_size": path.stat().st_size,
-                    "modified_time": path.stat().st_mtime
-                }
-
-            # Parse XML
-            try:
-                root = ET.fromstring(xml_content)
-            except ET.ParseError as e:
-                raise ValueError(f"Invalid XML format: {str(e)}")
+            with self._open_source(source) as (stream, metadata):
+                try:
+                    root = ET.parse(stream).getroot()
+                except ET.ParseError as e:
+                    raise ValueError(f"Invalid XML format: {str(e)}")
 
             # Extract content
             content = self._extract_text(root)
@@ -1,21 +1,39 @@
 """YouTube content loader implementation."""
 import hashlib
-from typing import Any, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 import logging
 from ..utils.base import BaseLoader
+from ..utils.sync_state import SyncStateStore
 from urllib.parse import parse_qs, urlparse
 
 logger = logging.getLogger(__name__)
 
+# videos().list and playlistItems().list accept at most 50 ids/results per call
+MAX_PAGE_SIZE = 50
+YOUTUBE_HOSTS = ('www.youtube.com', 'youtube.com', 'm.youtube.com')
+
 class YouTubeLoader(BaseLoader):
     """Loader for YouTube videos and channels."""
 
     def __init__(self, config: Optional[Dict[str, Any]] = None):
-        """Initialize YouTube loader with optional configuration."""
+        """Initialize YouTube loader with optional configuration.
+
+        Optional config:
+        - max_workers: Transcripts fetched concurrently for playlists and channels (default 8)
+        - max_videos: Cap on videos loaded from a playlist or channel
+        - state_path: Sync state file; videos already ingested from a playlist
+          or channel are skipped on later runs
+        """
         super().__init__(config)
         self.config = config or {}
         self.transcript_api = None
         self.youtube = None
+        self.max_workers = self.config.get("max_workers", 8)
+        self.max_videos = self.config.get("max_videos")
+
+        state_path = self.config.get("state_path")
+        self.state = SyncStateStore(state_path) if state_path else None
         self._initialize_apis()
 
     def _initialize_apis(self) -> None:
@@ -49,11 +67,33 @@ class YouTubeLoader(BaseLoader):
                 "pip install google-api-python-client"
             )
 
+    def _parse_source(self, source: str) -> Tuple[str, str]:
+        """Classify a YouTube URL as a video, playlist or channel.
+
+        Returns:
+            (kind, value) where kind is "video", "playlist", "channel_id",
+            "handle" or "username"
+        """
+        parsed_url = urlparse(source)
+        if parsed_url.hostname in YOUTUBE_HOSTS:
+            path = parsed_url.path.rstrip('/')
+            query = parse_qs(parsed_url.query)
+            if path == '/playlist' and query.get('list'):
+                return "playlist", query['list'][0]
+            parts = path.split('/')
+            if len(parts) >= 2 and parts[1].startswith('@'):
+                return "handle", parts[1]
+            if len(parts) >= 3 and parts[1] == 'channel':
+                return "channel_id", parts[2]
+            if len(parts) >= 3 and parts[1] in ('c', 'user'):
+                return "username", parts[2]
+        return "video", self._extract_video_id(source)
+
     def _extract_video_id(self, url: str) -> str:
         """Extract video ID from various YouTube URL formats."""
         try:
             parsed_url = urlparse(url)
-            if parsed_url.hostname in ('www.youtube.com', 'youtube.com'):
+            if parsed_url.hostname in YOUTUBE_HOSTS:
                 if parsed_url.path == '/watch':
                     video_id = parse_qs(parsed_url.query).get('v', [None])[0]
                     if video_id:
@@ -84,6 +124,86 @@ class YouTubeLoader(BaseLoader):
             logger.warning(f"Could not get transcript for video {video_id}: {str(e)}")
             return ""
 
+    @staticmethod
+    def _video_metadata(video: Dict[str, Any]) -> Dict[str, Any]:
+        """Extract all available metadata from a videos().list item."""
+        snippet = video['snippet']
+        return {
+            "title": snippet.get('title', ''),
+            "description": snippet.get('description', ''),
+            "published_at": snippet.get('publishedAt', ''),
+            "channel_title": snippet.get('channelTitle', ''),
+            "channel_id": snippet.get('channelId', ''),
+            "duration": video.get('contentDetails', {}).get('duration', ''),
+            "view_count": video.get('statistics', {}).get('viewCount', '0'),
+            "like_count": video.get('statistics', {}).get('likeCount', '0'),
+            "comment_count": video.get('statistics', {}).get('commentCount', '0'),
+            "tags": snippet.get('tags', []),
+            "category_id": snippet.get('categoryId', '')
+        }
+
+    def _get_videos_details(self, video_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Get metadata for up to 50 videos in one videos().list call.
+
+        Private or deleted videos are missing from the result.
+        """
+        response = self.youtube.videos().list(
+            part='snippet,contentDetails,statistics',
+            id=','.join(video_ids),
+            maxResults=MAX_PAGE_SIZE
+        ).execute()
+        return {
+            video['id']: self._video_metadata(video)
+            for video in response.get('items', [])
+        }
+
+    def _get_uploads_playlist(self, kind: str, value: str) -> Tuple[str, str]:
+        """Resolve a channel reference to its uploads playlist ID and channel title."""
+        lookups = {
+            "channel_id": [{"id": value}],
+            "handle": [{"forHandle": value}],
+            # Legacy /c/ and /user/ names are often also the channel handle
+            "username": [{"forHandle": f"@{value}"}, {"forUsername": value}],
+        }[kind]
+
+        for lookup in lookups:
+            response = self.youtube.channels().list(
+                part='snippet,contentDetails', **lookup
+            ).execute()
+            if response.get('items'):
+                channel = response['items'][0]
+                return (
+                    channel['contentDetails']['relatedPlaylists']['uploads'],
+                    channel['snippet'].get('title', '')
+                )
+
+        if kind == "username":
+            # Custom URLs have no direct lookup; search costs 100 quota units
+            logger.warning(f"Falling back to channel search for: {value}")
+            response = self.youtube.search().list(
+                part='snippet', q=value, type='channel', maxResults=1
+            ).execute()
+            if response.get('items'):
+                return self._get_uploads_playlist("channel_id", response['items'][0]['snippet']['channelId'])
+
+        raise ValueError(f"Channel not found: {value}")
+
+    def _iter_playlist_video_ids(self, playlist_id: str) -> Iterator[str]:
+        """Yield the video IDs of a playlist, following page tokens."""
+        page_token = None
+        while True:
+            response = self.youtube.playlistItems().list(
+                part='contentDetails',
+                playlistId=playlist_id,
+                maxResults=MAX_PAGE_SIZE,
+                pageToken=page_token
+            ).execute()
+            for item in response.get('items', []):
+                yield item['contentDetails']['videoId']
+            page_token = response.get('nextPageToken')
+            if not page_token:
+                return
+
     def _get_video_details(self, video_id: str) -> Dict[str, Any]:
         """Get detailed information about a video."""
         if not self.youtube:
@@ -101,88 +221,155 @@ class YouTubeLoader(BaseLoader):
                 logger.error(f"No video found with ID: {video_id}")
                 raise ValueError(f"Video not found: {video_id}")
 
-            video = response['items'][0]
-            snippet = video['snippet']
-
-            # Extract all available metadata
-            metadata = {
-                "title": snippet.get('title', ''),
-                "description": snippet.get('description', ''),
-                "published_at": snippet.get('publishedAt', ''),
-                "channel_title": snippet.get('channelTitle', ''),
-                "channel_id": snippet.get('channelId', ''),
-                "duration": video.get('contentDetails', {}).get('duration', ''),
-                "view_count": video.get('statistics', {}).get('viewCount', '0'),
-                "like_count": video.get('statistics', {}).get('likeCount', '0'),
-                "comment_count": video.get('statistics', {}).get('commentCount', '0'),
-                "tags": snippet.get('tags', []),
-                "category_id": snippet.get('categoryId', '')
-            }
-            return metadata
+            return self._video_metadata(response['items'][0])
         except Exception as e:
             logger.error(f"Error getting video details: {str(e)}")
             raise ValueError(f"Failed to get video details: {str(e)}")
 
+    def _build_document(self, source: str, video_id: str, video_data: Dict[str, Any], transcript: str) -> Dict[str, Any]:
+        """Format a video and its transcript as a document."""
+        # Format content in a structured way for better RAG performance
+        content_parts = [
+            f"# {video_data['title']}",
+            f"\nChannel: {video_data['channel_title']}",
+            f"\nDescription: {video_data['description']}"
+        ]
+
+        # Add tags if available
+        if video_data.get('tags'):
+            content_parts.append(f"\nTags: {', '.join(video_data['tags'])}")
+
+        # Add transcript with proper sectioning
+        if transcript:
+            content_parts.extend(["\n## Transcript", transcript])
+        else:
+            content_parts.append("\nNo transcript available")
+
+        content = "\n".join(content_parts)
+
+        # Generate document ID
+        doc_id = hashlib.sha256(
+            f"{video_id}-{video_data['published_at']}".encode()
+        ).hexdigest()[:16]
+
+        # Create comprehensive metadata
+        metadata = {
+            "doc_id": doc_id,
+            "source": source,
+            "type": "youtube",
+            "video_id": video_id,
+            "content_type": "video/transcript",
+            "has_transcript": bool(transcript),
+            **video_data
+        }
+
+        return {
+            # A stable name lets a re-loaded video replace its own chunks
+            "name": video_id,
+            "content": content,
+            "meta_data": metadata
+        }
+
+    def _iter_collection(self, source: str, playlist_id: str) -> Iterator[Dict[str, Any]]:
+        """Yield every video of a playlist, 50 videos per metadata call.
+
+        Transcripts of each batch are fetched concurrently. With a state file,
+        videos ingested by an earlier run are skipped before any call is made.
+        Videos without a transcript are not recorded, so later runs retry them.
+        """
+        state_key = f"playlist:{playlist_id}"
+        ingested = set(self.state.get(state_key, [])) if self.state else set()
+        video_ids = (vid for vid in self._iter_playlist_video_ids(playlist_id) if vid not in ingested)
+
+        loaded = 0
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                while True:
+                    batch_size = MAX_PAGE_SIZE
+                    if self.max_videos is not None:
+                        batch_size = min(batch_size, self.max_videos - loaded)
+                    batch = [vid for _, vid in zip(range(batch_size), video_ids)]
+                    if not batch:
+                        return
+
+                    details = self._get_videos_details(batch)
+                    batch = [vid for vid in batch if vid in details]
+                    transcripts = executor.map(self._get_video_transcript, batch)
+                    for video_id, transcript in zip(batch, transcripts):
+                        yield self._build_document(
+                            f"https://www.youtube.com/watch?v={video_id}",
+                            video_id,
+                            {**details[video_id], "collection_source": source},
+                            transcript
+                        )
+                        if transcript:
+                            ingested.add(video_id)
+                        loaded += 1
+        finally:
+            if self.state:
+                self.state.set(state_key, sorted(ingested))
+
+    def lazy_load(self, source: str) -> Iterator[Dict[str, Any]]:
+        """Yield one document per video of a video, playlist or channel URL.
+
+        Args:
+            source: YouTube video, playlist (``/playlist?list=``) or channel
+                (``/@handle``, ``/channel/<id>``, ``/c/<name>``, ``/user/<name>``) URL
+        """
+        try:
+            kind, value = self._parse_source(source)
+        except ValueError as e:
+            raise ValueError(f"Failed to load YouTube content: {str(e)}")
+
+        if kind == "video":
+            yield self.load(source)
+            return
+
+        try:
+            if kind == "playlist":
+                playlist_id = value
+            else:
+                playlist_id, channel_title = self._get_uploads_playlist(kind, value)
+                logger.info(f"Loading uploads of channel: {channel_title}")
+            yield from self._iter_collection(source, playlist_id)
+        except Exception as e:
+            logger.error(f"Error loading YouTube content: {str(e)}")
+            raise ValueError(f"Failed to load YouTube content: {str(e)}")
+
     def load(self, source: str) -> Dict[str, Any]:
-        """Load content from YouTube video.
+        """Load content from YouTube video, playlist or channel.
 
         Args:
-            source: YouTube video URL or ID
+            source: YouTube video, playlist or channel URL
 
         Returns:
             Dict containing:
                 - content: The video content (title, description, transcript)
                 - meta_data: Video metadata (views, likes, etc.)
+            or, for playlists and channels, the document ID and one entry per video
         """
         try:
             logger.info(f"Loading YouTube content from: {source}")
-            video_id = self._extract_video_id(source)
+            kind, video_id = self._parse_source(source)
+            if kind != "video":
+                data = list(self.lazy_load(source))
+                doc_id = hashlib.sha256(
+                    (source + "".join(item["meta_data"]["video_id"] for item in data)).encode()
+                ).hexdigest()[:16]
+                return {
+                    "doc_id": doc_id,
+                    "data": data
+                }
+
             logger.info(f"Extracted video ID: {video_id}")
 
             # Get video details and transcript
             video_data = self._get_video_details(video_id)
             transcript = self._get_video_transcript(video_id)
 
-            # Format content in a structured way for better RAG performance
-            content_parts = [
-                f"# {video_data['title']}",
-                f"\nChannel: {video_data['channel_title']}",
-                f"\nDescription: {video_data['description']}"
-            ]
-
-            # Add tags if available
-            if video_data.get('tags'):
-                content_parts.append(f"\nTags: {', '.join(video_data['tags'])}")
-
-            # Add transcript with proper sectioning
-            if transcript:
-                content_parts.extend(["\n## Transcript", transcript])
-            else:
-                content_parts.append("\nNo transcript available")
-
-            content = "\n".join(content_parts)
-
-            # Generate document ID
-            doc_id = hashlib.sha256(
-                f"{video_id}-{video_data['published_at']}".encode()
-            ).hexdigest()[:16]
-
-            # Create comprehensive metadata
-            metadata = {
-                "doc_id": doc_id,
-                "source": source,
-                "type": "youtube",
-                "video_id": video_id,
-                "content_type": "video/transcript",
-                "has_transcript": bool(transcript),
-                **video_data
-            }
-
+            document = self._build_document(source, video_id, video_data, transcript)
             logger.info(f"Successfully loaded YouTube content for video: {video_id}")
-            return {
-                "content": content,
-                "meta_data": metadata
-            }
+            return document
 
         except Exception as e:
             logger.error(f"Error loading YouTube content: {str(e)}")
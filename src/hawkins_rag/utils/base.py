@@ -1,6 +1,6 @@
 """Base classes for the hawkins_rag package."""
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterator, Optional
 
 class BaseLoader(ABC):
     """Base class for all document loaders."""
@@ -22,3 +22,22 @@ class BaseLoader(ABC):
                 - meta_data: Dictionary of metadata about the content
         """
         pass
+
+    def lazy_load(self, source: str) -> Iterator[Dict[str, Any]]:
+        """Yield document units from source one at a time.
+
+        Loaders that can stream override this so large sources are never
+        held in memory at once. The default wraps ``load``; results in the
+        ``{"doc_id", "data": [...]}`` shape yield one unit per ``data`` entry.
+
+        Args:
+            source: Path or URL to load data from
+
+        Yields:
+            Dicts containing content and meta_data
+        """
+        result = self.load(source)
+        if isinstance(result, dict) and "data" in result:
+            yield from result["data"]
+        else:
+            yield result
@@ -45,7 +45,9 @@ def register_loader(source_type: str, loader_module: str) -> None:
                 'audio': 'AudioLoader',
                 'qna': 'QnALoader',
                 'slack': 'SlackLoader',
-                'directory': 'DirectoryLoader'
+                'directory': 'DirectoryLoader',
+                'postgresql': 'PostgreSQLLoader',
+                'mysql': 'MySQLLoader'
             }
 
             class_name = class_name_map.get(source_type.lower())
@@ -96,4 +98,6 @@ register_loader('gdrive', 'googledrive')
 register_loader('audio', 'audio')
 register_loader('qna', 'qna_loader')
 register_loader('directory', 'directory')
-register_loader('slack', 'slack_loader')
\ No newline at end of file
+register_loader('slack', 'slack_loader')
+register_loader('postgresql', 'postgresql_loader')
+register_loader('mysql', 'mysql_loader')
\ No newline at end of file
@@ -0,0 +1,30 @@
+"""Thread-safe request pacing for API loaders."""
+import time
+import threading
+
+class RateLimiter:
+    """Space calls evenly so that at most ``rate`` happen per second.
+
+    A single instance is shared by every worker thread of a loader, so the
+    budget applies to the loader as a whole rather than to each thread.
+    """
+
+    def __init__(self, rate: float):
+        """Initialize limiter with the allowed number of calls per second."""
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def wait(self) -> None:
+        """Block until the caller may issue its next request."""
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(self._next_slot, now)
+            self._next_slot = slot + self.interval
+        delay = slot - now
+        if delay > 0:
+            time.sleep(delay)
+
+__all__ = ['RateLimiter']
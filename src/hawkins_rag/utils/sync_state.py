@@ -0,0 +1,73 @@
+"""Persistent sync state for incremental loaders."""
+import json
+import os
+import threading
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+class SyncStateStore:
+    """Small JSON-backed key/value store for loader sync state.
+
+    Loaders use it to remember cursors, watermarks and ingested item ids
+    between runs. Every ``set`` is flushed to disk through an atomic rename so
+    an interrupted run never leaves a half-written state file behind.
+    """
+
+    def __init__(self, path: str):
+        """Initialize the store, loading any existing state from ``path``."""
+        self.path = path
+        self._lock = threading.Lock()
+        self._state: Dict[str, Any] = {}
+
+        if os.path.exists(path):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    self._state = json.load(f)
+            except (OSError, json.JSONDecodeError) as e:
+                logger.warning(f"Ignoring unreadable sync state at {path}: {str(e)}")
+                self._state = {}
+
+    def get(self, key: str, default: Optional[Any] = None) -> Any:
+        """Return the stored value for ``key`` or ``default``."""
+        with self._lock:
+            return self._state.get(key, default)
+
+    def set(self, key: str, value: Any) -> None:
+        """Store ``value`` under ``key`` and persist the state file."""
+        with self._lock:
+            self._state[key] = value
+            self._flush()
+
+    def delete(self, key: str) -> None:
+        """Remove ``key`` from the store if present."""
+        with self._lock:
+            if self._state.pop(key, None) is not None:
+                self._flush()
+
+    def _flush(self) -> None:
+        """Write state to disk atomically."""
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self._state, f)
+        os.replace(tmp_path, self.path)
+
+def query_timestamp(watermark: str, overlap_minutes: int = 0) -> str:
+    """Format an ISO-8601 watermark for CQL/JQL date filters.
+
+    Both query languages only accept minute precision ("yyyy/MM/dd HH:mm")
+    and interpret it in the user's time zone, so the watermark is shifted
+    back by ``overlap_minutes``; callers drop already-seen items by version.
+    """
+    moment = datetime.fromisoformat(watermark)
+    if moment.tzinfo is not None:
+        moment = moment.astimezone(timezone.utc)
+    moment -= timedelta(minutes=overlap_minutes)
+    return moment.strftime("%Y/%m/%d %H:%M")
+
+__all__ = ['SyncStateStore', 'query_timestamp']
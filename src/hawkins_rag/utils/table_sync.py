@@ -0,0 +1,257 @@
+"""Watermark-based incremental table sync shared by the SQL loaders."""
+import re
+import hashlib
+from abc import abstractmethod
+from datetime import date, datetime
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+from .base import BaseLoader
+from .sync_state import SyncStateStore
+
+TABLE_SOURCE_PREFIX = "table:"
+
+# Identifiers are interpolated into SQL, so only plain (optionally schema-qualified) names pass
+_IDENTIFIER = re.compile(r"^[A-Za-z_][A-Za-z0-9_$]*(\.[A-Za-z_][A-Za-z0-9_$]*)?$")
+
+def validate_identifier(name: str) -> str:
+    """Return ``name`` if it is a safe SQL identifier, raise ValueError otherwise."""
+    if not isinstance(name, str) or not _IDENTIFIER.match(name):
+        raise ValueError(f"Invalid SQL identifier: {name!r}")
+    return name
+
+def _encode_value(value: Any) -> Any:
+    """Make a key value JSON serializable for the state file."""
+    if isinstance(value, datetime):
+        return {"datetime": value.isoformat()}
+    if isinstance(value, date):
+        return {"date": value.isoformat()}
+    if isinstance(value, (int, float, str)) or value is None:
+        return value
+    return str(value)
+
+def _decode_value(value: Any) -> Any:
+    """Reverse ``_encode_value``."""
+    if isinstance(value, dict):
+        if "datetime" in value:
+            return datetime.fromisoformat(value["datetime"])
+        if "date" in value:
+            return date.fromisoformat(value["date"])
+    return value
+
+def keyset_query(
+    table: str,
+    primary_key: str,
+    change_column: str,
+    limit: int,
+    after: Optional[Tuple[Any, Any]] = None,
+    columns: Sequence[str] = ("*",)
+) -> Tuple[str, Tuple[Any, ...]]:
+    """Build one keyset-paginated batch query ordered by (change column, primary key).
+
+    Rows whose change column is NULL are excluded: NULL never compares
+    greater than a watermark, and PostgreSQL and MySQL sort it at opposite
+    ends, so such rows would stall the sync. Placeholders use the ``%s``
+    paramstyle shared by psycopg2 and mysql.connector.
+    """
+    select = ", ".join(columns)
+    query = f"SELECT {select} FROM {table} WHERE {change_column} IS NOT NULL"
+    params: Tuple[Any, ...] = ()
+    if after is not None:
+        query += f" AND ({change_column}, {primary_key}) > (%s, %s)"
+        params = after
+    query += f" ORDER BY {change_column}, {primary_key} LIMIT {int(limit)}"
+    return query, params
+
+def iter_table_changes(
+    fetch: Callable[[str, Tuple[Any, ...]], List[Dict[str, Any]]],
+    table: str,
+    primary_key: str,
+    change_column: str,
+    batch_size: int,
+    state: Optional[SyncStateStore] = None,
+    columns: Sequence[str] = ("*",)
+) -> Iterator[Dict[str, Any]]:
+    """Yield rows whose (change column, primary key) is past the stored watermark.
+
+    Rows are read in keyset-paginated batches; rows with a NULL change
+    column are never returned. The watermark is persisted
+    only after every row of a batch has been consumed, so an interrupted
+    sync resumes at the first batch that was not fully ingested. Without a
+    state store the whole table is scanned, still one batch at a time.
+
+    Args:
+        fetch: Callable running a query with parameters and returning row dicts
+        table: Table to sync
+        primary_key: Unique key column, used as the keyset tie-breaker
+        change_column: Monotonic column such as ``updated_at`` or an id
+        batch_size: Rows per batch query
+        state: Store holding the watermark under ``table:<table>``
+        columns: Columns to select; must include the key and change columns
+    """
+    for name in (table, primary_key, change_column):
+        validate_identifier(name)
+    for name in columns:
+        if name != "*":
+            validate_identifier(name)
+
+    state_key = f"table:{table}"
+    watermark = state.get(state_key) if state else None
+    after = tuple(_decode_value(v) for v in watermark) if watermark else None
+
+    while True:
+        query, params = keyset_query(table, primary_key, change_column, batch_size, after, columns)
+        rows = fetch(query, params)
+        if not rows:
+            return
+
+        yield from rows
+
+        last = rows[-1]
+        after = (last[change_column], last[primary_key])
+        if None in after:
+            raise ValueError(f"NULL {change_column} or {primary_key} in table {table}; cannot store watermark")
+        if state:
+            state.set(state_key, [_encode_value(v) for v in after])
+
+        if len(rows) < batch_size:
+            return
+
+def format_row(row: Dict[str, Any]) -> str:
+    """Format a row as "column: value" lines."""
+    return "\n".join(f"{k}: {v}" for k, v in row.items())
+
+class SQLTableLoader(BaseLoader):
+    """Query streaming and "table:<name>" sync shared by the SQL loaders.
+
+    Subclasses provide the driver-specific ``_iter_batches`` and
+    ``_fetch_rows`` and set ``self.config`` before calling
+    ``_init_table_sync``.
+    """
+
+    def _init_table_sync(self) -> None:
+        """Read the batching and table sync options from ``self.config``."""
+        self.batch_size = self.config.get("batch_size", 1000)
+        self.primary_key = self.config.get("primary_key", "id")
+        self.change_column = self.config.get("change_column", "updated_at")
+
+        state_path = self.config.get("state_path")
+        self.state = SyncStateStore(state_path) if state_path else None
+
+    @abstractmethod
+    def _iter_batches(self, query: str) -> Iterator[List[Dict[str, Any]]]:
+        """Stream the results of a query in batches of ``batch_size`` rows."""
+
+    @abstractmethod
+    def _fetch_rows(self, query: str, params: Tuple[Any, ...] = ()) -> List[Dict[str, Any]]:
+        """Run a bounded query and return all of its rows."""
+
+    @staticmethod
+    def _table_name(source: str) -> Optional[str]:
+        """Return the table of a "table:<name>" source, or None for a query."""
+        if source.startswith(TABLE_SOURCE_PREFIX):
+            return source[len(TABLE_SOURCE_PREFIX):].strip()
+        return None
+
+    def _load_table(self, table: str) -> Iterator[Dict[str, Any]]:
+        """Yield one document per row changed since the table's watermark.
+
+        Each document carries a stable ``name`` built from the primary key,
+        so a row that changes again is stored under the same entity names.
+        """
+        rows = iter_table_changes(
+            self._fetch_rows,
+            table,
+            self.primary_key,
+            self.change_column,
+            self.batch_size,
+            self.state
+        )
+        for row in rows:
+            key = row[self.primary_key]
+            content = format_row(row)
+            yield {
+                "name": f"{table}_{key}",
+                "content": content,
+                "meta_data": {
+                    "table": table,
+                    "database": self.config["database"],
+                    "primary_key": str(key),
+                    "changed_at": str(row[self.change_column]),
+                    "content_hash": hashlib.sha256(content.encode()).hexdigest()
+                }
+            }
+
+    def _load_table_result(self, source: str) -> Dict[str, Any]:
+        """Collect a table sync into the ``{"doc_id", "data"}`` result shape."""
+        data = list(self._load_table(self._table_name(source)))
+        doc_id = hashlib.sha256(
+            (source + "".join(item["meta_data"]["content_hash"] for item in data)).encode()
+        ).hexdigest()
+        return {
+            "doc_id": doc_id,
+            "data": data
+        }
+
+    def _load_query_result(self, source: str) -> Dict[str, Any]:
+        """Collect a query into one document per row.
+
+        Each row carries its own ``content_hash``, and the document ID is
+        built from those hashes as rows stream in.
+        """
+        data = []
+        doc_hash = hashlib.sha256(source.encode())
+        meta_data = {
+            "query": source,
+            "database": self.config["database"]
+        }
+
+        for rows in self._iter_batches(source):
+            for row in rows:
+                content = format_row(row)
+                content_hash = hashlib.sha256(content.encode()).hexdigest()
+                doc_hash.update(content_hash.encode())
+                data.append({
+                    "content": content,
+                    "meta_data": {**meta_data, "content_hash": content_hash}
+                })
+
+        if not data:
+            raise ValueError("Query returned no results")
+
+        return {
+            "doc_id": doc_hash.hexdigest(),
+            "data": data,
+            "meta_data": {**meta_data, "row_count": len(data)}
+        }
+
+    def lazy_load(self, source: str) -> Iterator[Dict[str, Any]]:
+        """Stream a query as one document per batch of rows.
+
+        Memory use is bounded by ``batch_size`` regardless of result size.
+        A "table:<name>" source syncs that table instead, yielding only rows
+        past the stored watermark, one document per row.
+
+        Args:
+            source: SQL query to execute, or "table:<name>"
+        """
+        table = self._table_name(source)
+        if table is not None:
+            yield from self._load_table(table)
+            return
+
+        found = False
+        for batch_index, rows in enumerate(self._iter_batches(source)):
+            found = True
+            yield {
+                "content": "\n\n".join(format_row(row) for row in rows),
+                "meta_data": {
+                    "query": source,
+                    "database": self.config["database"],
+                    "batch_index": batch_index,
+                    "row_count": len(rows)
+                }
+            }
+
+        if not found:
+            raise ValueError("Query returned no results")
+
+__all__ = ['validate_identifier', 'keyset_query', 'iter_table_changes', 'format_row', 'SQLTableLoader']
@@ -0,0 +1,172 @@
+"""Encoding detection and decoding helpers for text loaders."""
+import codecs
+import logging
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Tried in order when a file has no BOM. cp1252 comes before latin-1, which
+# decodes any byte sequence and therefore has to be the last resort.
+DEFAULT_ENCODINGS = ['utf-8', 'cp1252', 'latin-1']
+
+# Bytes read per step in streaming mode
+BLOCK_SIZE = 1024 * 1024
+
+# UTF-32 BOMs must be checked before UTF-16, whose LE BOM is their prefix
+_BOMS = [
+    (codecs.BOM_UTF32_LE, 'utf-32'),
+    (codecs.BOM_UTF32_BE, 'utf-32'),
+    (codecs.BOM_UTF8, 'utf-8-sig'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16'),
+]
+
+def _bom_encoding(data: bytes) -> Optional[str]:
+    """Return the encoding named by a leading byte order mark, if any."""
+    for bom, encoding in _BOMS:
+        if data.startswith(bom):
+            return encoding
+    return None
+
+def _normalize_newlines(text: str) -> str:
+    """Translate \r\n and \r to \n, as reading in text mode does."""
+    if "\r" not in text:
+        return text
+    return text.replace("\r\n", "\n").replace("\r", "\n")
+
+def decode_bytes(data: bytes, encodings: Sequence[str] = DEFAULT_ENCODINGS) -> Tuple[str, str]:
+    """Decode a whole file held in memory, with newlines normalized to \n.
+
+    Returns:
+        Tuple of (text, encoding used)
+
+    Raises:
+        ValueError: If none of the encodings can decode the data
+    """
+    bom_encoding = _bom_encoding(data)
+    if bom_encoding:
+        return _normalize_newlines(data.decode(bom_encoding)), bom_encoding
+
+    errors = []
+    for encoding in encodings:
+        try:
+            return _normalize_newlines(data.decode(encoding)), encoding
+        except UnicodeDecodeError as e:
+            errors.append(f"Failed with {encoding}: {str(e)}")
+    raise ValueError(
+        f"Unable to decode file with supported encodings: {list(encodings)}\n" + "\n".join(errors)
+    )
+
+def _start_decoder(data: bytes, encodings: Sequence[str]) -> Tuple[codecs.IncrementalDecoder, str, str]:
+    """Find the first encoding that decodes ``data`` as a (possibly partial) prefix.
+
+    Returns:
+        Tuple of (decoder, encoding, decoded text)
+    """
+    bom_encoding = _bom_encoding(data)
+    candidates: List[str] = [bom_encoding] if bom_encoding else list(encodings)
+    for encoding in candidates:
+        decoder = codecs.getincrementaldecoder(encoding)()
+        try:
+            return decoder, encoding, decoder.decode(data)
+        except UnicodeDecodeError:
+            continue
+    raise ValueError(f"Unable to decode file with supported encodings: {list(encodings)}")
+
+def iter_decoded_blocks(
+    stream: BinaryIO,
+    encodings: Sequence[str] = DEFAULT_ENCODINGS,
+    block_size: int = BLOCK_SIZE
+) -> Iterator[Tuple[str, str]]:
+    """Decode a binary stream block by block.
+
+    Blocks end on a line break where possible, so lines are never split
+    across blocks, and newlines are normalized to \n. The encoding is
+    detected from the first block; if a later block fails to decode,
+    decoding switches to the next encoding that works.
+
+    Yields:
+        Tuples of (text, encoding used)
+    """
+    # The first read must be long enough to hold any BOM
+    data = stream.read(max(block_size, 4))
+    if not data:
+        return
+
+    decoder, encoding, text = _start_decoder(data, encodings)
+    carry = ""
+    while True:
+        data = stream.read(block_size)
+        final = not data
+        if final:
+            text += decoder.decode(b"", True)
+        if carry:
+            text = carry + text
+            carry = ""
+
+        if not final:
+            # Hold back a trailing partial line for the next block
+            cut = text.rfind("\n") + 1
+            if 0 < cut < len(text):
+                text, carry = text[:cut], text[cut:]
+            elif text.endswith("\r"):
+                # The matching \n may start the next block
+                text, carry = text[:-1], "\r"
+        if text:
+            yield _normalize_newlines(text), encoding
+        if final:
+            return
+
+        try:
+            text = decoder.decode(data)
+        except UnicodeDecodeError:
+            # Bytes still buffered from the previous block belong to this one
+            pending = decoder.getstate()[0] + data
+            fallbacks = list(encodings)
+            if encoding in fallbacks:
+                fallbacks = fallbacks[fallbacks.index(encoding) + 1:]
+            decoder, new_encoding, text = _start_decoder(pending, fallbacks)
+            logger.warning(f"Text is not valid {encoding} past the first block, switching to {new_encoding}")
+            encoding = new_encoding
+
+def iter_text_units(
+    source: str,
+    encodings: Sequence[str] = DEFAULT_ENCODINGS,
+    block_size: int = BLOCK_SIZE
+) -> Iterator[Dict[str, Any]]:
+    """Yield a text file as one document unit per non-blank decoded block.
+
+    Shared by the text loaders so streamed units carry the same metadata,
+    including the 1-based line each block starts at.
+
+    Raises:
+        ValueError: If the file does not exist or cannot be decoded
+    """
+    path = Path(source)
+    if not path.exists():
+        raise ValueError(f"Text file not found: {source}")
+
+    stat = path.stat()
+    line_start = 1
+    block_index = 0
+    with open(path, 'rb') as f:
+        for content, encoding in iter_decoded_blocks(f, encodings, block_size):
+            line_count = content.count("\n")
+            if content.strip():
+                yield {
+                    "content": content,
+                    "meta_data": {
+                        "source": source,
+                        "type": "text",
+                        "file_path": str(path),
+                        "file_size": stat.st_size,
+                        "encoding": encoding,
+                        "modified_time": stat.st_mtime,
+                        "block_index": block_index,
+                        "line_start": line_start,
+                        "line_count": line_count
+                    }
+                }
+                block_index += 1
+            line_start += line_count